@@ -0,0 +1,93 @@
+"""Startup benchmark: import time of the chore helper runtime modules.
+
+Imports the integration and its sensor platform in a fresh interpreter with
+``python -X importtime``, after the Home Assistant core modules any
+integration gets for free, and reports the self and cumulative import time
+of the chore helper modules. Also reports whether the import pulled in the
+config flow, the selector helper or the calendar platform, which the
+runtime path only loads when needed.
+
+Run from the repository root:
+
+    python benchmarks/import_time.py
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = "custom_components.chore_helper"
+
+# Loaded by Home Assistant before any integration is set up
+PRELOAD = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.restore_state",
+    "homeassistant.helpers.storage",
+)
+IMPORTS = (PACKAGE, f"{PACKAGE}.sensor")
+WATCHED = (
+    f"{PACKAGE}.config_flow",
+    f"{PACKAGE}.calendar",
+    "homeassistant.helpers.selector",
+    "homeassistant.components.calendar",
+)
+RUNS = 5
+
+
+def _import_times() -> tuple[dict[str, tuple[int, int]], set[str]]:
+    """Return the import times of each module, and the modules newly imported.
+
+    Import times are the self and cumulative microseconds of the module.
+    """
+    code = "; ".join(f"import {module}" for module in PRELOAD)
+    code += "; import sys; preloaded = set(sys.modules); "
+    code += "; ".join(f"import {module}" for module in IMPORTS)
+    code += "; print(*sorted(set(sys.modules) - preloaded))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times, set(result.stdout.split())
+
+
+def main() -> None:
+    """Run the benchmark."""
+    runs = [_import_times() for _ in range(RUNS)]
+    imported = runs[0][1]
+    modules = sorted(
+        name for name in imported if name == PACKAGE or name.startswith(f"{PACKAGE}.")
+    )
+
+    print(f"Import {', '.join(IMPORTS)} (best of {RUNS})")  # noqa: T201
+    print(f"{'module':<45} {'self us':>10} {'cumulative us':>14}")  # noqa: T201
+    for name in modules:
+        self_us = min(times[name][0] for times, _ in runs)
+        cumulative_us = min(times[name][1] for times, _ in runs)
+        print(f"{name:<45} {self_us:>10} {cumulative_us:>14}")  # noqa: T201
+    total = min(times[PACKAGE][1] for times, _ in runs)
+    print(f"{'total':<45} {'':>10} {total:>14}")  # noqa: T201
+    print(f"{'modules imported':<45} {len(imported):>25}")  # noqa: T201
+    for name in WATCHED:
+        loaded = "imported" if name in imported else "not imported"
+        print(f"{name:<45} {loaded:>25}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
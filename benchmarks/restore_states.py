@@ -0,0 +1,96 @@
+"""Startup benchmark: restore the last states of 1,000 chores.
+
+Times Chore.restore_state with the ISO fast path of helpers.parse_datetime,
+and with the general-purpose dateutil parser it replaces, and reports the
+time per entity.
+
+Run from the repository root:
+
+    python benchmarks/restore_states.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from dateutil.parser import parse
+from homeassistant.core import State
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# pylint: disable=wrong-import-position
+from custom_components.chore_helper import const, helpers  # noqa: E402
+from custom_components.chore_helper.chore_daily import DailyChore  # noqa: E402
+
+ENTITIES = 1000
+NUMBER = 5
+
+
+def _dateutil_parse_datetime(text: str) -> datetime | None:
+    """Parse text the way restore did before the ISO fast path."""
+    try:
+        return parse(text)
+    except (ValueError, TypeError):
+        return None
+
+
+def _states() -> list[tuple[DailyChore, State]]:
+    """Build chores and their last states, as stored by the restore state helper."""
+    today = date(2024, 3, 5)
+    completed = datetime(2024, 3, 1, 8, 0, tzinfo=timezone(timedelta(hours=1)))
+    states = []
+    for i in range(ENTITIES):
+        chore = DailyChore(
+            SimpleNamespace(
+                title=f"chore {i}",
+                options={"frequency": "every-n-days", "period": i % 7 + 1},
+                data={},
+            )
+        )
+        attributes = {
+            const.ATTR_NEXT_DATE: (today + timedelta(days=i % 30)).isoformat(),
+            const.ATTR_LAST_COMPLETED: (completed + timedelta(minutes=i)).isoformat(),
+            const.ATTR_OVERDUE: False,
+            const.ATTR_OVERDUE_DAYS: 0,
+            const.ATTR_ADD_DATES: "2024-04-01 2024-05-01" if i % 10 == 0 else None,
+            const.ATTR_REMOVE_DATES: None,
+            const.ATTR_OFFSET_DATES: "2024-04-02:1" if i % 20 == 0 else None,
+            "occurrence_count": i,
+        }
+        states.append((chore, State(f"sensor.chore_{i}", str(i % 30), attributes)))
+    return states
+
+
+def _restore(states: list[tuple[DailyChore, State]]) -> None:
+    """Restore all chores."""
+    for chore, state in states:
+        chore.restore_state(state)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    states = _states()
+    _restore(states)
+    fast = [(chore.last_completed, chore.next_due_date) for chore, _ in states]
+    with patch.object(helpers, "parse_datetime", _dateutil_parse_datetime):
+        _restore(states)
+        legacy = timeit.timeit(lambda: _restore(states), number=NUMBER)
+    assert fast == [(chore.last_completed, chore.next_due_date) for chore, _ in states]
+    iso = timeit.timeit(lambda: _restore(states), number=NUMBER)
+
+    print(f"Restore {ENTITIES} chore states ({NUMBER} runs)")  # noqa: T201
+    for label, seconds in (("dateutil", legacy), ("ISO fast path", iso)):
+        print(  # noqa: T201
+            f"{label:<20} {seconds / NUMBER * 1e3:10.3f} ms total"
+            f" {seconds / NUMBER / ENTITIES * 1e6:10.3f} us per entity"
+        )
+    print(f"{'speedup':<20} {legacy / iso:10.1f} x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
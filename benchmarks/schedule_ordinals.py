@@ -0,0 +1,127 @@
+"""Micro-benchmark: ordinal date arithmetic in the chore schedule hot path.
+
+Times the cost of a plain day offset done with relativedelta, timedelta and
+integer ordinals, then 365-date base schedules of the previous engines (the
+relativedelta and ISO week algorithms kept in tests/reference.py) next to
+the current ones on the same options, with the speedup, and the
+shared Forecast the scheduler extends. Run from the repository root:
+
+    python benchmarks/schedule_ordinals.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from dateutil.relativedelta import relativedelta
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# pylint: disable=wrong-import-position
+from custom_components.chore_helper.engine import recurrence  # noqa: E402
+from custom_components.chore_helper.engine.forecast import Forecast  # noqa: E402
+from tests.reference import (  # noqa: E402
+    PreviousDailyRecurrence,
+    PreviousMonthlyRecurrence,
+    PreviousWeeklyRecurrence,
+)
+
+FORECAST_DATES = 365
+NUMBER = 20
+NOW = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+
+PREVIOUS: dict[str, type[recurrence.Recurrence]] = {
+    "every-n-days": PreviousDailyRecurrence,
+    "every-n-weeks": PreviousWeeklyRecurrence,
+    "every-n-months": PreviousMonthlyRecurrence,
+}
+
+FORECASTS: list[tuple[str, dict[str, Any]]] = [
+    ("every-n-days, period 1", {"frequency": "every-n-days", "period": 1}),
+    ("every-n-days, period 3", {"frequency": "every-n-days", "period": 3}),
+    (
+        "every-n-weeks, period 1",
+        {"frequency": "every-n-weeks", "period": 1, "chore_day": "mon"},
+    ),
+    (
+        "every-n-weeks, period 26",
+        {"frequency": "every-n-weeks", "period": 26, "chore_day": "fri"},
+    ),
+    (
+        "every-n-months, 2nd friday",
+        {"frequency": "every-n-months", "chore_day": "fri", "weekday_order_number": 2},
+    ),
+    ("every-n-months, day 15", {"frequency": "every-n-months", "day_of_month": 15}),
+]
+
+
+def _options(options: dict[str, Any]) -> dict[str, Any]:
+    """Return the options of a forecast, with its start and length."""
+    return {"start_date": "2024-01-01", "forecast_dates": FORECAST_DATES} | options
+
+
+def _recurrence(**options: Any) -> recurrence.Recurrence:
+    """Build a recurrence from plain options, on a fixed clock."""
+    return recurrence.create(_options(options), lambda: NOW)
+
+
+def _previous(**options: Any) -> recurrence.Recurrence:
+    """Build the recurrence of the previous engine, on a fixed clock."""
+    return PREVIOUS[options["frequency"]](_options(options), lambda: NOW)
+
+
+def _report(label: str, seconds: float, per: int) -> None:
+    print(f"{label:<40} {seconds / per * 1e6:10.3f} us")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark."""
+    day = date(2024, 1, 1)
+    ordinal = day.toordinal()
+    loops = 200_000
+    print(f"Single day offset ({loops} loops)")  # noqa: T201
+    _report(
+        "date + relativedelta(days=1)",
+        timeit.timeit(lambda: day + relativedelta(days=1), number=loops),
+        loops,
+    )
+    _report(
+        "date + timedelta(days=1)",
+        timeit.timeit(lambda: day + timedelta(days=1), number=loops),
+        loops,
+    )
+    _report("ordinal + 1", timeit.timeit(lambda: ordinal + 1, number=loops), loops)
+
+    print(f"\n{FORECAST_DATES}-date base schedule ({NUMBER} runs)")  # noqa: T201
+    for label, options in FORECASTS:
+        current, previous = _recurrence(**options), _previous(**options)
+        schedule = list(current.base_candidates())
+        assert len(schedule) == FORECAST_DATES + 1
+        # Periods over ISO year ends are counted differently, see test_recurrence
+        same = schedule == list(previous.base_candidates())
+        times = [
+            timeit.timeit(lambda rec=rec: list(rec.base_candidates()), number=NUMBER)
+            for rec in (previous, current)
+        ]
+        print(label + ("" if same else " (different dates)"))  # noqa: T201
+        _report("  previous engine", times[0], NUMBER)
+        _report("  current engine", times[1], NUMBER)
+        print(f"{'  speedup':<40} {times[0] / times[1]:10.1f} x")  # noqa: T201
+
+    print(f"\n{FORECAST_DATES}-date forecast, extended to the end ({NUMBER} runs)")  # noqa: T201
+    for label, options in FORECASTS:
+        rec = _recurrence(**options)
+
+        def forecast(rec: recurrence.Recurrence = rec) -> None:
+            context = rec.snapshot()
+            Forecast(rec, rec.key(context), context).extend(None, context)
+
+        _report(label, timeit.timeit(forecast, number=NUMBER), NUMBER)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Fast-forward simulation: a year of chore life on a frozen clock.
+
+Runs the integration in the Home Assistant test harness, and moves the
+frozen clock straight from one event to the next: the local midnight
+refresh and due-time expiry the ChoreScheduler armed, and the completions
+of a script (fixed time, entity ID pairs) and/or per-chore policies telling
+when each chore is completed next. Each event fires the timers due at its
+exact time (midnight ones up to the random microsecond Home Assistant adds
+to time trackers), and the chores completed at one time go through one call
+of the complete service, so the real scheduler, schedule cache and shared
+forecasts do all the work.
+
+After every event, the due dates each chore holds are checked against a
+fresh calculation, and its written state against the next due date they
+give - for all chores, or a random sample of them in long runs. The next
+due date and overdue flag of each chore are recorded whenever they change,
+to check against expected sequences.
+
+Used by test_simulation.py, run from the repository root:
+
+    python -m pytest benchmarks/test_simulation.py --no-cov
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable, Iterable, Mapping
+from datetime import date, datetime, time, timedelta
+from typing import Any, NamedTuple
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from homeassistant.helpers.event import RANDOM_MICROSECOND_MAX
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed_exact,
+)
+
+from custom_components.chore_helper import const, helpers, scheduler
+from custom_components.chore_helper.chore import Chore
+from custom_components.chore_helper.engine.recurrence import UpdateContext
+
+# When a chore is completed, given its next due date
+Policy = Callable[[date], datetime | None]
+
+START = date(2024, 1, 1)
+
+
+class Transition(NamedTuple):
+    """Change of the next due date or overdue flag of a chore."""
+
+    time: datetime
+    next_due_date: date | None
+    overdue: bool
+
+
+def complete_when_due(days_late: int = 0, at: time = time(19)) -> Policy:
+    """Return a policy completing each chore days_late days after it is due."""
+
+    def policy(next_due_date: date) -> datetime | None:
+        return datetime.combine(
+            next_due_date + timedelta(days=days_late),
+            at,
+            tzinfo=dt_util.DEFAULT_TIME_ZONE,
+        )
+
+    return policy
+
+
+def chore_entry(name: str, options: dict[str, Any]) -> MockConfigEntry:
+    """Return the config entry of a chore (entity ID sensor.<name>)."""
+    return MockConfigEntry(
+        domain=const.DOMAIN,
+        title=name,
+        version=const.CONFIG_VERSION,
+        data={"unique_id": f"simulation_{name}"},
+        options={
+            "name": name,
+            const.CONF_START_DATE: START.isoformat(),
+            const.CONF_FORECAST_DATES: 30,
+            **options,
+        },
+    )
+
+
+class Simulation:
+    """Chores run on a frozen clock, from one scheduler event to the next."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        freezer: Any,
+        script: Iterable[tuple[datetime, str]] = (),
+        policies: Mapping[str, Policy] | None = None,
+        sample: int | None = None,
+    ) -> None:
+        """Set up an empty simulation; start it with async_start.
+
+        After each event, sample chores picked at random are checked, or all
+        of them if None; all are checked at the start and end of each run.
+        """
+        self.hass = hass
+        self.history: dict[str, list[Transition]] = {}
+        self.completions = 0
+        self.events = 0
+        self._freezer = freezer
+        self._script = sorted(script, reverse=True)
+        self._policies = policies or {}
+        # Next completion planned by the policy, by entity ID
+        self._planned: dict[str, datetime] = {}
+        self._sample = sample
+        self._random = random.Random(0)
+
+    @property
+    def chores(self) -> dict[str, Chore]:
+        """Return the chore entities, by entity ID."""
+        return self.hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+
+    @property
+    def now(self) -> datetime:
+        """Return the current (frozen) time."""
+        return dt_util.now()
+
+    async def async_start(
+        self, entries: Iterable[MockConfigEntry], start: date = START
+    ) -> None:
+        """Set up the chores at local midnight of the start date."""
+        self._freezer.move_to(dt_util.start_of_local_day(start))
+        for entry in entries:
+            entry.add_to_hass(self.hass)
+        self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+        assert await async_setup_component(self.hass, const.DOMAIN, {})
+        await self.hass.async_block_till_done()
+        self.check()
+
+    async def async_run(self, until: datetime) -> None:
+        """Run every event up to the until time, and stop the clock there."""
+        while (when := self._next_event()) <= until:
+            self.events += 1
+            await self._async_move_to(when)
+            completed = []
+            while self._script and self._script[-1][0] == when:
+                completed.append(self._script.pop()[1])
+            for entity_id, planned in list(self._planned.items()):
+                if planned == when:
+                    del self._planned[entity_id]
+                    completed.append(entity_id)
+            if completed:
+                await self._async_complete(completed)
+            self.check(self._sample)
+        await self._async_move_to(until)
+        self.check()
+
+    def _next_event(self) -> datetime:
+        """Return when the next midnight, expiry or completion happens."""
+        now = self.now
+        events = [dt_util.start_of_local_day(now.date() + timedelta(days=1))]
+        # pylint: disable-next=protected-access
+        if (expiry := self._scheduler._expiry) is not None:
+            events.append(expiry)
+        if self._script:
+            events.append(self._script[-1][0])
+        events.extend(self._planned.values())
+        return min(when for when in events if when > now)
+
+    @property
+    def _scheduler(self) -> scheduler.ChoreScheduler:
+        """Return the integration's scheduler."""
+        return self.hass.data[const.DOMAIN][const.SCHEDULER]
+
+    async def _async_move_to(self, when: datetime) -> None:
+        """Move the clock, firing the timers due by then."""
+        self._freezer.move_to(when)
+        if when == dt_util.start_of_local_day(when):
+            # Time trackers run up to RANDOM_MICROSECOND_MAX after the second
+            fire = when + timedelta(microseconds=RANDOM_MICROSECOND_MAX)
+        else:
+            fire = when
+        async_fire_time_changed_exact(self.hass, fire)
+        await self.hass.async_block_till_done()
+
+    async def _async_complete(self, entity_ids: list[str]) -> None:
+        """Complete chores now, in one call of the complete service."""
+        self.completions += len(entity_ids)
+        await self.hass.services.async_call(
+            const.DOMAIN, "complete", {"entity_id": entity_ids}, blocking=True
+        )
+        await self.hass.async_block_till_done()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Record a changed state of a chore, and plan its next completion."""
+        entity_id = event.data["entity_id"]
+        if (state := event.data["new_state"]) is None or entity_id not in self.chores:
+            return
+        next_due_date = state.attributes.get(const.ATTR_NEXT_DATE)
+        overdue = state.attributes.get(const.ATTR_OVERDUE, False)
+        history = self.history.setdefault(entity_id, [])
+        if history and (history[-1].next_due_date, history[-1].overdue) == (
+            next_due_date,
+            overdue,
+        ):
+            return
+        history.append(Transition(self.now, next_due_date, overdue))
+        if (policy := self._policies.get(entity_id)) is None:
+            return
+        when = None if next_due_date is None else policy(next_due_date)
+        if when is None or when <= self.now:
+            self._planned.pop(entity_id, None)
+        else:
+            self._planned[entity_id] = when
+
+    def check(self, sample: int | None = None) -> None:
+        """Check the chores hold, and wrote, the state of a fresh calculation.
+
+        Only checks sample chores picked at random, if given.
+        """
+        context = UpdateContext(helpers.now())
+        today = context.today.toordinal()
+        chores = list(self.chores.values())
+        if sample is not None and sample < len(chores):
+            chores = self._random.sample(chores, sample)
+        # pylint: disable-next=protected-access
+        fresh = scheduler._compute_due_dates(chores, {}, context=context)
+        for chore, (due_dates, horizon, _) in zip(chores, fresh):
+            # pylint: disable-next=protected-access
+            held, held_horizon = chore._due_dates, chore._horizon
+            until = min(horizon, held_horizon)
+            assert [x for x in held if x <= until] == [
+                x for x in due_dates if x <= until
+            ], chore.entity_id
+            start = chore.recurrence.start_date(context).toordinal()
+            upcoming = [x for x in due_dates if x >= start]
+            if upcoming and upcoming[0] == today and _done_today(chore, context):
+                upcoming.pop(0)
+            expected = date.fromordinal(upcoming[0]) if upcoming else None
+            state = self.hass.states.get(chore.entity_id)
+            assert state.attributes[const.ATTR_NEXT_DATE] == expected, chore.entity_id
+            if expected is not None:
+                days = (expected - context.today).days
+                assert state.state == str(days), chore.entity_id
+                assert state.attributes[const.ATTR_OVERDUE] == (days < 0)
+
+    def due_dates(self, entity_id: str) -> list[date]:
+        """Return the distinct next due dates the chore went through."""
+        due_dates: list[date] = []
+        for transition in self.history[entity_id]:
+            if transition.next_due_date is not None and (
+                not due_dates or due_dates[-1] != transition.next_due_date
+            ):
+                due_dates.append(transition.next_due_date)
+        return due_dates
+
+
+def _done_today(chore: Chore, context: UpdateContext) -> bool:
+    """Return whether a chore due today was completed, so it is no longer due."""
+    completed = chore.last_completed
+    return (
+        completed is not None
+        and completed.date() == context.today
+        and context.now.time() >= completed.time()
+    )
+
+
+# Options of each frequency, cycled through the simulated chores
+FREQUENCY_OPTIONS: list[dict[str, Any]] = [
+    {const.CONF_FREQUENCY: "every-n-days", const.CONF_PERIOD: 3},
+    {const.CONF_FREQUENCY: "after-n-days", const.CONF_PERIOD: 7},
+    {
+        const.CONF_FREQUENCY: "every-n-weeks",
+        const.CONF_PERIOD: 2,
+        const.CONF_CHORE_DAY: "wed",
+    },
+    {const.CONF_FREQUENCY: "after-n-weeks", const.CONF_PERIOD: 1},
+    {
+        const.CONF_FREQUENCY: "every-n-months",
+        const.CONF_CHORE_DAY: "fri",
+        const.CONF_WEEKDAY_ORDER_NUMBER: 2,
+    },
+    {const.CONF_FREQUENCY: "after-n-months", const.CONF_DAY_OF_MONTH: 15},
+    {const.CONF_FREQUENCY: "every-n-years", const.CONF_DATE: "06/01"},
+    {const.CONF_FREQUENCY: "after-n-years"},
+]
+
+
+def sample_chores(
+    count: int, seed: int = 0
+) -> tuple[list[MockConfigEntry], dict[str, Policy]]:
+    """Return chores of every frequency, and policies completing each 0-3 days late."""
+    rng = random.Random(seed)
+    entries = []
+    policies: dict[str, Policy] = {}
+    for index in range(count):
+        name = f"chore_{index}"
+        entries.append(
+            chore_entry(name, FREQUENCY_OPTIONS[index % len(FREQUENCY_OPTIONS)])
+        )
+        policies[f"sensor.{name}"] = complete_when_due(rng.randrange(4))
+    return entries, policies
@@ -0,0 +1,260 @@
+"""Load test: start-up and steady state of a large install.
+
+Sets up LOAD_ENTRIES (default 5000) chore config entries, spread over every
+frequency, in the Home Assistant test harness, and reports:
+
+- the time until all sensors set up (async_setup_entry), added
+  (async_added_to_hass) and written with their first state, and how long
+  forwarding the calendar platform took;
+- the event loop time and state writes per simulated hour, over LOAD_HOURS
+  (default 24) hours from 10:00, so the midnight refresh is included;
+- in the memory run, the peak memory traced (tracemalloc) while starting,
+  and the chore helper code lines allocating most of it.
+
+Memory tracing slows everything down, so timings come from a separate run.
+Each run appends its results as a JSON line to LOAD_REPORT (default
+.benchmarks/load_test.jsonl), with the integration version, to track them
+across releases.
+
+Run from the repository root:
+
+    python -m pytest benchmarks/test_load.py --no-cov -s
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from freezegun import api as freezegun_api
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.chore_helper import const, sensor
+from custom_components.chore_helper.chore import Chore
+
+ROOT = Path(__file__).resolve().parents[1]
+ENTRIES = int(os.environ.get("LOAD_ENTRIES", "5000"))
+HOURS = int(os.environ.get("LOAD_HOURS", "24"))
+REPORT = Path(os.environ.get("LOAD_REPORT", ROOT / ".benchmarks" / "load_test.jsonl"))
+# Local time the run starts at
+START = datetime(2024, 3, 5, 10)
+# Simulated time steps of the steady state run
+TICK = timedelta(minutes=1)
+TOP_ALLOCATIONS = 10
+
+# Options of each frequency, cycled through the entries
+FREQUENCY_OPTIONS: list[dict[str, Any]] = [
+    {const.CONF_FREQUENCY: "every-n-days", const.CONF_PERIOD: 3},
+    {const.CONF_FREQUENCY: "after-n-days", const.CONF_PERIOD: 7},
+    {
+        const.CONF_FREQUENCY: "every-n-weeks",
+        const.CONF_PERIOD: 2,
+        const.CONF_CHORE_DAY: "wed",
+    },
+    {const.CONF_FREQUENCY: "after-n-weeks", const.CONF_PERIOD: 1},
+    {
+        const.CONF_FREQUENCY: "every-n-months",
+        const.CONF_CHORE_DAY: "fri",
+        const.CONF_WEEKDAY_ORDER_NUMBER: 2,
+    },
+    {const.CONF_FREQUENCY: "after-n-months", const.CONF_DAY_OF_MONTH: 15},
+    {const.CONF_FREQUENCY: "every-n-years", const.CONF_DATE: "06/01"},
+    {const.CONF_FREQUENCY: "after-n-years"},
+    {const.CONF_FREQUENCY: "blank"},
+]
+
+
+def _entry(index: int) -> MockConfigEntry:
+    """Return the config entry of the chore with the index."""
+    options = FREQUENCY_OPTIONS[index % len(FREQUENCY_OPTIONS)]
+    name = f"Chore {index}"
+    return MockConfigEntry(
+        domain=const.DOMAIN,
+        title=name,
+        version=const.CONFIG_VERSION,
+        data={"unique_id": f"load_{index}"},
+        options={
+            "name": name,
+            const.CONF_START_DATE: "2024-01-01",
+            const.CONF_FORECAST_DATES: 30,
+            **options,
+        },
+    )
+
+
+def _perf_counter() -> float:
+    """Return the real performance counter, also while the clock is frozen."""
+    return freezegun_api.real_perf_counter()
+
+
+def _timed(
+    function: Callable[..., Awaitable[Any]], finished: list[float]
+) -> Callable[..., Awaitable[Any]]:
+    """Wrap a coroutine function, recording when each call finished."""
+
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = await function(*args, **kwargs)
+        finished.append(_perf_counter())
+        return result
+
+    return wrapper
+
+
+def _version() -> str:
+    """Return the integration version from its manifest."""
+    manifest = ROOT / "custom_components" / const.DOMAIN / "manifest.json"
+    return json.loads(manifest.read_text())["version"]
+
+
+async def _async_start(hass: HomeAssistant) -> dict[str, Any]:
+    """Set up all chores, returning the seconds each start-up stage took."""
+    for index in range(ENTRIES):
+        _entry(index).add_to_hass(hass)
+    setup: list[float] = []
+    added: list[float] = []
+    forwarded: list[float] = []
+    forward = hass.config_entries.async_forward_entry_setups
+
+    async def forward_entry_setups(entry: Any, platforms: list[str]) -> None:
+        started = _perf_counter()
+        await forward(entry, platforms)
+        if const.CALENDAR_PLATFORM in platforms:
+            forwarded.append(_perf_counter() - started)
+
+    with (
+        patch.object(
+            sensor, "async_setup_entry", _timed(sensor.async_setup_entry, setup)
+        ),
+        patch.object(
+            Chore, "async_added_to_hass", _timed(Chore.async_added_to_hass, added)
+        ),
+        patch.object(
+            hass.config_entries, "async_forward_entry_setups", forward_entry_setups
+        ),
+    ):
+        started = _perf_counter()
+        assert await async_setup_component(hass, const.DOMAIN, {})
+        await hass.async_block_till_done()
+        ready = _perf_counter()
+
+    assert len(setup) == len(added) == ENTRIES
+    assert len(hass.states.async_entity_ids("sensor")) == ENTRIES
+    return {
+        "setup_entries": round(max(setup) - started, 3),
+        "entities_added": round(max(added) - started, 3),
+        "entities_ready": round(ready - started, 3),
+        "calendar_forward": round(sum(forwarded), 3),
+    }
+
+
+async def _async_run_hours(hass: HomeAssistant, freezer: Any) -> list[dict[str, Any]]:
+    """Run the simulated clock, returning the loop time and writes per hour."""
+    writes = 0
+
+    def count_write(_: Any) -> None:
+        nonlocal writes
+        writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+    hours: list[dict[str, Any]] = []
+    try:
+        for _ in range(HOURS):
+            hour = dt_util.now().replace(minute=0, second=0, microsecond=0)
+            busy = 0.0
+            writes = 0
+            for _ in range(int(timedelta(hours=1) / TICK)):
+                freezer.tick(TICK)
+                started = _perf_counter()
+                async_fire_time_changed(hass, dt_util.utcnow())
+                await hass.async_block_till_done()
+                busy += _perf_counter() - started
+            hours.append(
+                {
+                    "hour": hour.isoformat(),
+                    "loop_time": round(busy, 4),
+                    "state_writes": writes,
+                }
+            )
+    finally:
+        unsub()
+    return hours
+
+
+def _report(run: str, results: dict[str, Any]) -> None:
+    """Print the results and append them to the report file."""
+    record = {
+        "time": freezegun_api.real_datetime.now().isoformat(timespec="seconds"),
+        "version": _version(),
+        "python": platform.python_version(),
+        "run": run,
+        "entries": ENTRIES,
+        **results,
+    }
+    print(json.dumps(record, indent=2))  # noqa: T201
+    REPORT.parent.mkdir(parents=True, exist_ok=True)
+    with REPORT.open("a", encoding="utf-8") as report:
+        report.write(json.dumps(record) + "\n")
+
+
+async def test_load_timing(
+    hass: HomeAssistant, freezer: Any, enable_custom_integrations: None
+) -> None:
+    """Start a large install and run it for a while, timing both."""
+    freezer.move_to(START.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE))
+    startup = await _async_start(hass)
+    hours = await _async_run_hours(hass, freezer)
+    loop_times = [hour["loop_time"] for hour in hours]
+    _report(
+        "timing",
+        {
+            "startup": startup,
+            "hourly": {
+                "mean_loop_time": round(sum(loop_times) / max(len(loop_times), 1), 4),
+                "max_loop_time": max(loop_times, default=0.0),
+                "hours": hours,
+            },
+        },
+    )
+
+
+async def test_load_memory(
+    hass: HomeAssistant, freezer: Any, enable_custom_integrations: None
+) -> None:
+    """Start a large install, tracing the memory it allocates."""
+    freezer.move_to(START.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE))
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        await _async_start(hass)
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(True, f"*{os.sep}{const.DOMAIN}{os.sep}*")]
+        )
+    finally:
+        tracemalloc.stop()
+    _report(
+        "memory",
+        {
+            "peak_bytes": peak - baseline,
+            "retained_bytes": current - baseline,
+            "retained_per_entry": (current - baseline) // ENTRIES,
+            "top_allocations": [
+                {"line": str(stat.traceback), "bytes": stat.size}
+                for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+            ],
+        },
+    )
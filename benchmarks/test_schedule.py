@@ -0,0 +1,199 @@
+"""Benchmark suite: schedule generation of every chore frequency class.
+
+Times the whole forecast, update_state and the calendar async_get_events for
+synthetic chores of every frequency in sensor.FREQUENCY_CLASSES (and the
+monthly patterns: nth weekday, nth week, day of month and negative orders),
+at forecast sizes of 1, 30 and 365 dates and with 0, 50 and 500 overrides.
+The clock is fixed, so runs are comparable.
+
+Run from the repository root with pytest-benchmark, saving the results to
+.benchmarks/ and comparing them with the last saved run:
+
+    python -m pytest benchmarks --no-cov --benchmark-autosave \
+        --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Add --benchmark-max-time=0.1 for a quicker, noisier run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from array import array
+from collections.abc import Generator
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.chore_helper import const, helpers
+from custom_components.chore_helper.calendar import EntitiesCalendarData
+from custom_components.chore_helper.chore import Chore
+from custom_components.chore_helper.chore_blank import BlankChore
+from custom_components.chore_helper.chore_daily import DailyChore
+from custom_components.chore_helper.chore_monthly import MonthlyChore
+from custom_components.chore_helper.chore_weekly import WeeklyChore
+from custom_components.chore_helper.chore_yearly import YearlyChore
+from custom_components.chore_helper.sensor import FREQUENCY_CLASSES
+
+NOW = datetime(2024, 3, 5, 12, tzinfo=timezone.utc)
+START_DATE = "2023-11-15"
+FORECAST_SIZES = (1, 30, 365)
+OVERRIDE_COUNTS = (0, 50, 500)
+# Days after today the overrides are spread over
+OVERRIDE_SPAN = 3 * 365
+ROUNDS = 50
+
+CHORE_CLASSES: dict[str, type[Chore]] = {
+    cls.__name__: cls
+    for cls in (DailyChore, WeeklyChore, MonthlyChore, YearlyChore, BlankChore)
+}
+
+# Frequency-specific options of each chore class
+CLASS_OPTIONS: dict[str, dict[str, Any]] = {
+    "DailyChore": {const.CONF_PERIOD: 3},
+    "WeeklyChore": {const.CONF_PERIOD: 2, const.CONF_CHORE_DAY: "wed"},
+    "MonthlyChore": {
+        const.CONF_PERIOD: 1,
+        const.CONF_CHORE_DAY: "fri",
+        const.CONF_WEEKDAY_ORDER_NUMBER: 2,
+    },
+    "YearlyChore": {const.CONF_PERIOD: 1, const.CONF_DATE: "06/01"},
+    "BlankChore": {},
+}
+
+# Case name -> chore options, one case per frequency, and the monthly patterns
+CASES: dict[str, dict[str, Any]] = {
+    frequency: {const.CONF_FREQUENCY: frequency, **CLASS_OPTIONS[name]}
+    for frequency, (_, name) in FREQUENCY_CLASSES.items()
+}
+CASES |= {
+    "every-n-months-nth-week": {
+        const.CONF_FREQUENCY: "every-n-months",
+        const.CONF_CHORE_DAY: "mon",
+        const.CONF_WEEKDAY_ORDER_NUMBER: 2,
+        const.CONF_FORCE_WEEK_NUMBERS: True,
+    },
+    "every-n-months-day-of-month": {
+        const.CONF_FREQUENCY: "every-n-months",
+        const.CONF_DAY_OF_MONTH: 31,
+    },
+    "every-n-months-last-weekday": {
+        const.CONF_FREQUENCY: "every-n-months",
+        const.CONF_CHORE_DAY: "sun",
+        const.CONF_WEEKDAY_ORDER_NUMBER: -1,
+    },
+    "every-n-months-last-week": {
+        const.CONF_FREQUENCY: "every-n-months",
+        const.CONF_CHORE_DAY: "thu",
+        const.CONF_WEEKDAY_ORDER_NUMBER: -1,
+        const.CONF_FORCE_WEEK_NUMBERS: True,
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def fixed_clock() -> Generator[None, None, None]:
+    """Run every benchmark at the same point in time."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(helpers, "now", lambda: NOW)
+        yield
+
+
+def _chore(case: str, forecast_dates: int, overrides: int) -> Chore:
+    """Build a chore of a case, with overrides spread over the next years."""
+    options = {
+        const.CONF_START_DATE: START_DATE,
+        const.CONF_FORECAST_DATES: forecast_dates,
+        **CASES[case],
+    }
+    chore_class = CHORE_CLASSES[FREQUENCY_CLASSES[options[const.CONF_FREQUENCY]][1]]
+    chore = chore_class(
+        SimpleNamespace(title=case, options=options, data={}, entry_id=case)
+    )
+    chore.entity_id = f"sensor.{case.replace('-', '_')}"
+    rng = random.Random(overrides)
+    today = NOW.date().toordinal()
+    days = [today + rng.randrange(OVERRIDE_SPAN) for _ in range(overrides)]
+    chore._add_dates = set(days[0::3])  # pylint: disable=protected-access
+    chore._remove_dates = set(days[1::3])  # pylint: disable=protected-access
+    # pylint: disable-next=protected-access
+    chore._offset_dates = {day: rng.choice((-2, -1, 1, 2)) for day in days[2::3]}
+    return chore
+
+
+def _reset(chore: Chore) -> None:
+    """Forget the due dates, as at start-up without a schedule cache."""
+    chore.set_due_dates(array("i"), 0)
+
+
+schedule_parameters = pytest.mark.parametrize(
+    ("case", "forecast_dates", "overrides"),
+    [
+        (case, forecast_dates, overrides)
+        for case in CASES
+        for forecast_dates in FORECAST_SIZES
+        for overrides in OVERRIDE_COUNTS
+    ],
+)
+
+
+@schedule_parameters
+def test_chore_schedule(
+    benchmark: Any, case: str, forecast_dates: int, overrides: int
+) -> None:
+    """Calculate the whole schedule of a chore."""
+    chore = _chore(case, forecast_dates, overrides)
+    dates = benchmark(lambda: chore.forecast_due_dates(chore.recurrence.forecast())[0])
+    if case != "blank":
+        assert dates
+
+
+@schedule_parameters
+def test_update_state(
+    benchmark: Any, case: str, forecast_dates: int, overrides: int
+) -> None:
+    """Find the next due date of a chore, forecasting as far as needed."""
+    chore = _chore(case, forecast_dates, overrides)
+    benchmark.pedantic(
+        chore.update_state, setup=lambda: _reset(chore), rounds=ROUNDS
+    )
+
+
+@pytest.mark.parametrize("days", [42, 365])
+@pytest.mark.parametrize("overrides", OVERRIDE_COUNTS)
+@pytest.mark.parametrize("forecast_dates", FORECAST_SIZES)
+def test_async_get_events(
+    benchmark: Any, forecast_dates: int, overrides: int, days: int
+) -> None:
+    """List the calendar events of all cases, from freshly loaded chores."""
+    chores = [_chore(case, forecast_dates, overrides) for case in CASES]
+    hass = SimpleNamespace(data={const.DOMAIN: {}})
+    calendar = EntitiesCalendarData(hass)
+    hass.data[const.DOMAIN] = {
+        const.SENSOR_PLATFORM: {chore.entity_id: chore for chore in chores},
+        const.CALENDAR_PLATFORM: calendar,
+    }
+    for chore in chores:
+        chore.hass = hass
+        calendar.add_entity(chore.entity_id)
+
+    def setup() -> None:
+        for chore in chores:
+            _reset(chore)
+            chore.update_state()
+
+    start = datetime.combine(date(2024, 3, 1), datetime.min.time(), NOW.tzinfo)
+    end = start + timedelta(days=days)
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark.pedantic(
+            lambda: loop.run_until_complete(
+                calendar.async_get_events(hass, start, end)
+            ),
+            setup=setup,
+            rounds=ROUNDS,
+        )
+    finally:
+        loop.close()
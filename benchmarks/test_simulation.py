@@ -0,0 +1,149 @@
+"""Simulated chore life: due date sequences over a year, and its run time.
+
+Checks the next due date and overdue sequences of chores completed late,
+run by the real scheduler on a frozen clock (see simulation.py), and times
+a year of CHORES chores against TARGET seconds (printed with -s). Most of
+that time goes to Home Assistant writing every chore's state at midnight,
+as the days until it is due change each day.
+
+Run from the repository root:
+
+    python -m pytest benchmarks/test_simulation.py --no-cov -s
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from freezegun import api as freezegun_api
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from simulation import (
+    START,
+    Simulation,
+    chore_entry,
+    complete_when_due,
+    sample_chores,
+)
+
+from custom_components.chore_helper import const
+
+YEAR = timedelta(days=365)
+CHORES = 1000
+# Chores checked after each event of the timed run; all are checked at its end
+SAMPLE = 20
+# Seconds a simulated year of CHORES chores should take
+TARGET = 10
+
+
+def _local(day: date, at: time = time()) -> datetime:
+    """Return the local time on the day."""
+    return datetime.combine(day, at, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+
+async def _async_simulate(
+    hass: HomeAssistant, freezer: Any, options: dict[str, Any], days_late: int
+) -> Simulation:
+    """Run a year of one chore, completed days_late days after each due date."""
+    simulation = Simulation(
+        hass, freezer, policies={"sensor.chore": complete_when_due(days_late)}
+    )
+    await simulation.async_start([chore_entry("chore", options)])
+    await simulation.async_run(_local(START + YEAR))
+    return simulation
+
+
+def _intervals(due_dates: list[date]) -> set[int]:
+    """Return the distinct numbers of days between consecutive due dates."""
+    return {(b - a).days for a, b in zip(due_dates, due_dates[1:])}
+
+
+async def test_after_n_days_moves_with_completion(
+    hass: HomeAssistant, freezer: Any, enable_custom_integrations: None
+) -> None:
+    """An after chore completed late is next due a period after completion."""
+    simulation = await _async_simulate(
+        hass,
+        freezer,
+        {const.CONF_FREQUENCY: "after-n-days", const.CONF_PERIOD: 7},
+        days_late=2,
+    )
+    due_dates = simulation.due_dates("sensor.chore")
+    assert due_dates[0] == START
+    assert _intervals(due_dates) == {9}
+    # Overdue from the midnight after each due date, until completed
+    for transition in simulation.history["sensor.chore"]:
+        due = transition.next_due_date
+        if transition.overdue:
+            assert transition.time == _local(due + timedelta(days=1))
+        elif transition.time != _local(START):
+            assert transition.time == _local(due - timedelta(days=7), time(19))
+
+
+async def test_every_n_weeks_keeps_its_weekday(
+    hass: HomeAssistant, freezer: Any, enable_custom_integrations: None
+) -> None:
+    """An every chore completed late stays on its weekly grid."""
+    simulation = await _async_simulate(
+        hass,
+        freezer,
+        {
+            const.CONF_FREQUENCY: "every-n-weeks",
+            const.CONF_PERIOD: 1,
+            const.CONF_CHORE_DAY: "wed",
+        },
+        days_late=2,
+    )
+    due_dates = simulation.due_dates("sensor.chore")
+    assert {due.weekday() for due in due_dates} == {2}
+    assert _intervals(due_dates) == {7}
+
+
+async def test_scripted_completion(
+    hass: HomeAssistant, freezer: Any, enable_custom_integrations: None
+) -> None:
+    """A completion from the script reschedules an after chore from then."""
+    simulation = Simulation(
+        hass,
+        freezer,
+        script=[(_local(date(2024, 1, 2), time(8)), "sensor.chore")],
+    )
+    await simulation.async_start(
+        [
+            chore_entry(
+                "chore",
+                {
+                    const.CONF_FREQUENCY: "after-n-days",
+                    const.CONF_PERIOD: 3,
+                    const.CONF_START_DATE: "2024-01-05",
+                },
+            )
+        ]
+    )
+    await simulation.async_run(_local(START + timedelta(days=10)))
+    assert simulation.completions == 1
+    assert simulation.due_dates("sensor.chore") == [date(2024, 1, 5)]
+    assert [t.overdue for t in simulation.history["sensor.chore"]] == [False, True]
+
+
+async def test_simulated_year(
+    hass: HomeAssistant, freezer: Any, enable_custom_integrations: None
+) -> None:
+    """Run a year of chores of every frequency, completed 0-3 days late."""
+    # The test loop runs in debug mode, recording a traceback per callback
+    hass.loop.set_debug(False)
+    entries, policies = sample_chores(CHORES)
+    simulation = Simulation(hass, freezer, policies=policies, sample=SAMPLE)
+    started = freezegun_api.real_perf_counter()
+    await simulation.async_start(entries)
+    await simulation.async_run(_local(START + YEAR))
+    elapsed = freezegun_api.real_perf_counter() - started
+    assert simulation.completions > CHORES
+    chore_days = CHORES * YEAR.days
+    print(  # noqa: T201
+        f"{CHORES} chores, {YEAR.days} days: {elapsed:.2f} s (target {TARGET} s, "
+        f"{'met' if elapsed <= TARGET else 'missed'}; checks included), "
+        f"{elapsed / chore_days * 1e6:.0f} us per chore-day, "
+        f"{simulation.events} events, {simulation.completions} completions"
+    )
@@ -22,20 +22,28 @@ import voluptuous as vol
 
 from . import const, helpers
 from .const import LOGGER
+from .person_index import PersonIndex
+from .schedule_cache import ScheduleCache
+from .scheduler import ChoreScheduler
+from .sensor import FREQUENCY_CLASSES
 
 PLATFORMS: list[str] = [const.SENSOR_PLATFORM]
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=30)
 
 months = [m["value"] for m in const.MONTH_OPTIONS]
-frequencies = [f["value"] for f in const.FREQUENCY_OPTIONS]
+frequencies = (
+    const.DAILY_FREQUENCY
+    + const.WEEKLY_FREQUENCY
+    + const.MONTHLY_FREQUENCY
+    + const.YEARLY_FREQUENCY
+    + const.BLANK_FREQUENCY
+)
 
 SENSOR_SCHEMA = vol.Schema(
     {
         vol.Required(const.CONF_FREQUENCY): vol.In(frequencies),
-        vol.Required(const.CONF_ICON_NORMAL): cv.icon,
-        vol.Optional(const.CONF_ICON_TODAY): cv.icon,
-        vol.Optional(const.CONF_ICON_TOMORROW): cv.icon,
+        vol.Optional(const.CONF_ICON): cv.icon,
         vol.Optional(ATTR_HIDDEN): cv.boolean,
         vol.Optional(const.CONF_MANUAL): cv.boolean,
         vol.Optional(const.CONF_DATE): helpers.month_day_text,
@@ -62,7 +70,14 @@ SENSOR_SCHEMA = vol.Schema(
 CONFIG_SCHEMA = vol.Schema(
     {
         const.DOMAIN: vol.Schema(
-            {vol.Optional(const.CONF_SENSORS): vol.All(cv.ensure_list, [SENSOR_SCHEMA])}
+            {
+                vol.Optional(const.CONF_SENSORS): vol.All(
+                    cv.ensure_list, [SENSOR_SCHEMA]
+                ),
+                vol.Optional(
+                    const.CONF_SCHEDULE_MODE, default=const.DEFAULT_SCHEDULE_MODE
+                ): vol.In(const.SCHEDULE_MODES),
+            }
         )
     },
     extra=vol.ALLOW_EXTRA,
@@ -112,6 +127,13 @@ OFFSET_DATE_SCHEMA = vol.Schema(
     }
 )
 
+TRACE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ENTITY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(const.CONF_ENABLED, default=True): cv.boolean,
+    }
+)
+
 GET_CHORES_BY_PERSON_SCHEMA = vol.Schema(
     {
         vol.Required("person"): cv.entity_id,
@@ -127,121 +149,133 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         """Handle the add_date service call."""
         entity_ids = call.data.get(CONF_ENTITY_ID, [])
         chore_date = call.data.get(const.CONF_DATE)
-        for entity_id in entity_ids:
-            LOGGER.debug("called add_date %s from %s", chore_date, entity_id)
-            try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                await entity.add_date(chore_date)
-            except KeyError as err:
-                LOGGER.error(
-                    "Failed adding date %s to %s (%s)",
-                    chore_date,
-                    entity_id,
-                    err,
-                )
+        async with hass.data[const.DOMAIN][const.SCHEDULER].batch() as batch:
+            for entity_id in entity_ids:
+                LOGGER.debug("called add_date %s from %s", chore_date, entity_id)
+                try:
+                    entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
+                    await entity.add_date(chore_date)
+                    batch.add(entity)
+                except KeyError as err:
+                    LOGGER.error(
+                        "Failed adding date %s to %s (%s)",
+                        chore_date,
+                        entity_id,
+                        err,
+                    )
 
     async def handle_remove_date(call: ServiceCall) -> None:
         """Handle the remove_date service call."""
         entity_ids = call.data.get(CONF_ENTITY_ID, [])
         chore_date = call.data.get(const.CONF_DATE, None)
-        for entity_id in entity_ids:
-            LOGGER.debug("called remove_date %s from %s", chore_date, entity_id)
-            try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                await entity.remove_date(chore_date)
-            except KeyError as err:
-                LOGGER.error(
-                    "Failed removing date %s from %s (%s)",
-                    chore_date,
-                    entity_id,
-                    err,
-                )
+        async with hass.data[const.DOMAIN][const.SCHEDULER].batch() as batch:
+            for entity_id in entity_ids:
+                LOGGER.debug("called remove_date %s from %s", chore_date, entity_id)
+                try:
+                    entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
+                    await entity.remove_date(chore_date)
+                    batch.add(entity)
+                except KeyError as err:
+                    LOGGER.error(
+                        "Failed removing date %s from %s (%s)",
+                        chore_date,
+                        entity_id,
+                        err,
+                    )
 
     async def handle_offset_date(call: ServiceCall) -> None:
         """Handle the offset_date service call."""
         entity_ids = call.data.get(CONF_ENTITY_ID, [])
         offset = call.data.get(const.CONF_OFFSET)
         chore_date = call.data.get(const.CONF_DATE, None)
-        for entity_id in entity_ids:
-            LOGGER.debug(
-                "called offset_date %s by %d days for %s",
-                chore_date,
-                offset,
-                entity_id,
-            )
-            try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                await entity.offset_date(offset, chore_date)
-            except (TypeError, KeyError) as err:
-                LOGGER.error("Failed offsetting date for %s - %s", entity_id, err)
-                break
+        async with hass.data[const.DOMAIN][const.SCHEDULER].batch() as batch:
+            for entity_id in entity_ids:
+                LOGGER.debug(
+                    "called offset_date %s by %d days for %s",
+                    chore_date,
+                    offset,
+                    entity_id,
+                )
+                try:
+                    entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
+                    await entity.offset_date(offset, chore_date)
+                    batch.add(entity)
+                except (TypeError, KeyError) as err:
+                    LOGGER.error("Failed offsetting date for %s - %s", entity_id, err)
+                    break
 
     async def handle_update_state(call: ServiceCall) -> None:
         """Handle the update_state service call."""
         entity_ids = call.data.get(CONF_ENTITY_ID, [])
-        for entity_id in entity_ids:
-            LOGGER.debug("called update_state for %s", entity_id)
-            try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                entity.update_state()
-            except KeyError as err:
-                LOGGER.error("Failed updating state for %s - %s", entity_id, err)
+        scheduler = hass.data[const.DOMAIN][const.SCHEDULER]
+        async with scheduler.batch(reload=False) as batch:
+            for entity_id in entity_ids:
+                LOGGER.debug("called update_state for %s", entity_id)
+                try:
+                    batch.add(hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id])
+                except KeyError as err:
+                    LOGGER.error("Failed updating state for %s - %s", entity_id, err)
 
     async def handle_complete_chore(call: ServiceCall) -> None:
         """Handle the complete_chore service call."""
         entity_ids = call.data.get(CONF_ENTITY_ID, [])
         last_completed = call.data.get(const.ATTR_LAST_COMPLETED, helpers.now())
-        for entity_id in entity_ids:
-            LOGGER.debug("called complete for %s", entity_id)
-            try:
-                entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                entity.last_completed = dt_util.as_local(last_completed)
-                # Rotate person for alternating allocation mode
-                entity.rotate_person()
-                entity.update_state()
-            except KeyError as err:
-                LOGGER.error(
-                    "Failed setting last completed for %s - %s", entity_id, err
-                )
+        async with hass.data[const.DOMAIN][const.SCHEDULER].batch() as batch:
+            for entity_id in entity_ids:
+                LOGGER.debug("called complete for %s", entity_id)
+                try:
+                    entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
+                    entity.last_completed = dt_util.as_local(last_completed)
+                    # Rotate person for alternating allocation mode
+                    entity.rotate_person()
+                    batch.add(entity)
+                except KeyError as err:
+                    LOGGER.error(
+                        "Failed setting last completed for %s - %s", entity_id, err
+                    )
+
+    async def handle_trace(call: ServiceCall) -> None:
+        """Handle the trace service call."""
+        entity_ids = call.data.get(CONF_ENTITY_ID, [])
+        enabled = call.data.get(const.CONF_ENABLED, True)
+        async with hass.data[const.DOMAIN][const.SCHEDULER].batch() as batch:
+            for entity_id in entity_ids:
+                LOGGER.debug("called trace %s for %s", enabled, entity_id)
+                try:
+                    entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
+                    entity.set_trace(enabled)
+                    batch.add(entity)
+                except KeyError as err:
+                    LOGGER.error("Failed tracing %s - %s", entity_id, err)
 
     async def handle_get_chores_by_person(call: ServiceCall) -> dict:
         """Handle the get_chores_by_person service call."""
         person_entity = call.data.get("person", "")
-        chores = []
-
-        for entity_id, entity in hass.data[const.DOMAIN][const.SENSOR_PLATFORM].items():
-            allocation_mode = entity.allocation_mode
-            assigned_to = entity.assigned_to
-            people_list = entity.people
-
-            # Include chore if:
-            # 1. Shared mode - person is in the people list
-            # 2. Single/Alternating mode - matches the assigned person
-            if allocation_mode == "shared" and person_entity in people_list:
-                chores.append({
-                    "entity_id": entity_id,
-                    "name": entity.name,
-                    "next_due_date": str(entity.next_due_date) if entity.next_due_date else None,
-                    "days": entity._days,
-                    "allocation_mode": allocation_mode,
-                    "assigned_to_name": entity.assigned_to_name,
-                })
-            elif allocation_mode in ["single", "alternating"] and assigned_to == person_entity:
-                chores.append({
-                    "entity_id": entity_id,
-                    "name": entity.name,
-                    "next_due_date": str(entity.next_due_date) if entity.next_due_date else None,
-                    "days": entity._days,
-                    "allocation_mode": allocation_mode,
-                    "assigned_to": assigned_to,
-                    "assigned_to_name": entity.assigned_to_name,
-                })
-
-        LOGGER.debug("Found %d chores for person %s", len(chores), person_entity)
-        return {"chores": chores}
+        # Include chore if:
+        # 1. Shared mode - person is in the people list
+        # 2. Single/Alternating mode - matches the assigned person
+        summary = hass.data[const.DOMAIN][const.PERSON_INDEX].summary(person_entity)
+        LOGGER.debug(
+            "Found %d chores for person %s", len(summary["chores"]), person_entity
+        )
+        return summary
 
     hass.data.setdefault(const.DOMAIN, {})
     hass.data[const.DOMAIN].setdefault(const.SENSOR_PLATFORM, {})
+    hass.data[const.DOMAIN].setdefault(const.PERSON_INDEX, PersonIndex())
+    if const.SCHEDULE_CACHE not in hass.data[const.DOMAIN]:
+        cache = ScheduleCache(hass)
+        await cache.async_load()
+        hass.data[const.DOMAIN][const.SCHEDULE_CACHE] = cache
+    if const.SCHEDULER not in hass.data[const.DOMAIN]:
+        scheduler = ChoreScheduler(
+            hass,
+            config.get(const.DOMAIN, {}).get(
+                const.CONF_SCHEDULE_MODE, const.DEFAULT_SCHEDULE_MODE
+            ),
+        )
+        scheduler.async_start()
+        hass.data[const.DOMAIN][const.SCHEDULER] = scheduler
     hass.services.async_register(
         const.DOMAIN,
         "complete",
@@ -266,6 +300,9 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     hass.services.async_register(
         const.DOMAIN, "offset_date", handle_offset_date, schema=OFFSET_DATE_SCHEMA
     )
+    hass.services.async_register(
+        const.DOMAIN, "trace", handle_trace, schema=TRACE_SCHEMA
+    )
     hass.services.async_register(
         const.DOMAIN,
         "get_chores_by_person",
@@ -299,10 +336,36 @@ async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         LOGGER.info("Successfully removed sensor from the chore_helper integration")
     except ValueError:
         pass
+    if (cache := hass.data[const.DOMAIN].get(const.SCHEDULE_CACHE)) is not None:
+        cache.async_remove(config_entry.data.get("unique_id", config_entry.entry_id))
 
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Update listener - to re-create device after options update."""
+    """Update listener - reconfigure the chore after options update."""
+    chore = next(
+        (
+            chore
+            for chore in hass.data[const.DOMAIN][const.SENSOR_PLATFORM].values()
+            if chore.config_entry.entry_id == entry.entry_id
+        ),
+        None,
+    )
+    # Take the new options in place, unless the chore needs another entity
+    # class or moves in or out of the calendar
+    frequency = entry.options.get(const.CONF_FREQUENCY)
+    if (
+        chore is not None
+        and frequency in FREQUENCY_CLASSES
+        and type(chore).__name__ == FREQUENCY_CLASSES[frequency][1]
+        and chore.hidden == entry.options.get(ATTR_HIDDEN, False)
+    ):
+        LOGGER.debug("Reconfiguring %s in place", entry.title)
+        async with hass.data[const.DOMAIN][const.SCHEDULER].batch() as batch:
+            chore.reconfigure(entry)
+            batch.add(chore)
+        return
+
+    # Re-create the device
     await hass.config_entries.async_forward_entry_unload(entry, const.SENSOR_PLATFORM)
     hass.async_add_job(
         hass.config_entries.async_forward_entry_setup(entry, const.SENSOR_PLATFORM)
@@ -3,18 +3,21 @@
 from __future__ import annotations
 import contextlib
 
-from datetime import datetime, timedelta
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from datetime import date, datetime
+from heapq import heapify, heappop, heappush
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util import Throttle
 
+from . import helpers
 from .const import CALENDAR_NAME, CALENDAR_PLATFORM, DOMAIN, SENSOR_PLATFORM
-
-MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=1)
-
+from .engine.recurrence import UpdateContext
 
 # pylint: disable=unused-argument
 async def async_setup_entry(
@@ -45,9 +48,28 @@ class ChoreCalendar(CalendarEntity):
         """Return the name of the entity."""
         return self._attr_name
 
-    async def async_update(self) -> None:
-        """Update all calendars."""
-        await self.hass.data[DOMAIN][CALENDAR_PLATFORM].async_update()
+    async def async_added_to_hass(self) -> None:
+        """Write state whenever the next upcoming event changes."""
+        await super().async_added_to_hass()
+        self.hass.data[DOMAIN][CALENDAR_PLATFORM].calendar = self
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+            )
+        )
+
+    @callback
+    def _async_handle_stop(self, _: Event) -> None:
+        """Cancel the event start and end wake-ups when HA stops."""
+        for unsub in self._alarm_unsubs or ():
+            unsub()
+        self._alarm_unsubs = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop writing state on event changes."""
+        await super().async_will_remove_from_hass()
+        if (data := self.hass.data[DOMAIN].get(CALENDAR_PLATFORM)) is not None:
+            data.calendar = None
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
@@ -67,26 +89,79 @@ class ChoreCalendar(CalendarEntity):
 
 
 class EntitiesCalendarData:
-    """Class used by the Entities Calendar class to hold all entity events."""
-
-    __slots__ = "_hass", "event", "entities", "_throttle"
+    """Class used by the Entities Calendar class to hold all entity events.
+
+    Due dates of all chores are indexed by day, so a range query costs
+    O(log n + k) for k events. The next upcoming event is kept in a min-heap
+    of next due dates, updated by the chores at O(log n) per change.
+    """
+
+    __slots__ = (
+        "_hass",
+        "event",
+        "entities",
+        "calendar",
+        "_days",
+        "_buckets",
+        "_entity_days",
+        "_next_days",
+        "_heap",
+        "_head",
+        "_write_pending",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize an Entities Calendar Data."""
         self._hass = hass
         self.event: CalendarEvent | None = None
         self.entities: list[str] = []
+        self.calendar: ChoreCalendar | None = None
+        # Sorted date ordinals having at least one chore due
+        self._days: array[int] = array("i")
+        # Date ordinal -> entity IDs of chores due that day
+        self._buckets: dict[int, set[str]] = {}
+        # Entity ID -> date ordinals indexed for it
+        self._entity_days: dict[str, set[int]] = {}
+        # Entity ID -> next due date ordinal, and a heap of its entries.
+        # Superseded heap entries are dropped lazily when they surface.
+        self._next_days: dict[str, int] = {}
+        self._heap: list[tuple[int, str]] = []
+        self._head: tuple[int, str] | None = None
+        self._write_pending = False
 
     def add_entity(self, entity_id: str) -> None:
         """Append entity ID to the calendar."""
-        if entity_id not in self.entities:
+        if entity_id not in self._entity_days:
             self.entities.append(entity_id)
+            self._entity_days[entity_id] = set()
 
     def remove_entity(self, entity_id: str) -> None:
         """Remove entity ID from the calendar."""
+        self.update_entity(entity_id, ())
+        self.update_next_due_date(entity_id, None)
+        self._entity_days.pop(entity_id, None)
         with contextlib.suppress(ValueError):
             self.entities.remove(entity_id)
 
+    def update_entity(self, entity_id: str, due_dates: Iterable[int]) -> None:
+        """Re-index the due dates (as date ordinals) of a calendar entity."""
+        if (old := self._entity_days.get(entity_id)) is None:
+            return
+        new = set(due_dates)
+        for day in old - new:
+            bucket = self._buckets[day]
+            bucket.discard(entity_id)
+            if not bucket:
+                del self._buckets[day]
+                del self._days[bisect_left(self._days, day)]
+        for day in new - old:
+            if (bucket := self._buckets.get(day)) is None:
+                self._buckets[day] = {entity_id}
+                insort(self._days, day)
+            else:
+                bucket.add(entity_id)
+        self._entity_days[entity_id] = new
+
     async def async_get_events(
         self, hass: HomeAssistant, start_datetime: datetime, end_datetime: datetime
     ) -> list[CalendarEvent]:
@@ -94,54 +169,86 @@ class EntitiesCalendarData:
         events: list[CalendarEvent] = []
         if SENSOR_PLATFORM not in hass.data[DOMAIN]:
             return events
-        start_date = start_datetime.date()
-        end_date = end_datetime.date()
+        chores = hass.data[DOMAIN][SENSOR_PLATFORM]
+        context = UpdateContext(helpers.now())
+        today = context.today.toordinal()
+        end = end_datetime.date().toordinal()
+        # Forecasts are only calculated as far as anyone looked
         for entity in self.entities:
-            if (
-                entity not in hass.data[DOMAIN][SENSOR_PLATFORM]
-                or hass.data[DOMAIN][SENSOR_PLATFORM][entity].hidden
-            ):
-                continue
-            chore = hass.data[DOMAIN][SENSOR_PLATFORM][entity]
-            start = chore.get_next_due_date(start_date, True)
-            today = datetime.now().date()
-            while start is not None and start_date <= start <= end_date:
-                if chore.show_overdue_today and (start < today):
-                    start = today
-
-                try:
-                    end = start + timedelta(days=1)
-                except TypeError:
-                    end = start
+            if (chore := chores.get(entity)) is not None and not chore.hidden:
+                chore.extend_due_dates(end, context)
+        overdue: set[str] = set()
+        first = bisect_left(self._days, start_datetime.date().toordinal())
+        last = bisect_right(self._days, end)
+        for day in self._days[first:last]:
+            for entity in self._buckets[day]:
+                if (chore := chores.get(entity)) is None or chore.hidden:
+                    continue
+                start = day
+                # Overdue dates are shown once, today
+                if chore.show_overdue_today and day <= today:
+                    if entity in overdue:
+                        continue
+                    if day < today:
+                        overdue.add(entity)
+                        start = today
                 name = chore.name if chore.name is not None else "Unknown"
-                event = CalendarEvent(
-                    summary=name,
-                    start=start,
-                    end=end,
+                events.append(
+                    CalendarEvent(
+                        summary=name,
+                        start=date.fromordinal(start),
+                        end=date.fromordinal(start + 1),
+                    )
                 )
-                events.append(event)
-                start = chore.get_next_due_date(start + timedelta(days=1), True)
         return events
 
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    async def async_update(self) -> None:
-        """Get the latest data."""
-        next_due_dates = {}
-        for entity in self.entities:
-            if (
-                self._hass.data[DOMAIN][SENSOR_PLATFORM][entity].next_due_date
-                is not None
-            ):
-                next_due_dates[entity] = self._hass.data[DOMAIN][SENSOR_PLATFORM][
-                    entity
-                ].next_due_date
-        if len(next_due_dates) > 0:
-            entity_id = min(next_due_dates.keys(), key=lambda k: next_due_dates[k])
-            start = next_due_dates[entity_id]
-            end = start + timedelta(days=1)
-            name = self._hass.data[DOMAIN][SENSOR_PLATFORM][entity_id].name
+    def update_next_due_date(self, entity_id: str, next_due_date: date | None) -> None:
+        """Track the next due date of a calendar entity."""
+        if entity_id not in self._entity_days:
+            return
+        day = None if next_due_date is None else next_due_date.toordinal()
+        if self._next_days.get(entity_id) == day:
+            return
+        if day is None:
+            del self._next_days[entity_id]
+        else:
+            self._next_days[entity_id] = day
+            heappush(self._heap, (day, entity_id))
+        if len(self._heap) > 2 * len(self._next_days) + 16:
+            self._heap = [(day, entity) for entity, day in self._next_days.items()]
+            heapify(self._heap)
+        self._update_event()
+
+    def refresh_event(self) -> None:
+        """Rebuild the next upcoming event, after a chore was renamed."""
+        self._head = None
+        self._update_event()
+
+    def _update_event(self) -> None:
+        """Pick the next upcoming event from the top of the heap."""
+        heap = self._heap
+        while heap and self._next_days.get(heap[0][1]) != heap[0][0]:
+            heappop(heap)
+        head = heap[0] if heap else None
+        if head == self._head:
+            return
+        self._head = head
+        if head is None:
+            self.event = None
+        else:
+            day, entity_id = head
             self.event = CalendarEvent(
-                summary=name,
-                start=start,
-                end=end,
+                summary=self._hass.data[DOMAIN][SENSOR_PLATFORM][entity_id].name,
+                start=date.fromordinal(day),
+                end=date.fromordinal(day + 1),
             )
+        # Coalesce the writes of all chores changed in the same loop iteration
+        if self.calendar is not None and not self._write_pending:
+            self._write_pending = True
+            self._hass.loop.call_soon(self._write_calendar_state)
+
+    def _write_calendar_state(self) -> None:
+        """Write the state of the calendar entity."""
+        self._write_pending = False
+        if self.calendar is not None:
+            self.calendar.async_write_ha_state()
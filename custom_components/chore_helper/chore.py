@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, time, timedelta
-from typing import Any
-from collections.abc import Generator
-from dateutil.relativedelta import relativedelta
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time
+import hashlib
+import json
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+from collections.abc import Mapping
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
@@ -13,36 +17,67 @@ from homeassistant.const import (
     ATTR_HIDDEN,
     CONF_NAME,
 )
+from homeassistant.core import State
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from . import const, helpers
 from .const import LOGGER
-from .calendar import EntitiesCalendarData
+from .engine.forecast import END_OF_TIME, Forecast
+from .engine.recurrence import Overrides, Recurrence, UpdateContext, to_date
+from .person_index import PersonIndex
+from .schedule_cache import ScheduleCache
+from .tracing import ChoreTrace
+
+if TYPE_CHECKING:
+    # The calendar platform (and the calendar component it is built on) is
+    # only imported once a visible chore is added
+    from .calendar import EntitiesCalendarData
 
 PLATFORMS: list[str] = [const.CALENDAR_PLATFORM]
 
+# A chore due today is no longer due after this time
+EXPIRATION = time(23, 59, 59)
+
 
 class Chore(RestoreEntity):
     """Chore Sensor class."""
 
+    # Schedule engine of the frequency - set by each frequency class
+    RECURRENCE: type[Recurrence] = Recurrence
+
+    # Updates are driven by the integration-wide ChoreScheduler
+    _attr_should_poll = False
+    # Static, bulky or volatile attributes, not worth a recorder row
+    _unrecorded_attributes = frozenset(
+        {
+            const.ATTR_LAST_UPDATED,
+            const.ATTR_OFFSET_DATES,
+            const.ATTR_ADD_DATES,
+            const.ATTR_REMOVE_DATES,
+            const.ATTR_ALLOCATION_MODE,
+            const.ATTR_PEOPLE,
+            const.ATTR_ASSIGNED_TO_NAME,
+            "end_type",
+            "end_date",
+            "end_after_occurrences",
+        }
+    )
+
     __slots__ = (
         "_attr_icon",
         "_attr_name",
         "_attr_state",
         "_due_dates",
+        "_horizon",
+        "_forecast",
         "_date_format",
         "_days",
-        "_first_month",
         "_hidden",
-        "_last_month",
         "_last_updated",
         "_manual",
         "_next_due_date",
-        "_forecast_dates",
         "_overdue",
         "_overdue_days",
-        "_frequency",
-        "_start_date",
         "_offset_dates",
         "_add_dates",
         "_remove_dates",
@@ -53,53 +88,56 @@ class Chore(RestoreEntity):
         "_end_date",
         "_end_after_occurrences",
         "_occurrence_count",
+        "_attributes",
+        "_attributes_key",
+        "_recurrence",
         "show_overdue_today",
         "config_entry",
-        "last_completed",
     )
 
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Read configuration and initialise class variables."""
-        config = config_entry.options
         self.config_entry = config_entry
+        # Sorted date ordinals, calculated up to the horizon ordinal
+        self._due_dates: array[int] = array("i")
+        self._horizon: int = 0
+        self._forecast: Forecast | None = None
+        self._next_due_date: date | None = None
+        self._last_updated: datetime | None = None
+        self._days: int | None = None
+        self._overdue: bool = False
+        self._overdue_days: int | None = None
+        self._attr_state = self._days
+        # Manual overrides, by date ordinal
+        self._offset_dates: dict[int, int] = {}
+        self._add_dates: set[int] = set()
+        self._remove_dates: set[int] = set()
+        self._assigned_to: str | None = None
+        self._occurrence_count: int = 0  # Track how many times this chore has been completed
+        # State attributes, cached until one of the values they are built from changes
+        self._attributes: dict[str, Any] = {}
+        self._attributes_key: tuple | None = None
+        self._recurrence = self.RECURRENCE(config_entry.options, helpers.now)
+        self._load_options(config_entry.options)
+
+    def _load_options(self, config: Mapping[str, Any]) -> None:
+        """Read the chore options - the recurrence reads its own."""
         self._attr_name = (
-            config_entry.title
-            if config_entry.title is not None
+            self.config_entry.title
+            if self.config_entry.title is not None
             else config.get(CONF_NAME)
         )
+        self._recurrence.name = self._attr_name
         self._hidden = config.get(ATTR_HIDDEN, False)
         self._manual = config.get(const.CONF_MANUAL)
-        first_month = config.get(const.CONF_FIRST_MONTH, const.DEFAULT_FIRST_MONTH)
-        months = [m["value"] for m in const.MONTH_OPTIONS]
-        self._first_month: int = (
-            months.index(first_month) + 1 if first_month in months else 1
-        )
-        last_month = config.get(const.CONF_LAST_MONTH, const.DEFAULT_LAST_MONTH)
-        self._last_month: int = (
-            months.index(last_month) + 1 if last_month in months else 12
-        )
         # Single icon for all states
         self._attr_icon = config.get(const.CONF_ICON, const.DEFAULT_ICON)
         self._date_format = config.get(
             const.CONF_DATE_FORMAT, const.DEFAULT_DATE_FORMAT
         )
-        self._forecast_dates: int = config.get(const.CONF_FORECAST_DATES) or 0
         self.show_overdue_today: bool = (
             config.get(const.CONF_SHOW_OVERDUE_TODAY) or False
         )
-        self._due_dates: list[date] = []
-        self._next_due_date: date | None = None
-        self._last_updated: datetime | None = None
-        self.last_completed: datetime | None = None
-        self._days: int | None = None
-        self._overdue: bool = False
-        self._overdue_days: int | None = None
-        self._frequency: str = config.get(const.CONF_FREQUENCY)
-        self._attr_state = self._days
-        self._start_date: date | None
-        self._offset_dates: str = None
-        self._add_dates: str = None
-        self._remove_dates: str = None
         self._allocation_mode: str = config.get(
             const.CONF_ALLOCATION_MODE, const.DEFAULT_ALLOCATION_MODE
         )
@@ -110,20 +148,49 @@ class Chore(RestoreEntity):
             self._people: list[str] = [p.strip() for p in people_config.split(",") if p.strip()]
         else:
             self._people: list[str] = people_config if people_config else []
-        self._assigned_to: str | None = None
-        try:
-            self._start_date = helpers.to_date(config.get(const.CONF_START_DATE))
-        except ValueError:
-            self._start_date = None
 
         # Range of recurrence
         self._end_type: str = config.get(const.CONF_END_TYPE, const.DEFAULT_END_TYPE)
         try:
-            self._end_date = helpers.to_date(config.get(const.CONF_END_DATE)) if config.get(const.CONF_END_DATE) else None
+            self._end_date = to_date(config.get(const.CONF_END_DATE)) if config.get(const.CONF_END_DATE) else None
         except ValueError:
             self._end_date = None
         self._end_after_occurrences: int | None = config.get(const.CONF_END_AFTER_OCCURRENCES)
-        self._occurrence_count: int = 0  # Track how many times this chore has been completed
+
+    def reconfigure(self, config_entry: ConfigEntry) -> None:
+        """Take changed options in place; the schedule is recalculated by the caller."""
+        self.config_entry = config_entry
+        self._recurrence.load_options(config_entry.options)
+        self._load_options(config_entry.options)
+        self._update_person_index()
+        if (calendar := self._calendar) is not None:
+            calendar.refresh_event()
+
+    @property
+    def recurrence(self) -> Recurrence:
+        """Return the schedule engine of the chore."""
+        return self._recurrence
+
+    @property
+    def last_completed(self) -> datetime | None:
+        """Return when the chore was last completed."""
+        return self._recurrence.last_completed
+
+    @last_completed.setter
+    def last_completed(self, value: datetime | None) -> None:
+        """Set when the chore was last completed."""
+        self._recurrence.last_completed = value
+
+    @property
+    def trace(self) -> ChoreTrace | None:
+        """Return the schedule derivation trace, if tracing is enabled."""
+        return self._recurrence.trace
+
+    def set_trace(self, enabled: bool) -> None:
+        """Start (afresh) or stop tracing the schedule derivation."""
+        self._recurrence.trace = ChoreTrace() if enabled else None
+        # Derive the schedule again, from this chore alone
+        self._forecast = None
 
     async def async_added_to_hass(self) -> None:
         """When sensor is added to HA, restore state and add it to calendar."""
@@ -131,54 +198,87 @@ class Chore(RestoreEntity):
         self.hass.data[const.DOMAIN][const.SENSOR_PLATFORM][self.entity_id] = self
 
         # Restore stored state
-        if (state := await self.async_get_last_state()) is not None:
-            self._last_updated = None  # Unblock update - after options change
-            self._attr_state = state.state
-            self._days = state.attributes.get(const.ATTR_DAYS, None)
-            next_due_date = (
-                helpers.parse_datetime(state.attributes[const.ATTR_NEXT_DATE])
-                if const.ATTR_NEXT_DATE in state.attributes
-                else None
-            )
-            self._next_due_date = (
-                None if next_due_date is None else next_due_date.date()
-            )
-            self.last_completed = (
-                helpers.parse_datetime(state.attributes[const.ATTR_LAST_COMPLETED])
-                if const.ATTR_LAST_COMPLETED in state.attributes
-                else None
-            )
-            self._overdue = state.attributes.get(const.ATTR_OVERDUE, False)
-            self._overdue_days = state.attributes.get(const.ATTR_OVERDUE_DAYS, None)
-            self._offset_dates = state.attributes.get(const.ATTR_OFFSET_DATES, None)
-            self._add_dates = state.attributes.get(const.ATTR_ADD_DATES, None)
-            self._remove_dates = state.attributes.get(const.ATTR_REMOVE_DATES, None)
-            self._assigned_to = state.attributes.get(const.ATTR_ASSIGNED_TO, None)
-            self._occurrence_count = state.attributes.get("occurrence_count", 0)
+        if (restored := await self.async_get_last_state()) is not None:
+            self.restore_state(restored)
 
         # Initialize person assignment if not restored and allocation is enabled
         if self._assigned_to is None and self._allocation_mode in ["single", "alternating"]:
             self._initialize_assignment()
+        else:
+            self._update_person_index()
+
+        # Come up with the schedule loaded, if it did not change since
+        context = self._recurrence.snapshot()
+        if (cache := self._schedule_cache) is not None and (
+            cached := cache.get(self, context)
+        ) is not None:
+            self._due_dates, self._horizon = cached
 
         # Create or add to calendar
         if not self.hidden:
             if const.CALENDAR_PLATFORM not in self.hass.data[const.DOMAIN]:
-                self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM] = (
-                    EntitiesCalendarData(self.hass)
-                )
-                LOGGER.debug("Creating chore calendar")
-                await self.hass.config_entries.async_forward_entry_setups(
-                    self.config_entry, PLATFORMS
+                calendar_module = await self.hass.async_add_executor_job(
+                    import_module, f"{__package__}.calendar"
                 )
+                # Another chore may have created the calendar while importing
+                if const.CALENDAR_PLATFORM not in self.hass.data[const.DOMAIN]:
+                    self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM] = (
+                        calendar_module.EntitiesCalendarData(self.hass)
+                    )
+                    LOGGER.debug("Creating chore calendar")
+                    await self.hass.config_entries.async_forward_entry_setups(
+                        self.config_entry, PLATFORMS
+                    )
 
-            self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM].add_entity(
-                self.entity_id
-            )
+            calendar = self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM]
+            calendar.add_entity(self.entity_id)
+            calendar.update_entity(self.entity_id, self._due_dates)
+            calendar.update_next_due_date(self.entity_id, self._next_due_date)
+
+        scheduler = self.hass.data[const.DOMAIN][const.SCHEDULER]
+        if restored is not None and self.hass.is_running:
+            # Re-created or reloaded: no start-up refresh replaces the restored
+            # state, which predates the options this chore was created with
+            await scheduler.async_refresh([self], force=True)
+        else:
+            scheduler.async_schedule_chore_expiry(self, context)
+
+    def restore_state(self, state: State) -> None:
+        """Restore the chore from its last stored state."""
+        self._last_updated = None  # Unblock update - after options change
+        self._attr_state = state.state
+        self._days = state.attributes.get(const.ATTR_DAYS, None)
+        next_due_date = (
+            helpers.parse_datetime(state.attributes[const.ATTR_NEXT_DATE])
+            if const.ATTR_NEXT_DATE in state.attributes
+            else None
+        )
+        self._next_due_date = None if next_due_date is None else next_due_date.date()
+        self.last_completed = (
+            helpers.parse_datetime(state.attributes[const.ATTR_LAST_COMPLETED])
+            if const.ATTR_LAST_COMPLETED in state.attributes
+            else None
+        )
+        self._overdue = state.attributes.get(const.ATTR_OVERDUE, False)
+        self._overdue_days = state.attributes.get(const.ATTR_OVERDUE_DAYS, None)
+        self._offset_dates = helpers.text_to_offsets(
+            state.attributes.get(const.ATTR_OFFSET_DATES, None)
+        )
+        self._add_dates = helpers.text_to_ordinals(
+            state.attributes.get(const.ATTR_ADD_DATES, None)
+        )
+        self._remove_dates = helpers.text_to_ordinals(
+            state.attributes.get(const.ATTR_REMOVE_DATES, None)
+        )
+        self._assigned_to = state.attributes.get(const.ATTR_ASSIGNED_TO, None)
+        self._occurrence_count = state.attributes.get("occurrence_count", 0)
 
     async def async_will_remove_from_hass(self) -> None:
         """When sensor is removed from HA, remove it and its calendar entity."""
         await super().async_will_remove_from_hass()
         del self.hass.data[const.DOMAIN][const.SENSOR_PLATFORM][self.entity_id]
+        if (index := self._person_index) is not None:
+            index.remove(self.entity_id)
         self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM].remove_entity(
             self.entity_id
         )
@@ -208,6 +308,7 @@ class Chore(RestoreEntity):
 
         if self._people:
             self._assigned_to = self._people[0]
+        self._update_person_index()
 
     def _get_next_person(self) -> str | None:
         """Get the next person in rotation for alternating mode."""
@@ -234,6 +335,28 @@ class Chore(RestoreEntity):
         """Rotate to the next person for alternating allocation mode."""
         if self._allocation_mode == "alternating":
             self._assigned_to = self._get_next_person()
+            self._update_person_index()
+
+    @property
+    def responsible_people(self) -> frozenset[str]:
+        """Return the person entity IDs this chore is listed for."""
+        if self._allocation_mode == "shared":
+            return frozenset(self._people)
+        if self._allocation_mode in ["single", "alternating"] and self._assigned_to:
+            return frozenset({self._assigned_to})
+        return frozenset()
+
+    @property
+    def _person_index(self) -> PersonIndex | None:
+        """Return the person index, if the integration set it up."""
+        if self.hass is None:
+            return None
+        return self.hass.data[const.DOMAIN].get(const.PERSON_INDEX)
+
+    def _update_person_index(self) -> None:
+        """Re-index the chore under the people responsible for it."""
+        if (index := self._person_index) is not None:
+            index.update(self)
 
     @property
     def unique_id(self) -> str:
@@ -252,6 +375,26 @@ class Chore(RestoreEntity):
         """Return next date attribute."""
         return self._next_due_date
 
+    @property
+    def due_dates(self) -> list[date]:
+        """Return the loaded due dates."""
+        return [date.fromordinal(ordinal) for ordinal in self._due_dates]
+
+    @property
+    def days(self) -> int | None:
+        """Return days attribute."""
+        return self._days
+
+    def expiration(self, context: UpdateContext | None = None) -> datetime | None:
+        """Return when the next due date stops being due."""
+        if self._next_due_date is None:
+            return None
+        if context is None:
+            context = self._recurrence.snapshot()
+        return datetime.combine(
+            self._next_due_date, EXPIRATION, tzinfo=context.now.tzinfo
+        )
+
     @property
     def overdue(self) -> bool:
         """Return overdue attribute."""
@@ -263,19 +406,19 @@ class Chore(RestoreEntity):
         return self._overdue_days
 
     @property
-    def offset_dates(self) -> str:
+    def offset_dates(self) -> str | None:
         """Return offset_dates attribute."""
-        return self._offset_dates
+        return helpers.offsets_to_text(self._offset_dates)
 
     @property
-    def add_dates(self) -> str:
+    def add_dates(self) -> str | None:
         """Return add_dates attribute."""
-        return self._add_dates
+        return helpers.ordinals_to_text(self._add_dates)
 
     @property
-    def remove_dates(self) -> str:
+    def remove_dates(self) -> str | None:
         """Return remove_dates attribute."""
-        return self._remove_dates
+        return helpers.ordinals_to_text(self._remove_dates)
 
     @property
     def allocation_mode(self) -> str:
@@ -304,6 +447,11 @@ class Chore(RestoreEntity):
         """Return the hidden attribute."""
         return self._hidden
 
+    @property
+    def manual(self) -> bool:
+        """Return whether the state is only updated by the update_state service."""
+        return bool(self._manual)
+
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return unit of measurement - None for numerical value."""
@@ -327,7 +475,33 @@ class Chore(RestoreEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        return {
+        # Override collections are replaced rather than mutated, so comparing
+        # the key is mostly identity checks. The name of the assigned person
+        # comes from their state, which changes without the chore knowing.
+        assigned_to_name = self.assigned_to_name
+        key = (
+            self.last_completed,
+            self._last_updated,
+            self._overdue,
+            self._overdue_days,
+            self._next_due_date,
+            self._offset_dates,
+            self._add_dates,
+            self._remove_dates,
+            self._allocation_mode,
+            self._people,
+            self._assigned_to,
+            assigned_to_name,
+            self._end_type,
+            self._end_date,
+            self._end_after_occurrences,
+            self._occurrence_count,
+            self._days,
+        )
+        if key == self._attributes_key:
+            return self._attributes
+        self._attributes_key = key
+        self._attributes = {
             const.ATTR_LAST_COMPLETED: self.last_completed,
             const.ATTR_LAST_UPDATED: self.last_updated,
             const.ATTR_OVERDUE: self.overdue,
@@ -339,7 +513,7 @@ class Chore(RestoreEntity):
             const.ATTR_ALLOCATION_MODE: self.allocation_mode,
             const.ATTR_PEOPLE: self.people,
             const.ATTR_ASSIGNED_TO: self.assigned_to,
-            const.ATTR_ASSIGNED_TO_NAME: self.assigned_to_name,
+            const.ATTR_ASSIGNED_TO_NAME: assigned_to_name,
             "end_type": self._end_type,
             "end_date": self._end_date,
             "end_after_occurrences": self._end_after_occurrences,
@@ -348,6 +522,7 @@ class Chore(RestoreEntity):
             # Needed for translations to work
             ATTR_DEVICE_CLASS: self.DEVICE_CLASS,
         }
+        return self._attributes
 
     @property
     def DEVICE_CLASS(self) -> str:  # pylint: disable=C0103
@@ -363,22 +538,17 @@ class Chore(RestoreEntity):
             f"attributes={self.extra_state_attributes})"
         )
 
-    def _find_candidate_date(self, day1: date) -> date | None:
-        """Find the next possible date starting from day1.
-
-        Only based on calendar, not looking at include/exclude days.
-        Must be implemented for each child class.
-        """
-        raise NotImplementedError
-
-    async def _async_ready_for_update(self) -> bool:
+    async def async_ready_for_update(
+        self, context: UpdateContext | None = None
+    ) -> bool:
         """Check if the entity is ready for the update.
 
         Skip the update if the sensor was updated today
         Except for the sensors with with next date today and after the expiration time
         """
-        current_date_time = helpers.now()
-        today = current_date_time.date()
+        if context is None:
+            context = self._recurrence.snapshot()
+        today = context.today
         try:
             ready_for_update = bool(self._last_updated.date() != today)  # type: ignore
         except AttributeError:
@@ -393,98 +563,149 @@ class Chore(RestoreEntity):
             pass
         return ready_for_update
 
-    def date_inside(self, dat: date) -> bool:
-        """Check if the date is inside first and last date."""
-        month = dat.month
-        if self._first_month <= self._last_month:
-            return bool(self._first_month <= month <= self._last_month)
-        return bool(self._first_month <= month or month <= self._last_month)
-
-    def move_to_range(self, day: date) -> date:
-        """If the date is not in range, move to the range."""
-        if not self.date_inside(day):
-            year = day.year
-            month = day.month
-            months = [m["label"] for m in const.MONTH_OPTIONS]
-            if self._first_month <= self._last_month < month:
-                LOGGER.debug(
-                    "(%s) %s outside the range, looking from %s next year",
-                    self._attr_name,
-                    day,
-                    months[self._first_month - 1],
-                )
-                return date(year + 1, self._first_month, 1)
-            LOGGER.debug(
-                "(%s) %s outside the range, searching from %s",
-                self._attr_name,
-                day,
-                months[self._first_month - 1],
-            )
-            return date(year, self._first_month, 1)
-        return day
-
-    def chore_schedule(self) -> Generator[date, None, None]:
-        """Get dates within configured date range."""
-        start_date: date = self._calculate_start_date()
-        for _ in range(int(self._forecast_dates) + 1):
-            try:
-                next_due_date = self._find_candidate_date(start_date)
-            except (TypeError, ValueError):
-                break
-            if next_due_date is None:
-                break
-            if (new_date := self.move_to_range(next_due_date)) != next_due_date:
-                start_date = new_date
-            else:
-                should_remove = False
-                if self._remove_dates is not None:
-                    for remove_date in self._remove_dates.split(" "):
-                        if remove_date == (next_due_date.strftime("%Y-%m-%d")):
-                            should_remove = True
-                            break
-                if not should_remove:
-                    offset = None
-                    if self._offset_dates is not None:
-                        offset_compare = next_due_date.strftime("%Y-%m-%d")
-                        for offset_date in self._offset_dates.split(" "):
-                            if offset_date.startswith(offset_compare):
-                                offset = int(offset_date.split(":")[1])
-                                break
-                    yield (
-                        next_due_date
-                        if offset is None
-                        else next_due_date + relativedelta(days=offset)
-                    )
-                start_date = next_due_date + relativedelta(
-                    days=1
-                )  # look from the next day
-        if self._add_dates is not None:
-            for add_date_str in self._add_dates.split(" "):
-                yield datetime.strptime(add_date_str, "%Y-%m-%d").date()
-        return
-
-    async def _async_load_due_dates(self) -> None:
+    @property
+    def _overrides(self) -> Overrides:
+        """Return the manual overrides of the due dates."""
+        return Overrides(self._add_dates, self._remove_dates, self._offset_dates)
+
+    def forecast_due_dates(
+        self,
+        forecast: Forecast,
+        until: int | None = None,
+        context: UpdateContext | None = None,
+    ) -> tuple[array[int], int]:
+        """Extend a forecast past until (to the end if None) and apply overrides."""
+        return self._recurrence.forecast_due_dates(
+            forecast, self._overrides, until, context
+        )
+
+    def forecast_next_due_dates(
+        self, forecast: Forecast, context: UpdateContext | None = None
+    ) -> tuple[array[int], int]:
+        """Extend a forecast just until the next due date is known."""
+        return self._recurrence.forecast_next_due_dates(
+            forecast, self._overrides, context
+        )
+
+    def recurrence_key(self, context: UpdateContext | None = None) -> tuple | None:
+        """Return a key equal for chores whose base schedule is the same."""
+        return self._recurrence.key(context)
+
+    def schedule_key(self, context: UpdateContext | None = None) -> str:
+        """Hash everything the due dates are calculated from.
+
+        That includes today, and whether the chore was completed today, as
+        the next due date is looked for from the day after then.
+        """
+        if context is None:
+            context = self._recurrence.snapshot()
+        today = context.today
+        last_completed = self.last_completed
+        inputs = (
+            dict(self.config_entry.options),
+            self._recurrence.start_date(context).toordinal(),
+            today.toordinal(),
+            last_completed is not None and last_completed.date() == today,
+            last_completed,
+            sorted(self._offset_dates.items()),
+            sorted(self._add_dates),
+            sorted(self._remove_dates),
+        )
+        return hashlib.sha1(
+            json.dumps(inputs, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def set_due_dates(
+        self,
+        due_dates: array[int],
+        horizon: int,
+        forecast: Forecast | None = None,
+        context: UpdateContext | None = None,
+    ) -> None:
+        """Store calculated due dates, cache them and index them in the calendar.
+
+        The due dates are complete up to the horizon ordinal, and are extended
+        from the forecast when anyone looks further.
+        """
+        self._due_dates = due_dates
+        self._horizon = horizon
+        self._forecast = forecast
+        self._update_calendar()
+        if (cache := self._schedule_cache) is not None:
+            cache.async_set(self, due_dates, horizon, context)
+
+    def _extend_to_next_due_date(self, context: UpdateContext) -> None:
+        """Calculate due dates until the next due date, if not known yet."""
+        if self._recurrence.next_due_date_known(
+            self._due_dates, self._horizon, context
+        ):
+            return
+        if (forecast := self._forecast) is None or not forecast.valid_in(context):
+            forecast = self._recurrence.forecast(context)
+        self.set_due_dates(
+            *self.forecast_next_due_dates(forecast, context), forecast, context
+        )
+
+    def extend_due_dates(
+        self, until: int | None = None, context: UpdateContext | None = None
+    ) -> None:
+        """Calculate due dates past until (or all of them), if not done yet."""
+        if self._horizon == END_OF_TIME or (
+            until is not None and until <= self._horizon
+        ):
+            return
+        if context is None:
+            context = self._recurrence.snapshot()
+        if (forecast := self._forecast) is None or not forecast.valid_in(context):
+            forecast = self._recurrence.forecast(context)
+        self.set_due_dates(
+            *self.forecast_due_dates(forecast, until, context), forecast, context
+        )
+
+    async def _async_load_due_dates(self, context: UpdateContext) -> None:
         """Fill the chore dates list."""
-        self._due_dates.clear()
-        for chore_date in self.chore_schedule():
-            self._due_dates.append(chore_date)
-        self._due_dates.sort()
+        if (
+            (cache := self._schedule_cache) is not None
+            and self.trace is None
+            and (cached := cache.get(self, context)) is not None
+        ):
+            self.set_due_dates(*cached, context=context)
+            return
+        forecast = self._recurrence.forecast(context)
+        self.set_due_dates(
+            *self.forecast_next_due_dates(forecast, context), forecast, context
+        )
+
+    @property
+    def _schedule_cache(self) -> ScheduleCache | None:
+        """Return the schedule cache, if the integration set it up."""
+        if self.hass is None:
+            return None
+        return self.hass.data[const.DOMAIN].get(const.SCHEDULE_CACHE)
+
+    @property
+    def _calendar(self) -> EntitiesCalendarData | None:
+        """Return the chore calendar data, if the calendar was created."""
+        if self.hass is None:
+            return None
+        return self.hass.data[const.DOMAIN].get(const.CALENDAR_PLATFORM)
+
+    def _update_calendar(self) -> None:
+        """Re-index the loaded due dates in the chore calendar."""
+        if (calendar := self._calendar) is not None:
+            calendar.update_entity(self.entity_id, self._due_dates)
 
     async def add_date(self, chore_date: date) -> None:
         """Add date to due dates."""
-        add_dates = self._add_dates.split(" ") if self._add_dates else []
-        date_str = chore_date.strftime("%Y-%m-%d")
-        if date_str not in add_dates:
-            add_dates.append(date_str)
-            add_dates.sort()
-            self._add_dates = " ".join(add_dates)
+        if (ordinal := chore_date.toordinal()) not in self._add_dates:
+            # Copy on write - the schedule may be calculated in an executor
+            self._add_dates = self._add_dates | {ordinal}
         else:
             LOGGER.warning(
                 "%s was already added to %s",
                 chore_date,
                 self.name,
             )
-        self.update_state()
 
     async def remove_date(self, chore_date: date | None = None) -> None:
         """Remove date from chore dates."""
@@ -493,19 +714,14 @@ class Chore(RestoreEntity):
         if chore_date is None:
             LOGGER.warning("No date to remove from %s", self.name)
             return
-        remove_dates = self._remove_dates.split(" ") if self._remove_dates else []
-        date_str = chore_date.strftime("%Y-%m-%d")
-        if date_str not in remove_dates:
-            remove_dates.append(date_str)
-            remove_dates.sort()
-            self._remove_dates = " ".join(remove_dates)
+        if (ordinal := chore_date.toordinal()) not in self._remove_dates:
+            self._remove_dates = self._remove_dates | {ordinal}
         else:
             LOGGER.warning(
                 "%s was already removed from %s",
                 chore_date,
                 self.name,
             )
-        self.update_state()
 
     async def offset_date(self, offset: int, chore_date: date | None = None) -> None:
         """Offset date in chore dates."""
@@ -514,64 +730,85 @@ class Chore(RestoreEntity):
         if chore_date is None:
             LOGGER.warning("No date to offset from %s", self.name)
             return
-        offset_dates = (
-            [
-                x
-                for x in self._offset_dates.split(" ")
-                if not x.startswith(chore_date.strftime("%Y-%m-%d"))
-            ]
-            if self._offset_dates is not None
-            else []
-        )
-        date_str = chore_date.strftime("%Y-%m-%d")
-        offset_dates.append(f"{date_str}:{offset}")
-        offset_dates.sort()
-        self._offset_dates = " ".join(offset_dates)
-        self.update_state()
-
-    def get_next_due_date(self, start_date: date, ignore_today=False) -> date | None:
+        self._offset_dates = {**self._offset_dates, chore_date.toordinal(): offset}
+
+    def get_next_due_date(
+        self,
+        start_date: date,
+        ignore_today=False,
+        context: UpdateContext | None = None,
+    ) -> date | None:
         """Get next date from self._due_dates."""
-        current_date_time = helpers.now()
-        for d in self._due_dates:  # pylint: disable=invalid-name
-            if d < start_date:
-                continue
-            if not ignore_today and d == current_date_time.date():
-                expiration = time(23, 59, 59)
-
-                if current_date_time.time() > expiration or (
+        index = bisect_left(self._due_dates, start_date.toordinal())
+        if index == len(self._due_dates):
+            return None
+        if not ignore_today:
+            if context is None:
+                context = self._recurrence.snapshot()
+            current_date_time = context.now
+            today = context.today
+            if self._due_dates[index] == today.toordinal() and (
+                current_date_time.time() > EXPIRATION
+                or (
                     self.last_completed is not None
-                    and self.last_completed.date() == current_date_time.date()
+                    and self.last_completed.date() == today
                     and current_date_time.time() >= self.last_completed.time()
-                ):
-                    continue
-            return d
-        return None
+                )
+            ):
+                index = bisect_right(self._due_dates, today.toordinal(), index)
+                if index == len(self._due_dates):
+                    return None
+        return date.fromordinal(self._due_dates[index])
 
     async def async_update(self) -> None:
         """Get the latest data and updates the states."""
-        if not await self._async_ready_for_update() or not self.hass.is_running:
+        context = self._recurrence.snapshot()
+        if not await self.async_ready_for_update(context) or not self.hass.is_running:
             return
 
         LOGGER.debug("(%s) Calling update", self._attr_name)
-        await self._async_load_due_dates()
+        await self._async_load_due_dates(context)
+        self.due_dates_loaded(context)
+
+    def due_dates_loaded(self, context: UpdateContext | None = None) -> None:
+        """Fire a chore_helper_loaded event and update the state."""
         LOGGER.debug(
             "(%s) Dates loaded, firing a chore_helper_loaded event",
             self._attr_name,
         )
+        # The event lists the whole forecast - only calculate it if listened to
+        if self.hass.bus.async_listeners().get("chore_helper_loaded"):
+            self.extend_due_dates(context=context)
         event_data = {
             "entity_id": self.entity_id,
-            "due_dates": helpers.dates_to_texts(self._due_dates),
+            "due_dates": helpers.dates_to_texts(self.due_dates),
         }
         self.hass.bus.async_fire("chore_helper_loaded", event_data)
         if not self._manual:
-            self.update_state()
+            self.update_state(context)
 
-    def update_state(self) -> None:
+    def update_state(self, context: UpdateContext | None = None) -> None:
         """Pick the first event from chore dates, update attributes."""
         LOGGER.debug("(%s) Looking for next chore date", self._attr_name)
-        self._last_updated = helpers.now()
-        today = self._last_updated.date()
-        self._next_due_date = self.get_next_due_date(self._calculate_start_date())
+        if context is None:
+            context = self._recurrence.snapshot()
+        self._last_updated = context.now
+        today = context.today
+        self._extend_to_next_due_date(context)
+        start_date = self._recurrence.start_date(context)
+        self._next_due_date = self.get_next_due_date(start_date, context=context)
+        if (trace := self.trace) is not None:
+            trace.record(
+                "next_due_date",
+                date=self._next_due_date,
+                start_date=start_date,
+                due_dates=len(self._due_dates),
+                horizon=(
+                    None
+                    if self._horizon == END_OF_TIME
+                    else date.fromordinal(self._horizon)
+                ),
+            )
         if self._next_due_date is not None:
             LOGGER.debug(
                 "(%s) next_due_date (%s), today (%s)",
@@ -594,82 +831,16 @@ class Chore(RestoreEntity):
             self._attr_state = None
             self._overdue = False
             self._overdue_days = None
-
-        start_date = self._calculate_start_date()
-        if self._add_dates is not None:
-            self._add_dates = " ".join(
-                [
-                    x
-                    for x in self._add_dates.split(" ")
-                    if datetime.strptime(x, "%Y-%m-%d").date() >= start_date
-                ]
-            )
-        if self._remove_dates is not None:
-            self._remove_dates = " ".join(
-                [
-                    x
-                    for x in self._remove_dates.split(" ")
-                    if datetime.strptime(x, "%Y-%m-%d").date() >= start_date
-                ]
-            )
-        if self._offset_dates is not None:
-            self._offset_dates = " ".join(
-                [
-                    x
-                    for x in self._offset_dates.split(" ")
-                    if datetime.strptime(x.split(":")[0], "%Y-%m-%d").date()
-                    >= start_date
-                ]
-            )
-
-    def calculate_day1(self, day1: date, schedule_start_date: date) -> date:
-        """Calculate day1."""
-        start_date = self._calculate_start_date()
-        if start_date > day1:
-            day1 = start_date
-        if schedule_start_date > day1:
-            day1 = schedule_start_date
-        today = helpers.now().date()
-        if (
-            day1 == today
-            and self.last_completed is not None
-            and self.last_completed.date() == today
-        ):
-            day1 = day1 + relativedelta(days=1)
-        return day1
-
-    def _calculate_start_date(self) -> date:
-        """Calculate start date based on the last completed date."""
-
-        start_date = (
-            self._start_date
-            if self._start_date is not None
-            else date(helpers.now().date().year - 1, 1, 1)
-        )
-
-        if self.last_completed is not None:
-            last_completed = self.last_completed.date()
-
-            if last_completed > start_date:
-                start_date = last_completed
-            elif last_completed == start_date:
-                start_date += timedelta(days=1)
-
-        return self.move_to_range(start_date)
-
-    def _calculate_schedule_start_date(self) -> date:
-        """Calculate start date for scheduling offsets."""
-
-        after = self._frequency[:6] == "after-"
-        start_date = self._start_date
-
-        if after and self.last_completed is not None:
-            earliest_date = self._add_period_offset(self.last_completed.date())
-
-            if earliest_date > start_date:
-                start_date = earliest_date
-
-        return start_date
-
-    def _add_period_offset(self, start_date: date) -> date:
-        return start_date + timedelta(days=1)
+        if (calendar := self._calendar) is not None:
+            calendar.update_next_due_date(self.entity_id, self._next_due_date)
+        self._update_person_index()
+
+        start = start_date.toordinal()
+        if any(x < start for x in self._add_dates):
+            self._add_dates = {x for x in self._add_dates if x >= start}
+        if any(x < start for x in self._remove_dates):
+            self._remove_dates = {x for x in self._remove_dates if x >= start}
+        if any(x < start for x in self._offset_dates):
+            self._offset_dates = {
+                x: offset for x, offset in self._offset_dates.items() if x >= start
+            }
@@ -1,8 +1,34 @@
 """Constants for the Chore Helper integration."""
 
-from logging import Logger, getLogger
+from __future__ import annotations
 
-from homeassistant.helpers import selector
+from logging import Logger, getLogger
+from typing import TYPE_CHECKING
+
+# Options the schedule engine reads are defined beside it
+from .engine.const import (  # noqa: F401
+    CONF_CHORE_DAY,
+    CONF_DATE,
+    CONF_DAY_OF_MONTH,
+    CONF_DUE_DATE_OFFSET,
+    CONF_FIRST_MONTH,
+    CONF_FIRST_WEEK,
+    CONF_FORCE_WEEK_NUMBERS,
+    CONF_FORECAST_DATES,
+    CONF_FREQUENCY,
+    CONF_LAST_MONTH,
+    CONF_PERIOD,
+    CONF_START_DATE,
+    CONF_WEEKDAY_ORDER_NUMBER,
+    DEFAULT_FIRST_MONTH,
+    DEFAULT_LAST_MONTH,
+    MONTH_OPTIONS,
+)
+
+if TYPE_CHECKING:
+    # Option lists are plain dicts, so the selector module (and everything it
+    # imports) is only loaded by the config flow
+    from homeassistant.helpers.selector import SelectOptionDict
 
 LOGGER: Logger = getLogger(__package__)
 
@@ -10,6 +36,12 @@ DOMAIN = "chore_helper"
 CALENDAR_NAME = "Chores"
 SENSOR_PLATFORM = "sensor"
 CALENDAR_PLATFORM = "calendar"
+SCHEDULER = "scheduler"
+SCHEDULE_CACHE = "schedule_cache"
+PERSON_INDEX = "person_index"
+
+STORAGE_KEY = f"{DOMAIN}.schedules"
+STORAGE_VERSION = 1
 ATTRIBUTION = "Data is provided by chore_helper"
 CONFIG_VERSION = 6
 
@@ -32,24 +64,11 @@ DEVICE_CLASS = "chore_helper__schedule"
 
 CONF_SENSOR = "sensor"
 CONF_ENABLED = "enabled"
-CONF_FORECAST_DATES = "forecast_dates"
 CONF_SHOW_OVERDUE_TODAY = "show_overdue_today"
-CONF_FREQUENCY = "frequency"
 CONF_MANUAL = "manual_update"
 CONF_ICON = "icon"
 CONF_OFFSET = "offset"
-CONF_DAY_OF_MONTH = "day_of_month"
-CONF_DUE_DATE_OFFSET = "due_date_offset"
-CONF_FIRST_MONTH = "first_month"
-CONF_LAST_MONTH = "last_month"
-CONF_CHORE_DAY = "chore_day"
-CONF_WEEKDAY_ORDER_NUMBER = "weekday_order_number"
-CONF_FORCE_WEEK_NUMBERS = "force_week_order_numbers"
-CONF_DATE = "date"
 CONF_TIME = "time"
-CONF_PERIOD = "period"
-CONF_FIRST_WEEK = "first_week"
-CONF_START_DATE = "start_date"
 CONF_SENSORS = "sensors"
 CONF_DATE_FORMAT = "date_format"
 CONF_ALLOCATION_MODE = "allocation_mode"
@@ -65,16 +84,21 @@ CONF_DAY_TYPE = "day_type"
 CONF_END_TYPE = "end_type"
 CONF_END_DATE = "end_date"
 CONF_END_AFTER_OCCURRENCES = "end_after_occurrences"
+CONF_SCHEDULE_MODE = "schedule_mode"
+
+# Where chore schedules are calculated during refreshes
+SCHEDULE_MODE_EXECUTOR = "executor"
+SCHEDULE_MODE_INLINE = "inline"
+SCHEDULE_MODES = [SCHEDULE_MODE_EXECUTOR, SCHEDULE_MODE_INLINE]
 
 DEFAULT_NAME = DOMAIN
-DEFAULT_FIRST_MONTH = "jan"
-DEFAULT_LAST_MONTH = "dec"
 DEFAULT_FREQUENCY = "every-n-days"
 DEFAULT_PERIOD = 1
 DEFAULT_FIRST_WEEK = 1
 DEFAULT_DATE_FORMAT = "%b-%d-%Y"
 DEFAULT_FORECAST_DATES = 10
 DEFAULT_SHOW_OVERDUE_TODAY = False
+DEFAULT_SCHEDULE_MODE = SCHEDULE_MODE_EXECUTOR
 
 DEFAULT_ICON = "mdi:broom"
 ICON = DEFAULT_ICON
@@ -89,104 +113,89 @@ MONTHLY_FREQUENCY = ["every-n-months", "after-n-months"]
 YEARLY_FREQUENCY = ["every-n-years", "after-n-years"]
 BLANK_FREQUENCY = ["blank"]
 
-WEEKDAY_OPTIONS = [
-    selector.SelectOptionDict(value="0", label="None"),
-    selector.SelectOptionDict(value="mon", label="Monday"),
-    selector.SelectOptionDict(value="tue", label="Tuesday"),
-    selector.SelectOptionDict(value="wed", label="Wednesday"),
-    selector.SelectOptionDict(value="thu", label="Thursday"),
-    selector.SelectOptionDict(value="fri", label="Friday"),
-    selector.SelectOptionDict(value="sat", label="Saturday"),
-    selector.SelectOptionDict(value="sun", label="Sunday"),
-]
-
-MONTH_OPTIONS = [
-    selector.SelectOptionDict(value="jan", label="January"),
-    selector.SelectOptionDict(value="feb", label="February"),
-    selector.SelectOptionDict(value="mar", label="March"),
-    selector.SelectOptionDict(value="apr", label="April"),
-    selector.SelectOptionDict(value="may", label="May"),
-    selector.SelectOptionDict(value="jun", label="June"),
-    selector.SelectOptionDict(value="jul", label="July"),
-    selector.SelectOptionDict(value="aug", label="August"),
-    selector.SelectOptionDict(value="sep", label="September"),
-    selector.SelectOptionDict(value="oct", label="October"),
-    selector.SelectOptionDict(value="nov", label="November"),
-    selector.SelectOptionDict(value="dec", label="December"),
+WEEKDAY_OPTIONS: list[SelectOptionDict] = [
+    {"value": "0", "label": "None"},
+    {"value": "mon", "label": "Monday"},
+    {"value": "tue", "label": "Tuesday"},
+    {"value": "wed", "label": "Wednesday"},
+    {"value": "thu", "label": "Thursday"},
+    {"value": "fri", "label": "Friday"},
+    {"value": "sat", "label": "Saturday"},
+    {"value": "sun", "label": "Sunday"},
 ]
 
-ORDER_OPTIONS = [
-    selector.SelectOptionDict(value="0", label="None"),
-    selector.SelectOptionDict(value="1", label="1st"),
-    selector.SelectOptionDict(value="2", label="2nd"),
-    selector.SelectOptionDict(value="3", label="3rd"),
-    selector.SelectOptionDict(value="4", label="4th"),
-    selector.SelectOptionDict(value="5", label="5th"),
-    selector.SelectOptionDict(value="-1", label="last"),
-    selector.SelectOptionDict(value="-2", label="2nd from last"),
-    selector.SelectOptionDict(value="-3", label="3rd from last"),
-    selector.SelectOptionDict(value="-4", label="4th from last"),
+ORDER_OPTIONS: list[SelectOptionDict] = [
+    {"value": "0", "label": "None"},
+    {"value": "1", "label": "1st"},
+    {"value": "2", "label": "2nd"},
+    {"value": "3", "label": "3rd"},
+    {"value": "4", "label": "4th"},
+    {"value": "5", "label": "5th"},
+    {"value": "-1", "label": "last"},
+    {"value": "-2", "label": "2nd from last"},
+    {"value": "-3", "label": "3rd from last"},
+    {"value": "-4", "label": "4th from last"},
 ]
 
-MULTIPLE_PEOPLE_MODE_OPTIONS = [
-    selector.SelectOptionDict(value="alternating", label="Alternating (rotate on completion)"),
-    selector.SelectOptionDict(value="shared", label="Shared (all selected people)"),
+MULTIPLE_PEOPLE_MODE_OPTIONS: list[SelectOptionDict] = [
+    {"value": "alternating", "label": "Alternating (rotate on completion)"},
+    {"value": "shared", "label": "Shared (all selected people)"},
 ]
 
 # Recurrence type options
-RECURRENCE_TYPE_OPTIONS = [
-    selector.SelectOptionDict(value="daily", label="Daily"),
-    selector.SelectOptionDict(value="weekly", label="Weekly"),
-    selector.SelectOptionDict(value="monthly", label="Monthly"),
-    selector.SelectOptionDict(value="yearly", label="Yearly"),
+RECURRENCE_TYPE_OPTIONS: list[SelectOptionDict] = [
+    {"value": "daily", "label": "Daily"},
+    {"value": "weekly", "label": "Weekly"},
+    {"value": "monthly", "label": "Monthly"},
+    {"value": "yearly", "label": "Yearly"},
 ]
 
 # Daily pattern options
-DAILY_PATTERN_OPTIONS = [
-    selector.SelectOptionDict(value="every_n_days", label="Every X days"),
-    selector.SelectOptionDict(value="every_weekday", label="Every weekday"),
-    selector.SelectOptionDict(value="regenerate_days", label="X days after completion"),
+DAILY_PATTERN_OPTIONS: list[SelectOptionDict] = [
+    {"value": "every_n_days", "label": "Every X days"},
+    {"value": "every_weekday", "label": "Every weekday"},
+    {"value": "regenerate_days", "label": "X days after completion"},
 ]
 
 # Weekly pattern options
-WEEKLY_PATTERN_OPTIONS = [
-    selector.SelectOptionDict(value="recur_weekly", label="Every X weeks on:"),
-    selector.SelectOptionDict(value="regenerate_weeks", label="X weeks after completion"),
+WEEKLY_PATTERN_OPTIONS: list[SelectOptionDict] = [
+    {"value": "recur_weekly", "label": "Every X weeks on:"},
+    {"value": "regenerate_weeks", "label": "X weeks after completion"},
 ]
 
 # Monthly pattern options
-MONTHLY_PATTERN_OPTIONS = [
-    selector.SelectOptionDict(value="day_of_month", label="Day X of every X months"),
-    selector.SelectOptionDict(value="nth_day_type", label="The Xth [day] of every X months"),
-    selector.SelectOptionDict(value="regenerate_months", label="X months after completion"),
+MONTHLY_PATTERN_OPTIONS: list[SelectOptionDict] = [
+    {"value": "day_of_month", "label": "Day X of every X months"},
+    {"value": "nth_day_type", "label": "The Xth [day] of every X months"},
+    {"value": "regenerate_months", "label": "X months after completion"},
 ]
 
 # Yearly pattern options
-YEARLY_PATTERN_OPTIONS = [
-    selector.SelectOptionDict(value="month_day", label="Every [month] [day]"),
-    selector.SelectOptionDict(value="nth_day_type_of_month", label="The Xth [day] of [month]"),
-    selector.SelectOptionDict(value="regenerate_years", label="X years after completion"),
+YEARLY_PATTERN_OPTIONS: list[SelectOptionDict] = [
+    {"value": "month_day", "label": "Every [month] [day]"},
+    {"value": "nth_day_type_of_month", "label": "The Xth [day] of [month]"},
+    {"value": "regenerate_years", "label": "X years after completion"},
 ]
 
 # Day type options (for monthly/yearly nth patterns)
-DAY_TYPE_OPTIONS = [
-    selector.SelectOptionDict(value="day", label="Day"),
-    selector.SelectOptionDict(value="weekday", label="Weekday"),
-    selector.SelectOptionDict(value="weekend_day", label="Weekend day"),
-    selector.SelectOptionDict(value="monday", label="Monday"),
-    selector.SelectOptionDict(value="tuesday", label="Tuesday"),
-    selector.SelectOptionDict(value="wednesday", label="Wednesday"),
-    selector.SelectOptionDict(value="thursday", label="Thursday"),
-    selector.SelectOptionDict(value="friday", label="Friday"),
-    selector.SelectOptionDict(value="saturday", label="Saturday"),
-    selector.SelectOptionDict(value="sunday", label="Sunday"),
+DAY_TYPE_OPTIONS: list[SelectOptionDict] = [
+    {"value": "day", "label": "Day"},
+    {"value": "weekday", "label": "Weekday"},
+    {"value": "weekend_day", "label": "Weekend day"},
+    {"value": "monday", "label": "Monday"},
+    {"value": "tuesday", "label": "Tuesday"},
+    {"value": "wednesday", "label": "Wednesday"},
+    {"value": "thursday", "label": "Thursday"},
+    {"value": "friday", "label": "Friday"},
+    {"value": "saturday", "label": "Saturday"},
+    {"value": "sunday", "label": "Sunday"},
 ]
 
 # End type options (for range of recurrence)
-END_TYPE_OPTIONS = [
-    selector.SelectOptionDict(value="no_end", label="No end date"),
-    selector.SelectOptionDict(value="end_by_date", label="End by"),
-    selector.SelectOptionDict(value="end_after_occurrences", label="End after X occurrences"),
+END_TYPE_OPTIONS: list[SelectOptionDict] = [
+    {"value": "no_end", "label": "No end date"},
+    {"value": "end_by_date", "label": "End by"},
+    {"value": "end_after_occurrences", "label": "End after X occurrences"},
 ]
 
 DEFAULT_ALLOCATION_MODE = "none"
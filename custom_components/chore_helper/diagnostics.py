@@ -8,6 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from . import const
+from .engine import recurrence
 
 
 async def async_get_config_entry_diagnostics(
@@ -26,5 +27,9 @@ async def async_get_config_entry_diagnostics(
         "state": entity_data.state,
         "attributes": entity_data.extra_state_attributes,
         "config_entry": entry.as_dict(),
+        "month_table_cache": recurrence.month_table_cache_info(),
+        "trace": (
+            None if entity_data.trace is None else entity_data.trace.as_list()
+        ),
     }
     return data
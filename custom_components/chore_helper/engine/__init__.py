@@ -0,0 +1,6 @@
+"""Chore schedule engine - the recurrence math, without Home Assistant.
+
+Nothing here imports Home Assistant or the rest of the integration, so the
+engine can also be imported on its own, as the top-level package "engine"
+with the integration directory on sys.path (see scripts/schedule.py).
+"""
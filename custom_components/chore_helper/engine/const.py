@@ -0,0 +1,39 @@
+"""Chore options the schedule engine reads, re-exported by the integration."""
+
+from __future__ import annotations
+
+from logging import Logger, getLogger
+
+LOGGER: Logger = getLogger(__package__)
+
+CONF_FORECAST_DATES = "forecast_dates"
+CONF_FREQUENCY = "frequency"
+CONF_DAY_OF_MONTH = "day_of_month"
+CONF_DUE_DATE_OFFSET = "due_date_offset"
+CONF_FIRST_MONTH = "first_month"
+CONF_LAST_MONTH = "last_month"
+CONF_CHORE_DAY = "chore_day"
+CONF_WEEKDAY_ORDER_NUMBER = "weekday_order_number"
+CONF_FORCE_WEEK_NUMBERS = "force_week_order_numbers"
+CONF_DATE = "date"
+CONF_PERIOD = "period"
+CONF_FIRST_WEEK = "first_week"
+CONF_START_DATE = "start_date"
+
+DEFAULT_FIRST_MONTH = "jan"
+DEFAULT_LAST_MONTH = "dec"
+
+MONTH_OPTIONS: list[dict[str, str]] = [
+    {"value": "jan", "label": "January"},
+    {"value": "feb", "label": "February"},
+    {"value": "mar", "label": "March"},
+    {"value": "apr", "label": "April"},
+    {"value": "may", "label": "May"},
+    {"value": "jun", "label": "June"},
+    {"value": "jul", "label": "July"},
+    {"value": "aug", "label": "August"},
+    {"value": "sep", "label": "September"},
+    {"value": "oct", "label": "October"},
+    {"value": "nov", "label": "November"},
+    {"value": "dec", "label": "December"},
+]
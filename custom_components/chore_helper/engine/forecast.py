@@ -0,0 +1,73 @@
+"""Chore schedules generated on demand."""
+
+from __future__ import annotations
+
+from array import array
+from datetime import date
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .recurrence import Recurrence, UpdateContext
+
+# Horizon of a forecast generated to its end
+END_OF_TIME = date.max.toordinal()
+
+
+class Forecast:
+    """Base schedule of a recurrence, generated as far as asked and memoised.
+
+    Date ordinals are pulled from the resumable candidate generator of the
+    recurrence it was created from, and kept, so a later request reaching
+    further only generates the new tail. Chores with the same recurrence key
+    share the forecast; it stops extending once the recurrence it was created
+    from changed. Candidates are generated in the update context the forecast
+    was started in, which is the current one while it is valid (the key holds
+    today).
+    """
+
+    __slots__ = "key", "dates", "_recurrence", "_candidates", "_done", "_lock"
+
+    def __init__(
+        self, recurrence: Recurrence, key: tuple | None, context: UpdateContext
+    ) -> None:
+        """Start a forecast of the recurrence."""
+        self.key = key
+        # Base date ordinals, in the order they were generated
+        self.dates: array[int] = array("i")
+        self._recurrence = recurrence
+        self._candidates = recurrence.base_candidates(context)
+        self._done = False
+        # Extended from the event loop and from schedule executor jobs
+        self._lock = threading.Lock()
+
+    @property
+    def done(self) -> bool:
+        """Return True if the whole forecast was generated."""
+        return self._done
+
+    @property
+    def valid(self) -> bool:
+        """Return True if the forecast can still be extended."""
+        return self.valid_in()
+
+    def valid_in(self, context: UpdateContext | None = None) -> bool:
+        """Return True if the forecast can still be extended in the context."""
+        return self._done or self._recurrence.key(context) == self.key
+
+    def extend(
+        self, until: int | None = None, context: UpdateContext | None = None
+    ) -> None:
+        """Generate dates past the until ordinal (or to the end, if None)."""
+        with self._lock:
+            if self._done or (
+                until is not None and self.dates and self.dates[-1] > until
+            ):
+                return
+            if not self.valid_in(context):
+                return
+            for candidate in self._candidates:
+                self.dates.append(candidate)
+                if until is not None and candidate > until:
+                    return
+            self._done = True
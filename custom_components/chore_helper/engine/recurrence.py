@@ -0,0 +1,853 @@
+"""Chore schedule engine - the recurrence math, without Home Assistant.
+
+Recurrences are built from the plain options of a chore config entry and a
+clock returning the current local date and time, so schedules can also be
+calculated outside Home Assistant (see scripts/schedule.py). Only the
+standard library, dateutil and the engine constants are imported.
+
+The clock is read once per refresh pass, into an UpdateContext passed down
+the calculations; without one, each public method takes its own snapshot.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from collections.abc import Callable, Generator, Iterable, Mapping, Set
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol
+
+from dateutil.relativedelta import relativedelta
+
+from . import const
+from .const import LOGGER
+from .forecast import END_OF_TIME, Forecast
+
+if TYPE_CHECKING:
+    Clock = Callable[[], datetime]
+
+# Same as homeassistant.const.WEEKDAYS
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+
+def local_now() -> datetime:
+    """Return the current local date and time - the default clock."""
+    return datetime.now().astimezone()
+
+
+def to_date(day: Any) -> date:
+    """Convert datetime or text to date, if not already datetime.
+
+    Used for the first date for every_n_days (configured as text).
+    """
+    if day is None:
+        raise ValueError
+    if isinstance(day, date):
+        return day
+    if isinstance(day, datetime):
+        return day.date()
+    return date.fromisoformat(day)
+
+
+def week_index(ordinal: int) -> int:
+    """Return the number of whole weeks from Monday 0001-01-01 to a date ordinal."""
+    return (ordinal - 1) // 7
+
+
+def week_start(week: int) -> int:
+    """Return the date ordinal of the Monday of an absolute week index."""
+    return week * 7 + 1
+
+
+def weekday(ordinal: int) -> int:
+    """Return the day of the week of a date ordinal (Monday is 0)."""
+    return (ordinal - 1) % 7
+
+
+def month_index(day: date) -> int:
+    """Return an absolute month index (year * 12 + month - 1)."""
+    return day.year * 12 + day.month - 1
+
+
+def month_start(month: int) -> date:
+    """Return the first day of an absolute month index."""
+    year, month = divmod(month, 12)
+    return date(year, month + 1, 1)
+
+
+class MonthWeekdayTable(NamedTuple):
+    """All dates of one weekday in a month, with the month's week boundaries."""
+
+    dates: tuple[date, ...]  # every occurrence of the weekday in the month
+    first_week: date  # Monday of the week containing the 1st
+    weeks: int  # weeks touching the month
+    weeks_with_day: int  # weeks up to the last one containing the weekday
+
+
+# 12 months x 7 weekdays x ~12 years
+MONTH_TABLE_SIZE = 1024
+
+
+@lru_cache(maxsize=MONTH_TABLE_SIZE)
+def month_weekday_table(year: int, month: int, weekday: int) -> MonthWeekdayTable:
+    """Return the (shared, cached) lookup table for a weekday in a month."""
+    first_of_month = date(year, month, 1)
+    last_of_month = first_of_month.replace(day=monthrange(year, month)[1])
+    first_day = first_of_month + timedelta(
+        days=(weekday - first_of_month.weekday()) % 7
+    )
+    dates = tuple(
+        first_day + timedelta(weeks=week)
+        for week in range((last_of_month - first_day).days // 7 + 1)
+    )
+    first_week = week_index(first_of_month.toordinal())
+    return MonthWeekdayTable(
+        dates=dates,
+        first_week=date.fromordinal(week_start(first_week)),
+        weeks=week_index(last_of_month.toordinal()) - first_week + 1,
+        weeks_with_day=week_index(dates[-1].toordinal()) - first_week + 1,
+    )
+
+
+def month_table_cache_info() -> dict[str, int]:
+    """Return hit/miss counters of the month lookup tables."""
+    info = month_weekday_table.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize or 0,
+    }
+
+
+class Trace(Protocol):
+    """Recorder of the schedule derivation steps (see tracing.ChoreTrace)."""
+
+    def record(self, event: str, **data: Any) -> None:
+        """Record a step of the schedule derivation."""
+
+
+class UpdateContext:
+    """Clock snapshot of one refresh pass, shared by the chores it refreshes.
+
+    Every date calculated in the pass agrees on today, also across midnight,
+    and the start dates of each recurrence are only calculated once.
+    """
+
+    __slots__ = "now", "today", "start_dates", "schedule_start_dates"
+
+    def __init__(self, now: datetime) -> None:
+        """Take the snapshot."""
+        self.now = now
+        self.today = now.date()
+        # Recurrence -> (revision, date), recalculated once the revision changed
+        self.start_dates: dict[Recurrence, tuple[int, date]] = {}
+        self.schedule_start_dates: dict[Recurrence, tuple[int, date]] = {}
+
+
+class Overrides(NamedTuple):
+    """Manual changes layered on a base schedule, by date ordinal."""
+
+    add_dates: Set[int] = frozenset()
+    remove_dates: Set[int] = frozenset()
+    offset_dates: Mapping[int, int] = MappingProxyType({})
+
+
+class Recurrence:
+    """Base schedule of a chore, calculated from its options.
+
+    The options are those of the chore config entry. Today is taken from the
+    clock, and the schedule also depends on when the chore was last
+    completed. Extended by each frequency class.
+    """
+
+    __slots__ = (
+        "name",
+        "clock",
+        "trace",
+        "_last_completed",
+        "_revision",
+        "_first_month",
+        "_last_month",
+        "_forecast_dates",
+        "_frequency",
+        "_start_date",
+    )
+
+    def __init__(
+        self,
+        options: Mapping[str, Any],
+        clock: Clock = local_now,
+        name: str | None = None,
+    ) -> None:
+        """Read the options."""
+        self.name = name
+        self.clock = clock
+        self._last_completed: datetime | None = None
+        # Changed with the options or last completion, the start dates with it
+        self._revision = 0
+        # Schedule derivation trace, only while tracing is enabled
+        self.trace: Trace | None = None
+        self.load_options(options)
+
+    @property
+    def last_completed(self) -> datetime | None:
+        """Return when the chore was last completed."""
+        return self._last_completed
+
+    @last_completed.setter
+    def last_completed(self, last_completed: datetime | None) -> None:
+        """Set when the chore was last completed."""
+        self._last_completed = last_completed
+        self._revision += 1
+
+    def snapshot(self) -> UpdateContext:
+        """Read the clock, for calculations not part of a refresh pass."""
+        return UpdateContext(self.clock())
+
+    def load_options(self, options: Mapping[str, Any]) -> None:
+        """Read the recurrence options - extended by each frequency class."""
+        self._revision += 1
+        months = [m["value"] for m in const.MONTH_OPTIONS]
+        first_month = options.get(const.CONF_FIRST_MONTH, const.DEFAULT_FIRST_MONTH)
+        self._first_month: int = (
+            months.index(first_month) + 1 if first_month in months else 1
+        )
+        last_month = options.get(const.CONF_LAST_MONTH, const.DEFAULT_LAST_MONTH)
+        self._last_month: int = (
+            months.index(last_month) + 1 if last_month in months else 12
+        )
+        self._forecast_dates: int = options.get(const.CONF_FORECAST_DATES) or 0
+        self._frequency: str = options.get(const.CONF_FREQUENCY)
+        self._start_date: date | None
+        try:
+            self._start_date = to_date(options.get(const.CONF_START_DATE))
+        except ValueError:
+            self._start_date = None
+
+    def _find_candidate_date(self, day1: date, context: UpdateContext) -> date | None:
+        """Find the next possible date starting from day1.
+
+        Only based on calendar, not looking at include/exclude days.
+        Must be implemented for each child class.
+        """
+        raise NotImplementedError
+
+    def _find_candidate_ordinal(self, day1: int, context: UpdateContext) -> int | None:
+        """Find the next possible date ordinal starting from the day1 ordinal.
+
+        The schedule works on date ordinals. Child classes doing plain day
+        arithmetic override this, calendar based ones only _find_candidate_date.
+        """
+        candidate = self._find_candidate_date(date.fromordinal(day1), context)
+        return None if candidate is None else candidate.toordinal()
+
+    def date_inside(self, dat: date) -> bool:
+        """Check if the date is inside first and last date."""
+        month = dat.month
+        if self._first_month <= self._last_month:
+            return bool(self._first_month <= month <= self._last_month)
+        return bool(self._first_month <= month or month <= self._last_month)
+
+    def move_to_range(self, day: date) -> date:
+        """If the date is not in range, move to the range."""
+        if not self.date_inside(day):
+            year = day.year
+            month = day.month
+            months = [m["label"] for m in const.MONTH_OPTIONS]
+            if self._first_month <= self._last_month < month:
+                LOGGER.debug(
+                    "(%s) %s outside the range, looking from %s next year",
+                    self.name,
+                    day,
+                    months[self._first_month - 1],
+                )
+                return date(year + 1, self._first_month, 1)
+            LOGGER.debug(
+                "(%s) %s outside the range, searching from %s",
+                self.name,
+                day,
+                months[self._first_month - 1],
+            )
+            return date(year, self._first_month, 1)
+        return day
+
+    def base_candidates(
+        self, context: UpdateContext | None = None
+    ) -> Generator[int, None, None]:
+        """Generate the date ordinals of the recurrence, before overrides."""
+        if context is None:
+            context = self.snapshot()
+        trace = self.trace
+        start = self.start_date(context).toordinal()
+        if trace is not None:
+            trace.record(
+                "start",
+                start_date=date.fromordinal(start),
+                forecast_dates=int(self._forecast_dates),
+            )
+        for _ in range(int(self._forecast_dates) + 1):
+            try:
+                candidate = self._find_candidate_ordinal(start, context)
+            except (TypeError, ValueError) as error:
+                if trace is not None:
+                    trace.record("error", error=str(error))
+                break
+            if candidate is None:
+                break
+            next_due_date = date.fromordinal(candidate)
+            if (new_date := self.move_to_range(next_due_date)) != next_due_date:
+                if trace is not None:
+                    trace.record("range", date=next_due_date, moved_to=new_date)
+                start = new_date.toordinal()
+            else:
+                if trace is not None:
+                    trace.record("candidate", date=next_due_date)
+                yield candidate
+                start = candidate + 1  # look from the next day
+
+    def apply_overrides(
+        self, base: Iterable[int], overrides: Overrides, horizon: int = END_OF_TIME
+    ) -> array[int]:
+        """Layer the removed, offset and added dates on a base schedule.
+
+        Returns the sorted due date ordinals up to the horizon.
+        """
+        if (trace := self.trace) is not None:
+            base = list(base)
+            _trace_overrides(trace, base, overrides, horizon)
+        offset_dates = overrides.offset_dates
+        remove_dates = overrides.remove_dates
+        due_dates = [
+            due_date
+            for candidate in base
+            if candidate not in remove_dates
+            and (due_date := candidate + offset_dates.get(candidate, 0)) <= horizon
+        ]
+        due_dates.extend(x for x in overrides.add_dates if x <= horizon)
+        due_dates.sort()
+        return array("i", due_dates)
+
+    def forecast(self, context: UpdateContext | None = None) -> Forecast:
+        """Start a forecast of the recurrence, to be extended on demand."""
+        if context is None:
+            context = self.snapshot()
+        return Forecast(self, self.key(context), context)
+
+    def forecast_due_dates(
+        self,
+        forecast: Forecast,
+        overrides: Overrides = Overrides(),
+        until: int | None = None,
+        context: UpdateContext | None = None,
+    ) -> tuple[array[int], int]:
+        """Extend a forecast past until (to the end if None) and apply overrides.
+
+        Returns the due date ordinals, and the horizon up to which they are
+        complete: offsets move dates back by up to shift days, so a date not
+        generated yet can still land shift days before the last one.
+        """
+        shift = max(0, -min(overrides.offset_dates.values(), default=0))
+        forecast.extend(None if until is None else until + shift, context)
+        base = forecast.dates[:]
+        if forecast.done:
+            horizon = END_OF_TIME
+        elif base:
+            horizon = base[-1] - shift
+        else:
+            horizon = 0
+        return self.apply_overrides(base, overrides, horizon), horizon
+
+    def forecast_next_due_dates(
+        self,
+        forecast: Forecast,
+        overrides: Overrides = Overrides(),
+        context: UpdateContext | None = None,
+    ) -> tuple[array[int], int]:
+        """Extend a forecast just until the next due date is known.
+
+        That is the first due date from the start date, or the one after if
+        it is today and could already be done.
+        """
+        if context is None:
+            context = self.snapshot()
+        until = max(self.start_date(context).toordinal(), context.today.toordinal())
+        while True:
+            due_dates, horizon = self.forecast_due_dates(
+                forecast, overrides, until, context
+            )
+            if self.next_due_date_known(due_dates, horizon, context) or (
+                horizon <= until
+            ):
+                return due_dates, horizon
+            until = horizon + 1
+
+    def next_due_date_known(
+        self, due_dates: array[int], horizon: int, context: UpdateContext | None = None
+    ) -> bool:
+        """Check if due dates complete up to the horizon tell the next due date."""
+        if horizon == END_OF_TIME:
+            return True
+        if context is None:
+            context = self.snapshot()
+        today = context.today.toordinal()
+        index = bisect_left(due_dates, self.start_date(context).toordinal())
+        if index == len(due_dates):
+            return False
+        if due_dates[index] != today:
+            return True
+        # Due today, so the date after today is needed (today can be listed twice)
+        return bisect_right(due_dates, today, index) < len(due_dates)
+
+    def key(self, context: UpdateContext | None = None) -> tuple | None:
+        """Return a key equal for recurrences whose base schedule is the same.
+
+        Chores differing only in name, people or overrides share a key, so
+        their base schedule is calculated once. None if it cannot be shared,
+        or is traced (the trace records the chore's own derivation).
+        """
+        if self.trace is not None:
+            return None
+        if context is None:
+            context = self.snapshot()
+        try:
+            schedule_start = self.schedule_start_date(context)
+            start = self.start_date(context)
+        except TypeError:
+            return None
+        today = context.today
+        return (
+            type(self).__name__,
+            self._frequency,
+            self._options_key(),
+            int(self._forecast_dates),
+            self._first_month,
+            self._last_month,
+            schedule_start,
+            start,
+            today,
+            self.last_completed is not None and self.last_completed.date() == today,
+        )
+
+    def _options_key(self) -> tuple:
+        """Return the frequency-specific options - extended by each class."""
+        return ()
+
+    def calculate_day1(
+        self,
+        day1: date,
+        schedule_start_date: date,
+        context: UpdateContext | None = None,
+    ) -> date:
+        """Calculate day1."""
+        if schedule_start_date is None:
+            raise TypeError(f"({self.name}) No schedule start date")
+        return date.fromordinal(
+            self._calculate_day1_ordinal(
+                day1.toordinal(),
+                schedule_start_date.toordinal(),
+                self.snapshot() if context is None else context,
+            )
+        )
+
+    def _calculate_day1_ordinal(
+        self, day1: int, schedule_start: int, context: UpdateContext
+    ) -> int:
+        """Calculate day1, as a date ordinal."""
+        day1 = max(day1, self.start_date(context).toordinal(), schedule_start)
+        today = context.today
+        if (
+            day1 == today.toordinal()
+            and self.last_completed is not None
+            and self.last_completed.date() == today
+        ):
+            day1 += 1
+        return day1
+
+    def start_date(self, context: UpdateContext | None = None) -> date:
+        """Return the start date, calculated once per refresh pass."""
+        if context is None:
+            context = self.snapshot()
+        memo = context.start_dates.get(self)
+        if memo is None or memo[0] != self._revision:
+            memo = self._revision, self._calculate_start_date(context.today)
+            context.start_dates[self] = memo
+        return memo[1]
+
+    def schedule_start_date(self, context: UpdateContext | None = None) -> date:
+        """Return the schedule start date, calculated once per refresh pass."""
+        if context is None:
+            context = self.snapshot()
+        memo = context.schedule_start_dates.get(self)
+        if memo is None or memo[0] != self._revision:
+            memo = self._revision, self._calculate_schedule_start_date()
+            context.schedule_start_dates[self] = memo
+        return memo[1]
+
+    def _calculate_start_date(self, today: date) -> date:
+        """Calculate start date based on the last completed date."""
+
+        start_date = (
+            self._start_date
+            if self._start_date is not None
+            else date(today.year - 1, 1, 1)
+        )
+
+        if self.last_completed is not None:
+            last_completed = self.last_completed.date()
+
+            if last_completed > start_date:
+                start_date = last_completed
+            elif last_completed == start_date:
+                start_date += timedelta(days=1)
+
+        return self.move_to_range(start_date)
+
+    def _calculate_schedule_start_date(self) -> date:
+        """Calculate start date for scheduling offsets."""
+
+        after = self._frequency[:6] == "after-"
+        start_date = self._start_date
+
+        if after and self.last_completed is not None:
+            earliest_date = self._add_period_offset(self.last_completed.date())
+
+            if earliest_date > start_date:
+                start_date = earliest_date
+
+        return start_date
+
+    def _add_period_offset(self, start_date: date) -> date:
+        return start_date + timedelta(days=1)
+
+
+def _trace_overrides(
+    trace: Trace, base: list[int], overrides: Overrides, horizon: int
+) -> None:
+    """Record the overrides applied to a base schedule."""
+    trace.record(
+        "overrides",
+        horizon=None if horizon == END_OF_TIME else date.fromordinal(horizon),
+    )
+    for candidate in base:
+        if candidate in overrides.remove_dates:
+            trace.record("removed", date=date.fromordinal(candidate))
+        elif (offset := overrides.offset_dates.get(candidate)) is not None:
+            trace.record(
+                "offset",
+                date=date.fromordinal(candidate),
+                offset=offset,
+                moved_to=date.fromordinal(candidate + offset),
+            )
+    for add_date in sorted(overrides.add_dates):
+        if add_date <= horizon:
+            trace.record("added", date=date.fromordinal(add_date))
+
+
+class DailyRecurrence(Recurrence):
+    """Every n days."""
+
+    __slots__ = ("_period",)
+
+    def load_options(self, options: Mapping[str, Any]) -> None:
+        """Read parameters specific for Daily Chore Frequency."""
+        super().load_options(options)
+        self._period = options.get(const.CONF_PERIOD)
+
+    def _options_key(self) -> tuple:
+        return (self._period,)
+
+    def _add_period_offset(self, start_date: date) -> date:
+        return start_date + timedelta(days=self._period)
+
+    def _find_candidate_date(self, day1: date, context: UpdateContext) -> date | None:
+        """Calculate possible date, for every-n-days and after-n-days frequency."""
+        candidate = self._find_candidate_ordinal(day1.toordinal(), context)
+        return None if candidate is None else date.fromordinal(candidate)
+
+    def _find_candidate_ordinal(self, day1: int, context: UpdateContext) -> int | None:
+        """Calculate possible date ordinal, for every-n-days and after-n-days."""
+        try:
+            schedule_start = self.schedule_start_date(context).toordinal()
+            day1 = self._calculate_day1_ordinal(day1, schedule_start, context)
+            remainder = (day1 - schedule_start) % self._period  # type: ignore
+        except (AttributeError, TypeError) as error:
+            raise ValueError(
+                f"({self.name}) Please configure start_date and period "
+                "for every-n-days or after-n-days chore frequency."
+            ) from error
+        if remainder == 0:
+            return day1
+        return day1 + self._period - remainder
+
+
+class WeeklyRecurrence(Recurrence):
+    """Every n weeks, odd weeks or even weeks."""
+
+    __slots__ = "_chore_day", "_first_week", "_period"
+
+    def load_options(self, options: Mapping[str, Any]) -> None:
+        """Read parameters specific for Weekly Chore Frequency."""
+        super().load_options(options)
+        self._chore_day = options.get(const.CONF_CHORE_DAY, None)
+        self._period: int = options.get(const.CONF_PERIOD, 1)
+        self._first_week: int = options.get(const.CONF_FIRST_WEEK, 1)
+
+    def _options_key(self) -> tuple:
+        return self._chore_day, self._period, self._first_week
+
+    def _add_period_offset(self, start_date: date) -> date:
+        return start_date + timedelta(weeks=self._period)
+
+    def _find_candidate_date(self, day1: date, context: UpdateContext) -> date | None:
+        """Calculate possible date, for weekly frequency."""
+        candidate = self._find_candidate_ordinal(day1.toordinal(), context)
+        return None if candidate is None else date.fromordinal(candidate)
+
+    def _find_candidate_ordinal(self, day1: int, context: UpdateContext) -> int | None:
+        """Calculate possible date ordinal, for weekly frequency.
+
+        Weeks are counted from a fixed Monday, so the period also holds across
+        years with 53 ISO weeks.
+        """
+        start_date = self.schedule_start_date(context)
+        start = start_date.toordinal()
+        day1 = self._calculate_day1_ordinal(day1, start, context)
+        if self._chore_day is not None:
+            day_index = WEEKDAYS.index(self._chore_day)
+        else:  # if chore day is not set, just repeat the start date's day
+            day_index = start_date.weekday()
+
+        week = week_index(day1)
+        if day_index < weekday(day1):  # Chore day already passed this week
+            week += 1
+        week += (week_index(start) - week) % self._period
+        return week_start(week) + day_index
+
+
+class MonthlyRecurrence(Recurrence):
+    """Every nth weekday of each month."""
+
+    __slots__ = (
+        "_day_of_month",
+        "_chore_day",
+        "_monthly_force_week_numbers",
+        "_period",
+        "_weekday_order_number",
+        "_week_order_number",
+        "_due_date_offset",
+    )
+
+    def load_options(self, options: Mapping[str, Any]) -> None:
+        """Read parameters specific for Monthly Chore Frequency."""
+        super().load_options(options)
+        day_of_month = options.get(const.CONF_DAY_OF_MONTH)
+        self._day_of_month: int | None = (
+            int(day_of_month) if day_of_month is not None and day_of_month > 0 else None
+        )
+        self._chore_day = options.get(const.CONF_CHORE_DAY, None)
+        self._monthly_force_week_numbers = options.get(
+            const.CONF_FORCE_WEEK_NUMBERS, False
+        )
+        self._due_date_offset = int(options.get(const.CONF_DUE_DATE_OFFSET, 0))
+        self._weekday_order_number: int | None
+        self._week_order_number: int | None
+        order_number: int = 1
+        if const.CONF_WEEKDAY_ORDER_NUMBER in options:
+            order_number = int(options[const.CONF_WEEKDAY_ORDER_NUMBER])
+        if self._monthly_force_week_numbers:
+            self._weekday_order_number = None
+            self._week_order_number = order_number
+        else:
+            self._weekday_order_number = order_number
+            self._week_order_number = None
+        self._period = options.get(const.CONF_PERIOD, 1)
+
+    @staticmethod
+    def nth_week_date(week_number: int, date_of_month: date, chore_day: int) -> date:
+        """Find weekday in the nth week of the month."""
+        table = month_weekday_table(date_of_month.year, date_of_month.month, chore_day)
+        actual_week_number = (
+            week_number if week_number > 0 else max(table.weeks + week_number + 1, 1)
+        )
+        return table.first_week + timedelta(
+            days=chore_day + (actual_week_number - 1) * 7
+        )
+
+    @staticmethod
+    def nth_weekday_date(
+        weekday_number: int, date_of_month: date, chore_day: int
+    ) -> date:
+        """Find nth weekday of the month."""
+        table = month_weekday_table(date_of_month.year, date_of_month.month, chore_day)
+        if weekday_number > 0:
+            return table.dates[0] + timedelta(weeks=weekday_number - 1)
+        actual_weekday_number = max(table.weeks_with_day + weekday_number + 1, 1)
+        return table.first_week + timedelta(
+            days=chore_day + (actual_weekday_number - 1) * 7
+        )
+
+    def _month_candidate(self, month: int, start_date: date) -> date:
+        """Calculate the chore date in a month, given as an absolute month index.
+
+        The date can fall into the previous month for the nth week patterns.
+        """
+        if self._chore_day is None:
+            year, month = divmod(month, 12)
+            day_of_month = self._day_of_month or start_date.day
+            if day_of_month > 28:  # every month has the days up to the 28th
+                day_of_month = min(day_of_month, monthrange(year, month + 1)[1])
+            return date(year, month + 1, day_of_month)
+        first_of_month = month_start(month)
+        chore_day = WEEKDAYS.index(self._chore_day)
+        if self._monthly_force_week_numbers:
+            return MonthlyRecurrence.nth_week_date(
+                self._week_order_number, first_of_month, chore_day
+            )
+        return MonthlyRecurrence.nth_weekday_date(
+            self._weekday_order_number, first_of_month, chore_day
+        )
+
+    def _options_key(self) -> tuple:
+        return (
+            self._day_of_month,
+            self._chore_day,
+            self._monthly_force_week_numbers,
+            self._weekday_order_number,
+            self._week_order_number,
+            self._period,
+            self._due_date_offset,
+            # The month after the last completion is skipped
+            None if self.last_completed is None else self.last_completed.month,
+        )
+
+    def _add_period_offset(self, start_date: date) -> date:
+        return start_date + relativedelta(months=self._period)
+
+    def _find_candidate_date(self, day1: date, context: UpdateContext) -> date | None:
+        """Calculate possible date, for monthly frequency.
+
+        Jumps straight to the first month matching the period, counted in
+        absolute months from the schedule start.
+        """
+        schedule_start_date = self.schedule_start_date(context)
+        day1 = self.calculate_day1(day1, schedule_start_date, context)
+        if self.last_completed is not None and self.last_completed.month == day1.month:
+            day1 = month_start(month_index(day1) + 1)
+        period = self._period or 1
+        month = month_index(day1)
+        if (
+            self._chore_day is None
+            and self._due_date_offset >= 0
+            and day1.day > (self._day_of_month or schedule_start_date.day)
+        ):
+            month += 1  # the day of the month already passed this month
+        month += (month_index(schedule_start_date) - month) % period
+        # The due date, offset back, must not fall before day1 either
+        earliest = day1
+        if self._due_date_offset < 0:
+            earliest -= timedelta(days=self._due_date_offset)
+        candidate_date = self._month_candidate(month, schedule_start_date)
+        while candidate_date < earliest:  # already passed, try the next viable month
+            month += period
+            candidate_date = self._month_candidate(month, schedule_start_date)
+
+        if self._due_date_offset:
+            candidate_date += timedelta(days=self._due_date_offset)
+
+        return candidate_date
+
+
+class YearlyRecurrence(Recurrence):
+    """Every year."""
+
+    __slots__ = (
+        "_period",
+        "_date",
+    )
+
+    def load_options(self, options: Mapping[str, Any]) -> None:
+        """Read parameters specific for Yearly Chore Frequency."""
+        super().load_options(options)
+        self._period = options.get(const.CONF_PERIOD, 1)
+        due_date = options.get(const.CONF_DATE, None)
+        self._date = due_date if due_date is not None and due_date != "0" else None
+
+    def _options_key(self) -> tuple:
+        return self._period, self._date
+
+    def _add_period_offset(self, start_date: date) -> date:
+        return start_date + relativedelta(years=self._period)
+
+    def _find_candidate_date(self, day1: date, context: UpdateContext) -> date | None:
+        """Calculate possible date, for yearly frequency."""
+        start_date = self.schedule_start_date(context)
+        day1 = self.calculate_day1(day1, start_date, context)
+        conf_date = self._date
+        if conf_date is None or conf_date == "":
+            conf_date = start_date
+        else:
+            conf_date = datetime.strptime(conf_date, "%m/%d")
+        candidate_date = date(day1.year, conf_date.month, conf_date.day)
+        if candidate_date < day1:
+            candidate_date = date(day1.year + 1, conf_date.month, conf_date.day)
+        difference = abs(candidate_date.year - start_date.year)
+        if difference > 0:
+            remainder = difference % self._period
+            if remainder > 0:
+                candidate_date = date(
+                    int(candidate_date.year + (self._period - remainder)),
+                    candidate_date.month,
+                    candidate_date.day,
+                )
+        return candidate_date
+
+
+class BlankRecurrence(Recurrence):
+    """No due dates - the chore is scheduled manually."""
+
+    __slots__ = ()
+
+    def _find_candidate_date(self, day1: date, context: UpdateContext) -> date | None:
+        """Do not return any date for blank frequency."""
+        return None
+
+    def forecast_due_dates(
+        self,
+        forecast: Forecast,
+        overrides: Overrides = Overrides(),
+        until: int | None = None,
+        context: UpdateContext | None = None,
+    ) -> tuple[array[int], int]:
+        """Do not forecast any date for blank frequency."""
+        return array("i"), END_OF_TIME
+
+    def key(self, context: UpdateContext | None = None) -> tuple | None:
+        """Do not share the (empty) schedule."""
+        return None
+
+
+RECURRENCES: dict[str, type[Recurrence]] = {
+    "every-n-days": DailyRecurrence,
+    "every-n-weeks": WeeklyRecurrence,
+    "every-n-months": MonthlyRecurrence,
+    "every-n-years": YearlyRecurrence,
+    "after-n-days": DailyRecurrence,
+    "after-n-weeks": WeeklyRecurrence,
+    "after-n-months": MonthlyRecurrence,
+    "after-n-years": YearlyRecurrence,
+    "blank": BlankRecurrence,
+}
+
+
+def create(
+    options: Mapping[str, Any], clock: Clock = local_now, name: str | None = None
+) -> Recurrence:
+    """Return the recurrence of the frequency in the options."""
+    frequency = options.get(const.CONF_FREQUENCY)
+    if frequency not in RECURRENCES:
+        raise ValueError(f"({name}) Unknown frequency {frequency}")
+    return RECURRENCES[frequency](options, clock, name)
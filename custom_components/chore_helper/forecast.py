@@ -0,0 +1,7 @@
+"""The schedule engine's forecast module, under its former name."""
+
+import sys
+
+from .engine import forecast
+
+sys.modules[__name__] = forecast
@@ -3,6 +3,7 @@
 # Borrowed from Garbage Collection integration.
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date, datetime
 from typing import Any
 
@@ -16,22 +17,18 @@ def now() -> datetime:
     return dt_util.now()
 
 
-def to_date(day: Any) -> date:
-    """Convert datetime or text to date, if not already datetime.
+def parse_datetime(text: str) -> datetime | None:
+    """Parse text to datetime object.
 
-    Used for the first date for every_n_days (configured as text).
+    Restored states hold ISO dates, so try the strict (and much faster) ISO
+    parser first, and dateutil only for other formats.
     """
-    if day is None:
-        raise ValueError
-    if isinstance(day, date):
-        return day
-    if isinstance(day, datetime):
-        return day.date()
-    return date.fromisoformat(day)
-
-
-def parse_datetime(text: str) -> datetime | None:
-    """Parse text to datetime object."""
+    if not isinstance(text, str):
+        return None
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
     try:
         return parse(text)
     except (ParserError, TypeError):
@@ -49,6 +46,48 @@ def dates_to_texts(dates: list[date]) -> list[str]:
     return converted
 
 
+def text_to_ordinals(text: str | None) -> set[int]:
+    """Parse space separated ISO dates (add_dates/remove_dates) to date ordinals."""
+    ordinals: set[int] = set()
+    for record in (text or "").split():
+        try:
+            ordinals.add(date.fromisoformat(record).toordinal())
+        except ValueError:
+            continue
+    return ordinals
+
+
+def ordinals_to_text(ordinals: Iterable[int]) -> str | None:
+    """Convert date ordinals to space separated ISO dates."""
+    return (
+        " ".join(date.fromordinal(ordinal).isoformat() for ordinal in sorted(ordinals))
+        or None
+    )
+
+
+def text_to_offsets(text: str | None) -> dict[int, int]:
+    """Parse space separated "date:offset" pairs (offset_dates) by date ordinal."""
+    offsets: dict[int, int] = {}
+    for record in (text or "").split():
+        try:
+            day, offset = record.split(":")
+            offsets[date.fromisoformat(day).toordinal()] = int(offset)
+        except ValueError:
+            continue
+    return offsets
+
+
+def offsets_to_text(offsets: dict[int, int]) -> str | None:
+    """Convert date offsets by ordinal to space separated "date:offset" pairs."""
+    return (
+        " ".join(
+            f"{date.fromordinal(ordinal).isoformat()}:{offsets[ordinal]}"
+            for ordinal in sorted(offsets)
+        )
+        or None
+    )
+
+
 def time_text(value: Any) -> str:
     """Have to store time as text - datetime is not JSON serializable."""
     if value is None or value == "":
@@ -0,0 +1,99 @@
+"""Reverse index of the chores each person is responsible for."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .chore import Chore
+
+
+class PersonIndex:
+    """Chores of each person, with cached per-person summaries.
+
+    Chores re-index themselves when their assignment or state changes, so
+    summarising the chores of a person only looks at that person's chores,
+    and only once until one of them changes.
+    """
+
+    __slots__ = "_chores", "_people", "_summaries"
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # Person entity ID -> chore entities it is responsible for
+        self._chores: dict[str, dict[str, Chore]] = {}
+        # Chore entity ID -> people responsible for it
+        self._people: dict[str, frozenset[str]] = {}
+        # Person entity ID -> their chores and cached summary
+        self._summaries: dict[str, tuple[list[Chore], dict[str, Any]]] = {}
+
+    def update(self, chore: Chore) -> None:
+        """Re-index the people responsible for a chore."""
+        old = self._people.get(chore.entity_id, frozenset())
+        new = chore.responsible_people
+        for person in old - new:
+            chores = self._chores[person]
+            del chores[chore.entity_id]
+            if not chores:
+                del self._chores[person]
+        for person in new:
+            self._chores.setdefault(person, {})[chore.entity_id] = chore
+        if new:
+            self._people[chore.entity_id] = new
+        else:
+            self._people.pop(chore.entity_id, None)
+        for person in old | new:
+            self._summaries.pop(person, None)
+
+    def remove(self, entity_id: str) -> None:
+        """Drop a removed chore from the index."""
+        for person in self._people.pop(entity_id, frozenset()):
+            chores = self._chores[person]
+            del chores[entity_id]
+            if not chores:
+                del self._chores[person]
+            self._summaries.pop(person, None)
+
+    def summary(self, person: str) -> dict[str, Any]:
+        """Return the chores of a person, with due today, overdue and next due.
+
+        The summary is a new dict each call. The names of the assigned people
+        are read from their current state, everything else is cached.
+        """
+        if (cached := self._summaries.get(person)) is None:
+            cached = self._summaries[person] = self._summarise(person)
+        chores, summary = cached
+        return {
+            **summary,
+            "chores": [
+                {**entry, "assigned_to_name": chore.assigned_to_name}
+                for chore, entry in zip(chores, summary["chores"])
+            ],
+        }
+
+    def _summarise(self, person: str) -> tuple[list[Chore], dict[str, Any]]:
+        """Return the chores of a person and their summary, for the cache."""
+        chores = [chore for _, chore in sorted(self._chores.get(person, {}).items())]
+        due_dates = [
+            chore.next_due_date for chore in chores if chore.next_due_date is not None
+        ]
+        return chores, {
+            "chores": [_chore_entry(chore) for chore in chores],
+            "due_today": sum(1 for chore in chores if chore.days == 0),
+            "overdue": sum(1 for chore in chores if chore.overdue),
+            "next_due_date": str(min(due_dates)) if due_dates else None,
+        }
+
+
+def _chore_entry(chore: Chore) -> dict[str, Any]:
+    """Describe a chore of a person, but for the name of the assigned person."""
+    entry = {
+        "entity_id": chore.entity_id,
+        "name": chore.name,
+        "next_due_date": str(chore.next_due_date) if chore.next_due_date else None,
+        "days": chore.days,
+        "allocation_mode": chore.allocation_mode,
+    }
+    if chore.allocation_mode != "shared":
+        entry["assigned_to"] = chore.assigned_to
+    return entry
@@ -0,0 +1,7 @@
+"""The schedule engine's recurrence module, under its former name."""
+
+import sys
+
+from .engine import recurrence
+
+sys.modules[__name__] = recurrence
@@ -0,0 +1,92 @@
+"""Chore schedules persisted across restarts."""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from . import const
+from .engine.forecast import END_OF_TIME
+
+if TYPE_CHECKING:
+    from .chore import Chore
+    from .engine.recurrence import UpdateContext
+
+# Seconds to wait for more changes before writing the cache
+SAVE_DELAY = 30
+
+
+class ScheduleCache:
+    """Due dates of each chore, keyed by a hash of everything they depend on.
+
+    Chores whose key did not change since the last run come up with their
+    schedule loaded, without recalculating it. The key holds the day, so the
+    schedules are only reused on the day they were calculated.
+    """
+
+    __slots__ = "_store", "_schedules"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, const.STORAGE_VERSION, const.STORAGE_KEY
+        )
+        self._schedules: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load cached schedules from storage."""
+        if (data := await self._store.async_load()) is not None:
+            self._schedules = data
+
+    def get(
+        self, chore: Chore, context: UpdateContext | None = None
+    ) -> tuple[array[int], int] | None:
+        """Return cached due date ordinals of the chore and their horizon.
+
+        None if the chore changed since they were cached, or they were cached
+        on another day.
+        """
+        if (entry := self._schedules.get(chore.unique_id)) is None:
+            return None
+        if entry["key"] != chore.schedule_key(context):
+            return None
+        # Schedules cached before forecasts were lazy are complete
+        return array("i", entry["due_dates"]), entry.get("horizon", END_OF_TIME)
+
+    @callback
+    def async_set(
+        self,
+        chore: Chore,
+        due_dates: array[int],
+        horizon: int,
+        context: UpdateContext | None = None,
+    ) -> None:
+        """Cache due date ordinals of the chore, complete up to the horizon."""
+        key = chore.schedule_key(context)
+        entry = self._schedules.get(chore.unique_id)
+        if (
+            entry is not None
+            and entry["key"] == key
+            and entry.get("horizon", END_OF_TIME) >= horizon
+        ):
+            return
+        self._schedules[chore.unique_id] = {
+            "key": key,
+            "due_dates": due_dates.tolist(),
+            "horizon": horizon,
+        }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_remove(self, unique_id: str) -> None:
+        """Drop the cached schedule of a removed chore."""
+        if self._schedules.pop(unique_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return data of the cache to store in a file."""
+        return self._schedules
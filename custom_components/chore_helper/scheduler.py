@@ -0,0 +1,348 @@
+"""Integration-wide scheduler waking chores when their state can change."""
+
+from __future__ import annotations
+
+import asyncio
+from array import array
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_point_in_time,
+    async_track_time_change,
+)
+from homeassistant.helpers.start import async_at_started
+
+from . import const, helpers
+from .const import LOGGER
+from .engine.forecast import Forecast
+from .engine.recurrence import UpdateContext
+
+if TYPE_CHECKING:
+    from .chore import Chore
+
+    # Due date ordinals, the horizon they are complete to, and their forecast
+    Schedule = tuple[array[int], int, Forecast | None]
+
+
+class ChoreScheduler:
+    """Refresh chores at local midnight, at due-time expiry and on changes.
+
+    Replaces per-entity polling: chore sensors do not poll, and state is only
+    written for chores whose days, overdue or next due date actually changed.
+
+    Each pass reads the clock once, into an UpdateContext shared by all the
+    chores it refreshes. Schedules not found in the schedule cache are
+    calculated, in executor mode in one executor job, and applied back on the
+    event loop in a single batch. Chores with the same recurrence share one
+    forecast per day, with their own overrides layered on top; forecasts are
+    only generated up to the next due dates, and extended when the calendar
+    looks further.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_mode",
+        "_lock",
+        "_schedules",
+        "_unsub_midnight",
+        "_unsub_expiry",
+        "_unsub_started",
+        "_expiry",
+    )
+
+    def __init__(
+        self, hass: HomeAssistant, mode: str = const.DEFAULT_SCHEDULE_MODE
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._mode = mode
+        self._lock = asyncio.Lock()
+        # Recurrence key -> forecast, shared by chores with that key
+        self._schedules: dict[tuple, Forecast] = {}
+        self._unsub_midnight: CALLBACK_TYPE | None = None
+        self._unsub_expiry: CALLBACK_TYPE | None = None
+        self._unsub_started: CALLBACK_TYPE | None = None
+        # When the armed expiry wake-up fires
+        self._expiry: datetime | None = None
+
+    @property
+    def chores(self) -> list[Chore]:
+        """Return all registered chore entities."""
+        return list(self._hass.data[const.DOMAIN][const.SENSOR_PLATFORM].values())
+
+    @callback
+    def async_start(self) -> None:
+        """Start waking at local midnight, and refresh once HA has started."""
+        self._unsub_midnight = async_track_time_change(
+            self._hass, self._async_midnight, hour=0, minute=0, second=0
+        )
+        self._unsub_started = async_at_started(self._hass, self._async_started)
+        self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
+    @callback
+    def _async_handle_stop(self, _: Event) -> None:
+        """Stop the scheduler when HA stops."""
+        self.async_stop()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel all scheduled wake-ups."""
+        for unsub in (self._unsub_midnight, self._unsub_expiry, self._unsub_started):
+            if unsub is not None:
+                unsub()
+        self._unsub_midnight = None
+        self._unsub_expiry = None
+        self._unsub_started = None
+        self._expiry = None
+
+    async def _async_started(self, _: HomeAssistant) -> None:
+        """Load all chores once HA is running (updates are skipped before)."""
+        self._unsub_started = None
+        await self.async_refresh(force=True)
+
+    async def _async_midnight(self, _: datetime) -> None:
+        """Day rollover - reload every chore."""
+        LOGGER.debug("Day rollover, refreshing chores")
+        # Keys hold the day, so the base schedules of yesterday are never used
+        self._schedules = {}
+        await self.async_refresh()
+
+    async def _async_expired(self, _: datetime) -> None:
+        """Due time of chores due today has passed - recalculate their state."""
+        self._unsub_expiry = None
+        self._expiry = None
+        async with self._lock:
+            context = UpdateContext(helpers.now())
+            for chore in self.chores:
+                # Manually updated chores are left to the update_state service,
+                # and as polling did, only chores completed today move on:
+                # others due today stay due until midnight makes them overdue
+                if (
+                    chore.manual
+                    or chore.next_due_date != context.today
+                    or not await chore.async_ready_for_update(context)
+                ):
+                    continue
+                before = _snapshot(chore)
+                chore.update_state(context)
+                if _snapshot(chore) != before:
+                    chore.async_write_ha_state()
+        self.async_schedule_expiry(context)
+
+    async def async_refresh(
+        self, chores: Iterable[Chore] | None = None, force: bool = False
+    ) -> None:
+        """Update chores, writing state of those whose values changed.
+
+        Refreshing given chores only arms the expiry wake-up for them, so
+        refreshing chores one by one does not scan all the others each time.
+        """
+        async with self._lock:
+            context = UpdateContext(helpers.now())
+            refreshed = self.chores if chores is None else list(chores)
+            pending: list[Chore] = []
+            for chore in refreshed:
+                if await chore.async_ready_for_update(context):
+                    pending.append(chore)
+                elif force:
+                    chore.async_write_ha_state()
+            due_dates = await self._async_compute_due_dates(pending, context)
+            for chore, chore_due_dates in zip(pending, due_dates):
+                before = _snapshot(chore)
+                chore.set_due_dates(*chore_due_dates, context=context)
+                chore.due_dates_loaded(context)
+                if force or _snapshot(chore) != before:
+                    chore.async_write_ha_state()
+        if chores is None:
+            self.async_schedule_expiry(context)
+        else:
+            for chore in refreshed:
+                self.async_schedule_chore_expiry(chore, context)
+
+    def batch(self, reload: bool = True) -> ChoreBatch:
+        """Start a batch of chore changes, see ChoreBatch."""
+        return ChoreBatch(self, reload)
+
+    async def _async_compute_due_dates(
+        self, chores: list[Chore], context: UpdateContext
+    ) -> list[Schedule]:
+        """Return due dates of chores, calculating those not in the cache."""
+        cache = self._hass.data[const.DOMAIN].get(const.SCHEDULE_CACHE)
+        due_dates: list[Schedule | None] = []
+        for chore in chores:
+            # Traced chores derive their schedule, to record how
+            if cache is None or chore.trace is not None:
+                cached = None
+            else:
+                cached = cache.get(chore, context)
+            due_dates.append(None if cached is None else (*cached, None))
+        if misses := [
+            chore
+            for chore, chore_due_dates in zip(chores, due_dates)
+            if chore_due_dates is None
+        ]:
+            # The loaded event lists the whole forecast, only needed if listened
+            full = bool(self._hass.bus.async_listeners().get("chore_helper_loaded"))
+            if self._mode == const.SCHEDULE_MODE_EXECUTOR:
+                computed = await self._hass.async_add_executor_job(
+                    _compute_due_dates, misses, self._schedules, full, context
+                )
+            else:
+                computed = _compute_due_dates(misses, self._schedules, full, context)
+            computed.reverse()
+            due_dates = [
+                computed.pop() if chore_due_dates is None else chore_due_dates
+                for chore_due_dates in due_dates
+            ]
+        return due_dates
+
+    async def _async_flush(
+        self, chores: list[Chore], reload: bool, context: UpdateContext
+    ) -> None:
+        """Recalculate changed chores once and write all their states together."""
+        if reload:
+            due_dates = await self._async_compute_due_dates(chores, context)
+            for chore, chore_due_dates in zip(chores, due_dates):
+                chore.set_due_dates(*chore_due_dates, context=context)
+        for chore in chores:
+            chore.update_state(context)
+        for chore in chores:
+            chore.async_write_ha_state()
+
+    @callback
+    def async_schedule_expiry(self, context: UpdateContext | None = None) -> None:
+        """Wake up when the earliest due date of any chore expires."""
+        if context is None:
+            context = UpdateContext(helpers.now())
+        now = context.now
+        expirations = [
+            expiration
+            for chore in self.chores
+            if not chore.manual
+            and (expiration := chore.expiration(context)) is not None
+            and expiration > now
+        ]
+        self._async_arm_expiry(min(expirations, default=None))
+
+    @callback
+    def async_schedule_chore_expiry(
+        self, chore: Chore, context: UpdateContext | None = None
+    ) -> None:
+        """Wake up when an added chore expires, if before the armed wake-up.
+
+        Unlike async_schedule_expiry, only looks at the one chore, so adding
+        all chores at start-up does not scan all the others each time.
+        """
+        if chore.manual:
+            return
+        if context is None:
+            context = UpdateContext(helpers.now())
+        expiration = chore.expiration(context)
+        if (
+            expiration is None
+            or expiration <= context.now
+            or (self._expiry is not None and self._expiry <= expiration)
+        ):
+            return
+        self._async_arm_expiry(expiration)
+
+    @callback
+    def _async_arm_expiry(self, expiration: datetime | None) -> None:
+        """Replace the expiry wake-up with one at the expiration (if any)."""
+        if expiration == self._expiry and self._unsub_expiry is not None:
+            return
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+        self._expiry = expiration
+        if expiration is not None:
+            self._unsub_expiry = async_track_point_in_time(
+                self._hass, self._async_expired, expiration
+            )
+
+
+def _snapshot(chore: Chore) -> tuple:
+    """Return the chore values whose change warrants a state write."""
+    return chore.days, chore.overdue, chore.next_due_date
+
+
+def _compute_due_dates(
+    chores: list[Chore],
+    schedules: dict[tuple, Forecast],
+    full: bool = False,
+    context: UpdateContext | None = None,
+) -> list[Schedule]:
+    """Calculate due dates of chores - pure date arithmetic, no HA state.
+
+    Forecasts are looked up in, and added to schedules by recurrence key, and
+    generated up to the next due date of each chore (or to the end if full),
+    all in one update context (a snapshot of the clock, if not given).
+    """
+    if context is None:
+        context = UpdateContext(helpers.now())
+    due_dates: list[Schedule] = []
+    for chore in chores:
+        key = chore.recurrence_key(context)
+        forecast = None if key is None else schedules.get(key)
+        if forecast is None or not forecast.valid_in(context):
+            forecast = Forecast(chore.recurrence, key, context)
+            if key is not None:
+                schedules[key] = forecast
+        if full:
+            due_dates.append(
+                (*chore.forecast_due_dates(forecast, context=context), forecast)
+            )
+        else:
+            due_dates.append(
+                (*chore.forecast_next_due_dates(forecast, context), forecast)
+            )
+    return due_dates
+
+
+class ChoreBatch:
+    """Chores changed together, recalculated once and written in one flush.
+
+    Use as an async context manager: chores are mutated and added inside it,
+    and on exit each added chore is recalculated once (the schedules in one
+    go), and all their states are written without yielding in between.
+    Scheduler refreshes wait for the batch to finish.
+    """
+
+    __slots__ = "_scheduler", "_reload", "_chores"
+
+    def __init__(self, scheduler: ChoreScheduler, reload: bool) -> None:
+        """Initialize an empty batch."""
+        self._scheduler = scheduler
+        self._reload = reload
+        self._chores: dict[str, Chore] = {}
+
+    def add(self, chore: Chore) -> None:
+        """Add a changed chore to the batch."""
+        self._chores[chore.entity_id] = chore
+
+    async def __aenter__(self) -> ChoreBatch:
+        """Start changing chores."""
+        await self._scheduler._lock.acquire()  # pylint: disable=protected-access
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        """Recalculate and write the changed chores."""
+        scheduler = self._scheduler
+        context = UpdateContext(helpers.now())
+        chores = list(self._chores.values()) if exc_type is None else []
+        try:
+            if chores:
+                # pylint: disable-next=protected-access
+                await scheduler._async_flush(chores, self._reload, context)
+        finally:
+            scheduler._lock.release()  # pylint: disable=protected-access
+        # A wake-up armed for a chore that moved on finds nothing to do, and
+        # arms the next one: no need to scan all chores after each batch
+        for chore in chores:
+            scheduler.async_schedule_chore_expiry(chore, context)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from importlib import import_module
+import sys
+from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
@@ -10,20 +12,42 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import const
-from .chore_blank import BlankChore
-from .chore_daily import DailyChore
-from .chore_monthly import MonthlyChore
-from .chore_weekly import WeeklyChore
-from .chore_yearly import YearlyChore
 from .const import LOGGER
+from .engine.recurrence import RECURRENCES
 
+if TYPE_CHECKING:
+    from .chore import Chore
+    from .engine.recurrence import Recurrence
 
-SCAN_INTERVAL = timedelta(seconds=10)
-THROTTLE_INTERVAL = timedelta(seconds=60)
+
+def _chore_class(recurrence: type[Recurrence]) -> tuple[str, str]:
+    """Return the module and name of the chore class of a recurrence class."""
+    kind = recurrence.__name__.removesuffix("Recurrence")  # e.g. Daily
+    return f"chore_{kind.lower()}", f"{kind}Chore"
+
+
+# Frequency -> module and name of its chore class. Modules are imported on
+# first use, so only the chore classes actually configured get loaded.
+FREQUENCY_CLASSES: dict[str, tuple[str, str]] = {
+    frequency: _chore_class(recurrence) for frequency, recurrence in RECURRENCES.items()
+}
+
+
+async def async_get_chore_class(hass: HomeAssistant, frequency: str) -> type[Chore]:
+    """Return the chore class of a frequency, importing it off the event loop."""
+    module, name = FREQUENCY_CLASSES[frequency]
+    module = f"{__package__}.{module}"
+    # A module still being imported for another chore is in sys.modules
+    # already: importing it again waits for that import to finish
+    if not hasattr(sys.modules.get(module), name):
+        await hass.async_add_executor_job(import_module, module)
+    return getattr(sys.modules[module], name)
 
 
 async def async_setup_entry(
-    _: HomeAssistant, config_entry: ConfigEntry, async_add_devices: AddEntitiesCallback
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_devices: AddEntitiesCallback,
 ) -> None:
     """Create chore entities defined in config_flow and add them to HA."""
     frequency = config_entry.options.get(const.CONF_FREQUENCY)
@@ -32,19 +56,9 @@ async def async_setup_entry(
         if config_entry.title is not None
         else config_entry.data.get(CONF_NAME)
     )
-    _frequency_function = {
-        "every-n-days": DailyChore,
-        "every-n-weeks": WeeklyChore,
-        "every-n-months": MonthlyChore,
-        "every-n-years": YearlyChore,
-        "after-n-days": DailyChore,
-        "after-n-weeks": WeeklyChore,
-        "after-n-months": MonthlyChore,
-        "after-n-years": YearlyChore,
-        "blank": BlankChore,
-    }
-    if frequency in _frequency_function:
-        async_add_devices([_frequency_function[frequency](config_entry)], True)
+    if frequency in FREQUENCY_CLASSES:
+        chore_class = await async_get_chore_class(hass, frequency)
+        async_add_devices([chore_class(config_entry)], True)
     else:
         LOGGER.error("(%s) Unknown frequency %s", name, frequency)
         raise ValueError
@@ -0,0 +1,48 @@
+"""Structured trace of how chore schedules are derived."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import date, datetime
+from typing import Any
+
+from . import helpers
+
+# Records kept per traced chore
+TRACE_SIZE = 500
+
+
+class ChoreTrace:
+    """Bounded record of the steps deriving the schedule of one chore.
+
+    Chores only hold a trace while tracing is enabled for them, and check
+    for it before recording, so untraced chores pay a single attribute test
+    per step. Records are appended from the event loop and from schedule
+    executor jobs; the oldest are dropped once the buffer is full.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        """Start an empty trace."""
+        self._records: deque[tuple[datetime, str, dict[str, Any]]] = deque(
+            maxlen=size
+        )
+
+    def record(self, event: str, **data: Any) -> None:
+        """Record a step of the schedule derivation."""
+        self._records.append((helpers.now(), event, data))
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the records, oldest first, with dates as ISO strings."""
+        return [
+            {
+                "time": time.isoformat(),
+                "event": event,
+                **{
+                    key: value.isoformat() if isinstance(value, date) else value
+                    for key, value in data.items()
+                },
+            }
+            for time, event, data in list(self._records)
+        ]
@@ -0,0 +1,150 @@
+"""Calculate chore schedules outside Home Assistant, from JSON lines.
+
+Each input line holds the options of one chore, as in its config entry, and
+optionally its state:
+
+    {"id": "bins", "frequency": "every-n-weeks", "chore_day": "mon",
+     "period": 2, "start_date": "2024-01-01", "forecast_dates": 10,
+     "last_completed": "2024-03-04T08:00:00+01:00",
+     "add_dates": ["2024-03-20"], "remove_dates": ["2024-03-18"],
+     "offset_dates": {"2024-04-01": 1}}
+
+For each, a line with its id and due dates (or error) is written out. Chores
+with the same recurrence share one forecast, as in the integration. Only the
+schedule engine is imported, not the integration or Home Assistant, and a
+throughput summary goes to stderr.
+
+Run from the repository root:
+
+    python scripts/schedule.py [--now 2024-03-05T12:00:00+01:00] [--next] \
+        < chores.jsonl > schedules.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, datetime
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from types import ModuleType
+from typing import Any, TextIO
+
+ENGINE = Path(__file__).resolve().parents[1] / "custom_components/chore_helper/engine"
+
+
+def _import_recurrence() -> ModuleType:
+    """Import the schedule engine as a package of its own.
+
+    The engine imports nothing from the integration or Home Assistant, so it
+    is loaded from its directory, without running the integration __init__.
+    """
+    spec = spec_from_file_location(
+        "chore_engine",
+        ENGINE / "__init__.py",
+        submodule_search_locations=[str(ENGINE)],
+    )
+    assert spec is not None and spec.loader is not None
+    package = module_from_spec(spec)
+    sys.modules[spec.name] = package
+    spec.loader.exec_module(package)
+    return import_module(f"{spec.name}.recurrence")
+
+
+recurrence = _import_recurrence()
+
+
+def _ordinals(texts: list[str] | None) -> frozenset[int]:
+    """Convert ISO dates to date ordinals."""
+    return frozenset(date.fromisoformat(text).toordinal() for text in texts or ())
+
+
+def _schedule(
+    chore: dict[str, Any],
+    clock: recurrence.Clock,
+    schedules: dict[tuple, Any],
+    until_next: bool,
+) -> dict[str, Any]:
+    """Calculate the due dates of one chore."""
+    engine = recurrence.create(chore, clock, chore.get("id"))
+    if (last_completed := chore.get("last_completed")) is not None:
+        engine.last_completed = datetime.fromisoformat(last_completed)
+    overrides = recurrence.Overrides(
+        _ordinals(chore.get("add_dates")),
+        _ordinals(chore.get("remove_dates")),
+        {
+            date.fromisoformat(day).toordinal(): int(offset)
+            for day, offset in (chore.get("offset_dates") or {}).items()
+        },
+    )
+    key = engine.key()
+    forecast = None if key is None else schedules.get(key)
+    if forecast is None or not forecast.valid:
+        forecast = engine.forecast()
+        if key is not None:
+            schedules[key] = forecast
+    if until_next:
+        due_dates, horizon = engine.forecast_next_due_dates(forecast, overrides)
+    else:
+        due_dates, horizon = engine.forecast_due_dates(forecast, overrides)
+    return {
+        "id": chore.get("id"),
+        "due_dates": [date.fromordinal(ordinal).isoformat() for ordinal in due_dates],
+        "horizon": (
+            None
+            if horizon == recurrence.END_OF_TIME
+            else date.fromordinal(horizon).isoformat()
+        ),
+    }
+
+
+def run(source: TextIO, target: TextIO, now: datetime, until_next: bool) -> int:
+    """Write the schedule of each chore read from source, return their count."""
+    schedules: dict[tuple, Any] = {}
+    count = 0
+    for number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        count += 1
+        try:
+            chore = json.loads(line)
+            result = _schedule(chore, lambda: now, schedules, until_next)
+        except (KeyError, TypeError, ValueError, AttributeError) as error:
+            result = {"line": number, "error": str(error)}
+        target.write(json.dumps(result) + "\n")
+    return count
+
+
+def main() -> None:
+    """Run the command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--now",
+        type=datetime.fromisoformat,
+        default=None,
+        help="current local date and time, ISO formatted (default: now)",
+    )
+    parser.add_argument(
+        "--next",
+        action="store_true",
+        help="only calculate until the next due date, as the sensors do",
+    )
+    args = parser.parse_args()
+    now = args.now or recurrence.local_now()
+    if now.tzinfo is None:
+        now = now.astimezone()
+
+    started = time.perf_counter()
+    count = run(sys.stdin, sys.stdout, now, args.next)
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed else 0.0
+    print(  # noqa: T201
+        f"{count} chores in {elapsed:.3f} s ({rate:.0f} chores/s)", file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Helpers shared by the Chore Helper tests."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.chore_helper import const
+
+
+def chore_entry(name: str, **options: Any) -> MockConfigEntry:
+    """Return the config entry of a chore with the options."""
+    return MockConfigEntry(
+        domain=const.DOMAIN,
+        title=name,
+        version=const.CONFIG_VERSION,
+        data={"unique_id": name},
+        options={"name": name, const.CONF_FORECAST_DATES: 10, **options},
+    )
+
+
+async def async_setup_chores(hass: HomeAssistant, *entries: MockConfigEntry) -> None:
+    """Set up the integration with the chore config entries."""
+    for entry in entries:
+        entry.add_to_hass(hass)
+    assert await async_setup_component(hass, const.DOMAIN, {})
+    await hass.async_block_till_done()
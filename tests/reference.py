@@ -0,0 +1,251 @@
+"""Schedule engines as they were before the closed-form rewrite.
+
+The recurrences here find candidates with the previous algorithms (dates
+offset with relativedelta, ISO week numbers, stepping a week or month at a
+time), so the tests can check that the current engines give the same due
+dates, and where they deliberately do not, and the benchmarks can time them.
+"""
+
+from __future__ import annotations
+
+from calendar import monthrange
+from datetime import date, timedelta
+
+from dateutil.relativedelta import relativedelta
+
+from custom_components.chore_helper.engine.recurrence import (
+    WEEKDAYS,
+    DailyRecurrence,
+    MonthlyRecurrence,
+    Recurrence,
+    UpdateContext,
+    WeeklyRecurrence,
+)
+
+
+class PreviousDailyRecurrence(DailyRecurrence):
+    """Daily recurrence offsetting dates with relativedelta."""
+
+    __slots__ = ()
+
+    _find_candidate_ordinal = Recurrence._find_candidate_ordinal
+
+    def _find_candidate_date(self, day1: date, context: UpdateContext) -> date | None:
+        """Calculate possible date, for every-n-days and after-n-days frequency."""
+        schedule_start_date = self.schedule_start_date(context)
+        day1 = self.calculate_day1(day1, schedule_start_date, context)
+        remainder = (day1 - schedule_start_date).days % self._period
+        if remainder == 0:
+            return day1
+        return day1 + relativedelta(days=self._period - remainder)
+
+
+class PreviousWeeklyRecurrence(WeeklyRecurrence):
+    """Weekly recurrence counting periods in ISO week numbers."""
+
+    __slots__ = ()
+
+    _find_candidate_ordinal = Recurrence._find_candidate_ordinal
+
+    def _find_candidate_date(self, day1: date, context: UpdateContext) -> date | None:
+        """Calculate possible date, for weekly frequency."""
+        start_date = self.schedule_start_date(context)
+        start_week = start_date.isocalendar()[1]
+        day1 = self.calculate_day1(day1, start_date, context)
+        week = day1.isocalendar()[1]
+        weekday = day1.weekday()
+        offset = -1
+        if self._chore_day is not None:
+            day_index = WEEKDAYS.index(self._chore_day)
+        else:  # if chore day is not set, just repeat the start date's day
+            day_index = start_date.weekday()
+
+        if (week - start_week) % self._period == 0:  # Chore this week
+            if day_index >= weekday:  # Chore still did not happen
+                offset = day_index - weekday
+        iterate_by_week = 7 - weekday + day_index
+        while offset == -1:  # look in following weeks
+            candidate = day1 + relativedelta(days=iterate_by_week)
+            week = candidate.isocalendar()[1]
+            if (week - start_week) % self._period == 0:
+                offset = iterate_by_week
+                break
+            iterate_by_week += 7
+        return day1 + relativedelta(days=offset)
+
+
+class PreviousMonthlyRecurrence(MonthlyRecurrence):
+    """Monthly recurrence stepping a month at a time, counting ISO weeks."""
+
+    __slots__ = ()
+
+    # The period loop did not always end, see test_recurrence
+    MAX_STEPS = 100
+
+    @staticmethod
+    def viable_weeks_in_month(
+        date_of_month: date,
+        chore_day: int,
+        last_week_must_contain_chore_day: bool = False,
+    ) -> int:
+        """Find the highest week number that contains the chore day in the month."""
+        first_of_month = date(date_of_month.year, date_of_month.month, 1)
+        last_of_month = first_of_month + relativedelta(day=31)
+        first_week = first_of_month.isocalendar()[1]
+        if last_week_must_contain_chore_day:
+            last_chore_day_offset = (last_of_month.weekday() - chore_day) % 7
+            last_chore_day = last_of_month - timedelta(days=last_chore_day_offset)
+            last_chore_week = last_chore_day.isocalendar()[1]
+        else:
+            last_chore_week = last_of_month.isocalendar()[1]
+        return last_chore_week - first_week + 1
+
+    @staticmethod
+    def nth_week_date(week_number: int, date_of_month: date, chore_day: int) -> date:
+        """Find weekday in the nth week of the month."""
+        first_of_month = date(date_of_month.year, date_of_month.month, 1)
+        actual_week_number = (
+            week_number
+            if week_number > 0
+            else max(
+                PreviousMonthlyRecurrence.viable_weeks_in_month(
+                    date_of_month, chore_day, False
+                )
+                + week_number
+                + 1,
+                1,
+            )
+        )
+
+        return first_of_month + relativedelta(
+            days=chore_day - first_of_month.weekday() + (actual_week_number - 1) * 7
+        )
+
+    @staticmethod
+    def nth_weekday_date(
+        weekday_number: int, date_of_month: date, chore_day: int
+    ) -> date:
+        """Find nth weekday of the month."""
+        first_of_month = date(date_of_month.year, date_of_month.month, 1)
+        actual_weekday_number = (
+            weekday_number
+            if weekday_number > 0
+            else max(
+                PreviousMonthlyRecurrence.viable_weeks_in_month(
+                    date_of_month, chore_day, True
+                )
+                + weekday_number
+                + 1,
+                1,
+            )
+        )
+
+        # 1st of the month is before the day of chore
+        # (so 1st chore week the week when month starts)
+        if chore_day >= first_of_month.weekday() or weekday_number < 0:
+            return first_of_month + relativedelta(
+                days=chore_day
+                - first_of_month.weekday()
+                + (actual_weekday_number - 1) * 7
+            )
+        return first_of_month + relativedelta(
+            days=7
+            - first_of_month.weekday()
+            + chore_day
+            + (actual_weekday_number - 1) * 7
+        )
+
+    def _monthly_candidate(self, day1: date, start_date: date) -> tuple[date, int]:
+        """Calculate possible date, for monthly frequency.
+
+        2nd value is the month to consider the date in, even if different.
+        """
+        if self._chore_day is None:
+            day_of_month = self._day_of_month
+            if self._day_of_month is None:
+                month_range = monthrange(day1.year, day1.month)
+                day_of_month = (
+                    start_date.day
+                    if month_range[1] >= start_date.day
+                    else month_range[1]
+                )
+
+            if day1.day <= day_of_month:
+                return (date(day1.year, day1.month, day_of_month), day1.month)
+            if day1.month == 12:
+                return (date(day1.year + 1, 1, day_of_month), 1)
+            return (date(day1.year, day1.month + 1, day_of_month), day1.month + 1)
+        if self._monthly_force_week_numbers:
+            if self._week_order_number is not None:
+                candidate_date = self.nth_week_date(
+                    self._week_order_number, day1, WEEKDAYS.index(self._chore_day)
+                )
+                # date is today or in the future -> we have the date
+                if candidate_date >= day1:
+                    return (candidate_date, day1.month)
+        else:
+            if self._weekday_order_number is not None:
+                candidate_date = self.nth_weekday_date(
+                    self._weekday_order_number,
+                    day1,
+                    WEEKDAYS.index(self._chore_day),
+                )
+                # date is today or in the future -> we have the date
+                if candidate_date >= day1:
+                    return (candidate_date, day1.month)
+        if day1.month == 12:
+            next_chore_month = date(day1.year + 1, 1, 1)
+        else:
+            next_chore_month = date(day1.year, day1.month + 1, 1)
+        if self._monthly_force_week_numbers:
+            return (
+                self.nth_week_date(
+                    self._week_order_number,
+                    next_chore_month,
+                    WEEKDAYS.index(self._chore_day),
+                ),
+                next_chore_month.month,
+            )
+        return (
+            self.nth_weekday_date(
+                self._weekday_order_number,
+                next_chore_month,
+                WEEKDAYS.index(self._chore_day),
+            ),
+            next_chore_month.month,
+        )
+
+    def _find_candidate_date(self, day1: date, context: UpdateContext) -> date | None:
+        """Calculate possible date, for monthly frequency."""
+        schedule_start_date = self.schedule_start_date(context)
+        day1 = self.calculate_day1(day1, schedule_start_date, context)
+        if self.last_completed is not None and self.last_completed.month == day1.month:
+            if day1.month == 12:
+                day1 = date(day1.year + 1, 1, 1)
+            else:
+                day1 = date(day1.year, day1.month + 1, 1)
+        if self._period is None or self._period == 1:
+            return self._monthly_candidate(day1, schedule_start_date)[0]
+        result = self._monthly_candidate(day1, schedule_start_date)
+
+        candidate_date = result[0]
+        candidate_month = result[1]
+        steps = 0
+        while (candidate_month - schedule_start_date.month) % self._period != 0:
+            steps += 1
+            if steps > self.MAX_STEPS:
+                raise RuntimeError(f"No month found from {day1}")
+            remainder = (
+                candidate_date.month - schedule_start_date.month
+            ) % self._period
+            result = self._monthly_candidate(
+                candidate_date + relativedelta(months=remainder, day=1),
+                schedule_start_date,
+            )
+            candidate_date = result[0]
+            candidate_month = result[1]
+
+        if self._due_date_offset is not None:
+            candidate_date += timedelta(days=self._due_date_offset)
+
+        return candidate_date
@@ -0,0 +1,206 @@
+"""Tests for the chore calendar."""
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.calendar import (
+    ChoreCalendar,
+    EntitiesCalendarData,
+)
+
+from .common import async_setup_chores, chore_entry
+
+
+def _local(day: date, at: time = time()) -> datetime:
+    """Return the local time on a day."""
+    return datetime.combine(day, at, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+
+async def _async_events(
+    hass: HomeAssistant, first: date, last: date
+) -> list[tuple[date, str]]:
+    """Return the (day, chore name) events from the first to the last day."""
+    data = hass.data[const.DOMAIN][const.CALENDAR_PLATFORM]
+    events = await data.async_get_events(
+        hass, _local(first), _local(last, time(23, 59))
+    )
+    return sorted((event.start, event.summary) for event in events)
+
+
+async def test_events_across_days(hass: HomeAssistant, freezer: Any) -> None:
+    """A range query returns the events of every day in the range, only."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "dishes", frequency="every-n-days", period=2, start_date="2024-03-05"
+        ),
+        chore_entry(
+            "trash", frequency="every-n-days", period=3, start_date="2024-03-06"
+        ),
+    )
+    assert await _async_events(hass, date(2024, 3, 6), date(2024, 3, 11)) == [
+        (date(2024, 3, 6), "trash"),
+        (date(2024, 3, 7), "dishes"),
+        (date(2024, 3, 9), "dishes"),
+        (date(2024, 3, 9), "trash"),
+        (date(2024, 3, 11), "dishes"),
+    ]
+    assert await _async_events(hass, date(2024, 3, 12), date(2024, 3, 12)) == [
+        (date(2024, 3, 12), "trash")
+    ]
+
+
+async def test_overdue_shown_today(hass: HomeAssistant, freezer: Any) -> None:
+    """An overdue date is shown once, today, if the chore asks for it."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    options = {"frequency": "every-n-days", "period": 7, "start_date": "2024-03-01"}
+    await async_setup_chores(
+        hass,
+        chore_entry("dishes", **options, **{const.CONF_SHOW_OVERDUE_TODAY: True}),
+        chore_entry("trash", **options),
+    )
+    assert await _async_events(hass, date(2024, 2, 28), date(2024, 3, 10)) == [
+        (date(2024, 3, 1), "trash"),
+        (date(2024, 3, 5), "dishes"),
+        (date(2024, 3, 8), "dishes"),
+        (date(2024, 3, 8), "trash"),
+    ]
+
+
+async def test_completion_reindexes(hass: HomeAssistant, freezer: Any) -> None:
+    """Completing a chore moves its events to the days it is next due."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "dishes", frequency="after-n-days", period=3, start_date="2024-03-05"
+        ),
+    )
+    assert await _async_events(hass, date(2024, 3, 5), date(2024, 3, 12)) == [
+        (date(2024, 3, 5), "dishes"),
+        (date(2024, 3, 8), "dishes"),
+        (date(2024, 3, 11), "dishes"),
+    ]
+    freezer.move_to(_local(date(2024, 3, 6), time(12)))
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.dishes"}, blocking=True
+    )
+    assert await _async_events(hass, date(2024, 3, 5), date(2024, 3, 12)) == [
+        (date(2024, 3, 9), "dishes"),
+        (date(2024, 3, 12), "dishes"),
+    ]
+
+
+async def test_remove_entity_drops_empty_days(hass: HomeAssistant) -> None:
+    """Removing a chore drops the days no other chore is due."""
+    data = EntitiesCalendarData(hass)
+    for entity_id in ("sensor.dishes", "sensor.trash"):
+        data.add_entity(entity_id)
+    data.update_entity("sensor.dishes", [10, 20])
+    data.update_entity("sensor.trash", [20, 30])
+    assert list(data._days) == [10, 20, 30]  # pylint: disable=protected-access
+
+    data.remove_entity("sensor.dishes")
+    # pylint: disable=protected-access
+    assert list(data._days) == [20, 30]
+    assert data._buckets == {20: {"sensor.trash"}, 30: {"sensor.trash"}}
+    assert data.entities == ["sensor.trash"]
+
+
+def _calendar_data(hass: HomeAssistant, *names: str) -> EntitiesCalendarData:
+    """Return calendar data of stand-in chores sensor.<name>, without entities."""
+    chores = {f"sensor.{name}": SimpleNamespace(name=name) for name in names}
+    hass.data[const.DOMAIN] = {const.SENSOR_PLATFORM: chores}
+    data = EntitiesCalendarData(hass)
+    for entity_id in chores:
+        data.add_entity(entity_id)
+    return data
+
+
+def _next_event(hass: HomeAssistant) -> tuple[date, str] | None:
+    """Return the day and chore name of the next upcoming event."""
+    event = hass.data[const.DOMAIN][const.CALENDAR_PLATFORM].event
+    return None if event is None else (event.start, event.summary)
+
+
+async def test_next_event_follows_head(hass: HomeAssistant, freezer: Any) -> None:
+    """The next event moves on when its chore is completed or removed."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "dishes", frequency="every-n-days", period=7, start_date="2024-03-05"
+        ),
+        chore_entry(
+            "trash", frequency="every-n-days", period=7, start_date="2024-03-07"
+        ),
+    )
+    assert _next_event(hass) == (date(2024, 3, 5), "dishes")
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.dishes"}, blocking=True
+    )
+    assert _next_event(hass) == (date(2024, 3, 7), "trash")
+    hass.data[const.DOMAIN][const.CALENDAR_PLATFORM].remove_entity("sensor.trash")
+    assert _next_event(hass) == (date(2024, 3, 12), "dishes")
+
+
+async def test_stale_heap_entries_skipped(hass: HomeAssistant) -> None:
+    """A chore's superseded next due date does not come up as the next event."""
+    data = _calendar_data(hass, "dishes", "trash")
+    data.update_next_due_date("sensor.dishes", date(2024, 3, 10))
+    data.update_next_due_date("sensor.trash", date(2024, 3, 15))
+    assert (data.event.start, data.event.summary) == (date(2024, 3, 10), "dishes")
+
+    data.update_next_due_date("sensor.dishes", date(2024, 3, 20))
+    assert (data.event.start, data.event.summary) == (date(2024, 3, 15), "trash")
+    data.update_next_due_date("sensor.trash", None)
+    assert (data.event.start, data.event.summary) == (date(2024, 3, 20), "dishes")
+    data.update_next_due_date("sensor.dishes", None)
+    assert data.event is None
+
+
+async def test_heap_rebuilt_at_limit(hass: HomeAssistant) -> None:
+    """Superseded heap entries are dropped once they outnumber the chores."""
+    data = _calendar_data(hass, "dishes")
+    limit = 2 * 1 + 16
+    sizes = []
+    # Ever earlier next due dates leave the superseded ones below in the heap
+    for day in range(limit + 2, 0, -1):
+        data.update_next_due_date("sensor.dishes", date(2024, 3, day))
+        sizes.append(len(data._heap))  # pylint: disable=protected-access
+    assert sizes == [*range(1, limit + 1), 1, 2]
+    assert data.event.start == date(2024, 3, 1)
+
+
+async def test_calendar_written_once_per_iteration(
+    hass: HomeAssistant, freezer: Any
+) -> None:
+    """Chores changing the next event together write the calendar once."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    await async_setup_chores(
+        hass,
+        *(
+            chore_entry(
+                name, frequency="every-n-days", period=7, start_date="2024-03-05"
+            )
+            for name in ("dishes", "trash", "plants")
+        ),
+    )
+    with patch.object(ChoreCalendar, "async_write_ha_state") as write_state:
+        await hass.services.async_call(
+            const.DOMAIN,
+            "complete",
+            {"entity_id": ["sensor.dishes", "sensor.trash", "sensor.plants"]},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+    assert write_state.call_count == 1
+    assert _next_event(hass)[0] == date(2024, 3, 12)
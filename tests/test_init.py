@@ -0,0 +1,115 @@
+"""Tests for the chore helper set-up and options changes."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.const import ATTR_HIDDEN
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.chore_helper import const, scheduler
+
+from .common import async_setup_chores, chore_entry
+
+
+def _weekday(days: int) -> str:
+    """Return the chore day option of the weekday in days from today."""
+    day = dt_util.now().date() + timedelta(days=days)
+    return const.WEEKDAY_OPTIONS[day.weekday() + 1]["value"]
+
+
+# The clock is not frozen here: restored states must hold real dates, which
+# are stored as JSON when an entity is removed
+async def test_recreated_chore_is_refreshed(hass: HomeAssistant) -> None:
+    """A chore re-created for other options does not keep its restored state."""
+    yesterday = dt_util.now().date() - timedelta(days=1)
+    entry = chore_entry(
+        "dishes",
+        frequency="every-n-days",
+        period=7,
+        start_date=yesterday.isoformat(),
+    )
+    await async_setup_chores(hass, entry)
+    state = hass.states.get("sensor.dishes")
+    assert state.attributes[const.ATTR_NEXT_DATE] == yesterday
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dishes"]
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={
+            **entry.options,
+            const.CONF_FREQUENCY: "every-n-weeks",
+            const.CONF_PERIOD: 1,
+            const.CONF_CHORE_DAY: _weekday(3),
+        },
+    )
+    await hass.async_block_till_done()
+    assert hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dishes"] is not chore
+    state = hass.states.get("sensor.dishes")
+    assert state.attributes[const.ATTR_NEXT_DATE] == yesterday + timedelta(days=4)
+    assert state.state == "3"
+
+
+async def test_options_change_in_place(hass: HomeAssistant) -> None:
+    """Options of the same frequency class reconfigure the chore entity itself."""
+    today = dt_util.now().date()
+    entry = chore_entry(
+        "dishes", frequency="every-n-days", period=7, start_date=today.isoformat()
+    )
+    other = chore_entry(
+        "trash", frequency="every-n-days", period=7, start_date=today.isoformat()
+    )
+    await async_setup_chores(hass, entry, other)
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    chore = chores["sensor.dishes"]
+
+    with (
+        patch.object(
+            scheduler,
+            "_compute_due_dates",
+            side_effect=scheduler._compute_due_dates,
+        ) as compute,
+        patch.object(
+            hass.config_entries,
+            "async_forward_entry_unload",
+            side_effect=hass.config_entries.async_forward_entry_unload,
+        ) as unload,
+    ):
+        hass.config_entries.async_update_entry(
+            entry,
+            options={
+                **entry.options,
+                const.CONF_PERIOD: 3,
+                const.CONF_START_DATE: (today + timedelta(days=1)).isoformat(),
+            },
+        )
+        await hass.async_block_till_done()
+    assert not unload.called
+    assert chores["sensor.dishes"] is chore
+    assert compute.call_count == 1
+    assert compute.call_args.args[0] == [chore]
+    state = hass.states.get("sensor.dishes")
+    assert state.attributes[const.ATTR_NEXT_DATE] == today + timedelta(days=1)
+    assert state.state == "1"
+    assert hass.states.get("sensor.trash").state == "0"
+
+
+async def test_hiding_chore_recreates_it(hass: HomeAssistant) -> None:
+    """A chore moving out of the calendar is re-created, not changed in place."""
+    today = dt_util.now().date()
+    entry = chore_entry(
+        "dishes", frequency="every-n-days", period=7, start_date=today.isoformat()
+    )
+    await async_setup_chores(hass, entry)
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    chore = chores["sensor.dishes"]
+
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, ATTR_HIDDEN: True}
+    )
+    await hass.async_block_till_done()
+    assert chores["sensor.dishes"] is not chore
+    assert chores["sensor.dishes"].hidden
+    assert hass.states.get("sensor.dishes").state == "0"
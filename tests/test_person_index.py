@@ -0,0 +1,46 @@
+"""Tests for the chores by person index."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.chore_helper import const
+
+from .common import async_setup_chores, chore_entry
+
+
+async def _async_get_chores(hass: HomeAssistant, person: str) -> dict:
+    """Call the get_chores_by_person service."""
+    return await hass.services.async_call(
+        const.DOMAIN,
+        "get_chores_by_person",
+        {"person": person},
+        blocking=True,
+        return_response=True,
+    )
+
+
+async def test_summary_is_current_and_not_shared(hass: HomeAssistant) -> None:
+    """Summaries hold the current person names, and changing one is harmless."""
+    hass.states.async_set("person.alex", "home", {"friendly_name": "Alex"})
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "dishes",
+            frequency="every-n-days",
+            period=1,
+            start_date="2024-01-01",
+            allocation_mode="single",
+            people=["person.alex"],
+        ),
+    )
+    summary = await _async_get_chores(hass, "person.alex")
+    assert [chore["assigned_to_name"] for chore in summary["chores"]] == ["Alex"]
+    summary["chores"][0]["name"] = "changed"
+    summary["chores"].clear()
+
+    hass.states.async_set("person.alex", "home", {"friendly_name": "Alexandra"})
+    summary = await _async_get_chores(hass, "person.alex")
+    assert [
+        (chore["name"], chore["assigned_to_name"]) for chore in summary["chores"]
+    ] == [("dishes", "Alexandra")]
@@ -0,0 +1,454 @@
+"""Tests for the schedule engines, against the algorithms they replaced."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from array import array
+from calendar import monthrange
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.engine.forecast import END_OF_TIME
+from custom_components.chore_helper.engine.recurrence import (
+    DailyRecurrence,
+    MonthlyRecurrence,
+    Recurrence,
+    UpdateContext,
+    WeeklyRecurrence,
+    month_weekday_table,
+)
+
+from .reference import (
+    PreviousDailyRecurrence,
+    PreviousMonthlyRecurrence,
+    PreviousWeeklyRecurrence,
+)
+
+NOW = datetime(2019, 6, 1, 12, tzinfo=timezone.utc)
+TODAY = NOW.date().toordinal()
+
+
+def _due_dates(
+    recurrence_class: type[Recurrence],
+    options: dict[str, Any],
+    last_completed: date | None = None,
+) -> list[date]:
+    """Return the base schedule of a recurrence of the class, before overrides."""
+    recurrence = recurrence_class(options, lambda: NOW)
+    if last_completed is not None:
+        recurrence.last_completed = datetime.combine(
+            last_completed, datetime.min.time(), timezone.utc
+        )
+    context = UpdateContext(NOW)
+    return [date.fromordinal(x) for x in recurrence.base_candidates(context)]
+
+
+@pytest.mark.parametrize(
+    ("frequency", "period", "last_completed"),
+    [
+        ("every-n-days", 1, None),
+        ("every-n-days", 3, None),
+        ("after-n-days", 5, date(2019, 7, 3)),
+    ],
+)
+def test_daily_matches_previous(
+    frequency: str, period: int, last_completed: date | None
+) -> None:
+    """Daily due dates on ordinals are those of the relativedelta offsets."""
+    options = {
+        const.CONF_FREQUENCY: frequency,
+        const.CONF_PERIOD: period,
+        const.CONF_START_DATE: "2019-05-30",
+        const.CONF_FORECAST_DATES: 60,
+    }
+    due_dates = _due_dates(DailyRecurrence, options, last_completed)
+    assert len(due_dates) == 61
+    assert due_dates == _due_dates(PreviousDailyRecurrence, options, last_completed)
+
+
+def _weekly(period: int, start_date: str, forecast_dates: int, **options: Any) -> dict:
+    """Return the options of a weekly chore."""
+    return {
+        const.CONF_FREQUENCY: "every-n-weeks",
+        const.CONF_PERIOD: period,
+        const.CONF_START_DATE: start_date,
+        const.CONF_FORECAST_DATES: forecast_dates,
+        **options,
+    }
+
+
+# Within ISO years, or across ends of years with 52 ISO weeks for period 2
+WEEKLY = [
+    *(_weekly(1, "2020-01-01", 60, chore_day=day) for day in ("mon", "wed", "sun")),
+    *(_weekly(2, "2021-01-04", 120, chore_day=day) for day in ("tue", "sat")),
+    _weekly(2, "2021-01-06", 120),
+    *(
+        _weekly(period, "2024-01-01", 50 // period - 1, chore_day=day)
+        for period in (3, 4, 5, 7)
+        for day in ("mon", "thu", "sun")
+    ),
+    _weekly(3, "2024-01-10", 15),
+    _weekly(2, "2024-01-01", 30, chore_day="fri", first_month="apr", last_month="sep"),
+    _weekly(2, "2024-01-01", 20, chore_day="mon", first_month="nov", last_month="feb"),
+]
+
+
+@pytest.mark.parametrize("options", WEEKLY)
+def test_weekly_matches_previous(options: dict[str, Any]) -> None:
+    """Weekly due dates are those of the ISO week based algorithm."""
+    due_dates = _due_dates(WeeklyRecurrence, options)
+    assert due_dates
+    assert due_dates == _due_dates(PreviousWeeklyRecurrence, options)
+
+
+@pytest.mark.parametrize("last_completed", [date(2024, 3, 7), date(2024, 6, 30)])
+def test_after_n_weeks_matches_previous(last_completed: date) -> None:
+    """After-n-weeks due dates count from the last completion, as before."""
+    options = _weekly(2, "2024-01-01", 10, frequency="after-n-weeks", chore_day="thu")
+    due_dates = _due_dates(WeeklyRecurrence, options, last_completed)
+    assert due_dates[0] > last_completed
+    assert due_dates == _due_dates(PreviousWeeklyRecurrence, options, last_completed)
+
+
+def test_weekly_period_holds_across_53_week_years() -> None:
+    """Weeks are counted from a fixed Monday, not with ISO week numbers.
+
+    2020 has 53 ISO weeks: week 53 and the next week 1 are both odd, so the
+    ISO week count skipped a week there. The period now always holds.
+    """
+    options = _weekly(2, "2020-12-21", 3, chore_day="mon")
+    assert _due_dates(WeeklyRecurrence, options) == [
+        date(2020, 12, 21),
+        date(2021, 1, 4),
+        date(2021, 1, 18),
+        date(2021, 2, 1),
+    ]
+    assert _due_dates(PreviousWeeklyRecurrence, options)[:2] == [
+        date(2020, 12, 21),
+        date(2021, 1, 11),
+    ]
+
+
+def test_weekly_period_holds_across_years() -> None:
+    """A period not dividing 52 no longer jumps at the ISO year end."""
+    options = _weekly(3, "2024-12-02", 2, chore_day="mon")
+    assert _due_dates(WeeklyRecurrence, options) == [
+        date(2024, 12, 2),
+        date(2024, 12, 23),
+        date(2025, 1, 13),
+    ]
+    assert _due_dates(PreviousWeeklyRecurrence, options)[2] == date(2024, 12, 30)
+
+
+def _monthly(period: int, start_date: str, forecast_dates: int, **options: Any) -> dict:
+    """Return the options of a monthly chore."""
+    return {
+        const.CONF_FREQUENCY: "every-n-months",
+        const.CONF_PERIOD: period,
+        const.CONF_START_DATE: start_date,
+        const.CONF_FORECAST_DATES: forecast_dates,
+        **options,
+    }
+
+
+# Days of month that exist in every month, and offsets and periods of 2 and 4
+# (larger periods did not work before, see test_monthly_period_holds)
+MONTHLY = [
+    *(
+        _monthly(1, start_date, 11, day_of_month=day)
+        for start_date in ("2020-01-01", "2021-01-01")
+        for day in (1, 15, 28)
+    ),
+    _monthly(1, "2020-01-01", 11, day_of_month=29),
+    _monthly(1, "2020-01-31", 11),
+    _monthly(1, "2020-01-01", 8, day_of_month=10, first_month="mar", last_month="jun"),
+    *(
+        _monthly(period, "2021-01-01", 24 // period, day_of_month=10)
+        for period in (2, 4)
+    ),
+    _monthly(2, "2020-02-15", 4, due_date_offset=2),
+    _monthly(2, "2020-01-01", 5, day_of_month=20, due_date_offset=4),
+]
+
+# Order numbers of weekdays / weeks in the month, over years where the first
+# and last days of the month are in ISO weeks of the same year
+ORDERED = [
+    _monthly(period, start_date, 11 // period, chore_day=day, **options)
+    for start_date in ("2020-01-01", "2026-01-01")
+    for day in ("mon", "wed", "sun")
+    for period, options in (
+        *((1, {const.CONF_WEEKDAY_ORDER_NUMBER: order}) for order in (1, 2, 4, 5)),
+        *((1, {const.CONF_WEEKDAY_ORDER_NUMBER: order}) for order in (-1, -2)),
+        *(
+            (
+                1,
+                {
+                    const.CONF_WEEKDAY_ORDER_NUMBER: order,
+                    "force_week_order_numbers": True,
+                },
+            )
+            for order in (2, 3, 4, -1, -2)
+        ),
+        (2, {const.CONF_WEEKDAY_ORDER_NUMBER: 2, const.CONF_DUE_DATE_OFFSET: 1}),
+        (2, {const.CONF_WEEKDAY_ORDER_NUMBER: -1}),
+    )
+]
+
+
+@pytest.mark.parametrize("options", MONTHLY + ORDERED)
+def test_monthly_matches_previous(options: dict[str, Any]) -> None:
+    """Monthly due dates are those of the month by month algorithm."""
+    due_dates = _due_dates(MonthlyRecurrence, options)
+    assert due_dates
+    assert due_dates == _due_dates(PreviousMonthlyRecurrence, options)
+
+
+@pytest.mark.parametrize(
+    ("last_completed", "first_due_date"),
+    [(date(2020, 3, 10), date(2020, 7, 5)), (date(2020, 3, 2), date(2020, 5, 5))],
+)
+def test_after_n_months_matches_previous(
+    last_completed: date, first_due_date: date
+) -> None:
+    """After-n-months due dates count from the last completion, as before."""
+    options = _monthly(2, "2020-01-01", 4, frequency="after-n-months", day_of_month=5)
+    due_dates = _due_dates(MonthlyRecurrence, options, last_completed)
+    assert due_dates[0] == first_due_date
+    assert due_dates == _due_dates(PreviousMonthlyRecurrence, options, last_completed)
+
+
+@pytest.mark.parametrize(
+    ("options", "due_dates"),
+    [
+        (
+            _monthly(1, "2020-01-01", 3, day_of_month=31),
+            [
+                date(2020, 1, 31),
+                date(2020, 2, 29),
+                date(2020, 3, 31),
+                date(2020, 4, 30),
+            ],
+        ),
+        (
+            _monthly(1, "2021-01-01", 3, day_of_month=31),
+            [
+                date(2021, 1, 31),
+                date(2021, 2, 28),
+                date(2021, 3, 31),
+                date(2021, 4, 30),
+            ],
+        ),
+        (
+            _monthly(1, "2021-01-30", 3),
+            [
+                date(2021, 1, 30),
+                date(2021, 2, 28),
+                date(2021, 3, 30),
+                date(2021, 4, 30),
+            ],
+        ),
+    ],
+)
+def test_day_of_month_is_clamped(
+    options: dict[str, Any], due_dates: list[date]
+) -> None:
+    """A day of month past the end of a month falls on its last day.
+
+    Before, the month raised ValueError and cut the schedule short there.
+    """
+    assert _due_dates(MonthlyRecurrence, options) == due_dates
+    assert _due_dates(PreviousMonthlyRecurrence, options) == due_dates[:1]
+
+
+@pytest.mark.parametrize("offset", [2, -3])
+def test_due_date_offset_with_period_1(offset: int) -> None:
+    """The due date offset also applies every month, not only for periods over 1."""
+    options = _monthly(1, "2020-01-01", 3, day_of_month=10, due_date_offset=offset)
+    assert _due_dates(MonthlyRecurrence, options) == [
+        date(2020, month, 10 + offset) for month in range(1, 5)
+    ]
+    assert _due_dates(PreviousMonthlyRecurrence, options) == [
+        date(2020, month, 10) for month in range(1, 5)
+    ]
+
+
+def test_negative_due_date_offset_moves_on() -> None:
+    """An offset back does not find the same month again from the day after.
+
+    Before, every due date after the first was the first one again.
+    """
+    options = _monthly(2, "2020-01-01", 3, day_of_month=10, due_date_offset=-3)
+    assert _due_dates(MonthlyRecurrence, options) == [
+        date(2020, month, 7) for month in (1, 3, 5, 7)
+    ]
+    assert set(_due_dates(PreviousMonthlyRecurrence, options)) == {date(2020, 1, 7)}
+
+
+def test_monthly_period_holds() -> None:
+    """Months are counted absolutely, so periods not dividing 12 hold too.
+
+    Before, the month of year was compared, restarting the period in January.
+    """
+    options = _monthly(5, "2020-01-01", 3, day_of_month=1)
+    due_dates = _due_dates(MonthlyRecurrence, options)
+    assert due_dates == [
+        date(2020, 1, 1),
+        date(2020, 6, 1),
+        date(2020, 11, 1),
+        date(2021, 4, 1),
+    ]
+    assert _due_dates(PreviousMonthlyRecurrence, options) != due_dates
+
+
+@pytest.mark.parametrize("period", [3, 6])
+def test_monthly_period_does_not_spin(period: int) -> None:
+    """A period of 3 or more finds the next month matching it.
+
+    Before, the month by month search could go back and forth for ever.
+    """
+    options = _monthly(period, "2021-01-01", 3, day_of_month=10)
+    assert _due_dates(MonthlyRecurrence, options) == [
+        date(2021, 1, 10) + relativedelta(months=period * index) for index in range(4)
+    ]
+    with pytest.raises(RuntimeError):
+        _due_dates(PreviousMonthlyRecurrence, options)
+
+
+def _weekdays_in_month(year: int, month: int, weekday: int) -> list[date]:
+    """Return every date of the weekday in the month, by brute force."""
+    return [
+        day
+        for day in (date(year, month, 1) + timedelta(days=n) for n in range(31))
+        if day.month == month and day.weekday() == weekday
+    ]
+
+
+def test_month_weekday_table() -> None:
+    """The month tables hold every date of the weekday and the month's weeks."""
+    for year in range(2019, 2031):
+        for month in range(1, 13):
+            first = date(year, month, 1)
+            last = date(year, month, monthrange(year, month)[1])
+            for weekday in range(7):
+                table = month_weekday_table(year, month, weekday)
+                dates = _weekdays_in_month(year, month, weekday)
+                assert table.dates == tuple(dates)
+                assert table.first_week == first - timedelta(days=first.weekday())
+                assert table.first_week + timedelta(weeks=table.weeks) > last
+                assert table.first_week + timedelta(weeks=table.weeks - 1) <= last
+                assert (
+                    table.first_week
+                    + timedelta(weeks=table.weeks_with_day - 1, days=weekday)
+                    == dates[-1]
+                )
+
+
+@pytest.mark.parametrize("year", range(2019, 2031))
+@pytest.mark.parametrize("order", [1, 2, 3, 4, -1, -2])
+def test_nth_weekday_date(year: int, order: int) -> None:
+    """The nth weekday of every month, also where ISO years change."""
+    for month in range(1, 13):
+        for weekday in range(7):
+            dates = _weekdays_in_month(year, month, weekday)
+            assert (
+                MonthlyRecurrence.nth_weekday_date(order, date(year, month, 1), weekday)
+                == dates[order - 1 if order > 0 else order]
+            )
+
+
+@pytest.mark.parametrize("year", range(2019, 2031))
+@pytest.mark.parametrize("order", [1, 2, 3, -1, -2])
+def test_nth_week_date(year: int, order: int) -> None:
+    """The weekday in the nth week of every month, counted from either end."""
+    for month in range(1, 13):
+        first = date(year, month, 1)
+        last = date(year, month, monthrange(year, month)[1])
+        for weekday in range(7):
+            if order > 0:
+                week = first - timedelta(days=first.weekday(), weeks=1 - order)
+            else:
+                week = last - timedelta(days=last.weekday(), weeks=-1 - order)
+            assert MonthlyRecurrence.nth_week_date(
+                order, first, weekday
+            ) == week + timedelta(days=weekday)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        # Dec 31 2024 is in ISO week 1 of 2025
+        {const.CONF_WEEKDAY_ORDER_NUMBER: -1},
+        {const.CONF_WEEKDAY_ORDER_NUMBER: -1, "force_week_order_numbers": True},
+    ],
+)
+def test_last_weekday_across_iso_year_change(options: dict[str, Any]) -> None:
+    """Order numbers from the end of the month hold in a month ending an ISO year.
+
+    Before, the ISO week numbers of the month wrapped round, the date fell
+    into the month before, and the month was skipped.
+    """
+    options = _monthly(1, "2024-12-01", 0, chore_day="tue", **options)
+    assert _due_dates(MonthlyRecurrence, options) == [date(2024, 12, 31)]
+    assert _due_dates(PreviousMonthlyRecurrence, options) == [date(2025, 1, 28)]
+
+
+@pytest.mark.parametrize(
+    ("due_dates", "horizon", "known"),
+    [
+        ([], TODAY + 10, False),
+        ([], END_OF_TIME, True),
+        ([TODAY - 1], TODAY + 10, True),
+        ([TODAY + 1], TODAY + 10, True),
+        ([TODAY], TODAY + 10, False),
+        ([TODAY, TODAY], TODAY + 10, False),
+        ([TODAY, TODAY, TODAY + 3], TODAY + 10, True),
+        ([TODAY, TODAY], END_OF_TIME, True),
+    ],
+)
+def test_next_due_date_known(due_dates: list[int], horizon: int, known: bool) -> None:
+    """A due date today only tells the next due date with one after today."""
+    options = {
+        const.CONF_FREQUENCY: "every-n-days",
+        const.CONF_PERIOD: 1,
+        const.CONF_START_DATE: "2019-01-01",
+    }
+    recurrence = DailyRecurrence(options, lambda: NOW)
+    assert (
+        recurrence.next_due_date_known(
+            array("i", due_dates), horizon, UpdateContext(NOW)
+        )
+        is known
+    )
+
+
+def test_schedule_script_without_home_assistant() -> None:
+    """The schedule script runs the engine without importing Home Assistant."""
+    chore = {
+        "id": "plants",
+        const.CONF_FREQUENCY: "every-n-days",
+        const.CONF_PERIOD: 3,
+        const.CONF_START_DATE: "2024-03-05",
+        const.CONF_FORECAST_DATES: 2,
+    }
+    script = Path(__file__).resolve().parents[1] / "scripts" / "schedule.py"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(script), "--now", "2024-03-05"],
+        input=json.dumps(chore) + "\n",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(result.stdout)["due_dates"] == [
+        "2024-03-05",
+        "2024-03-08",
+        "2024-03-11",
+    ]
+    assert "homeassistant" not in result.stderr
+    assert "custom_components" not in result.stderr
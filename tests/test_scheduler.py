@@ -0,0 +1,448 @@
+"""Tests for the chore scheduler."""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.chore_helper import const, helpers, scheduler as scheduler_module
+from custom_components.chore_helper.chore import EXPIRATION, Chore
+from custom_components.chore_helper.engine.recurrence import Recurrence, UpdateContext
+from custom_components.chore_helper.scheduler import (
+    ChoreScheduler,
+    _compute_due_dates,
+)
+
+from .common import async_setup_chores, chore_entry
+
+CHORES = 20
+
+
+def _local(day: date, at: Any = EXPIRATION) -> datetime:
+    """Return the local time on a day."""
+    return datetime.combine(day, at, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+
+async def test_chore_expiry_arms_earliest(hass: HomeAssistant, freezer: Any) -> None:
+    """An added chore only re-arms the expiry wake-up if it expires earlier."""
+    freezer.move_to(_local(date(2024, 3, 5), datetime.min.time()))
+    hass.data[const.DOMAIN] = {const.SENSOR_PLATFORM: {}}
+    scheduler = ChoreScheduler(hass)
+    for day, armed in (
+        (date(2024, 3, 8), date(2024, 3, 8)),
+        (date(2024, 3, 9), date(2024, 3, 8)),
+        (date(2024, 3, 6), date(2024, 3, 6)),
+        (date(2024, 3, 4), date(2024, 3, 6)),  # already expired
+    ):
+        scheduler.async_schedule_chore_expiry(
+            SimpleNamespace(  # type: ignore[arg-type]
+                manual=False, expiration=lambda _, day=day: _local(day)
+            )
+        )
+        assert scheduler._expiry == _local(armed)  # pylint: disable=protected-access
+    scheduler.async_stop()
+    assert scheduler._expiry is None  # pylint: disable=protected-access
+
+
+async def test_startup_does_not_rescan_per_chore(
+    hass: HomeAssistant, freezer: Any
+) -> None:
+    """Adding chores does not scan all chores each time, the refresh arms once."""
+    freezer.move_to(_local(date(2024, 3, 5), datetime.min.time()))
+    entries = [
+        chore_entry(
+            f"chore {index}",
+            frequency="every-n-days",
+            period=7,
+            start_date=f"2024-03-{6 + index % 7:02}",
+        )
+        for index in range(CHORES)
+    ]
+    with patch.object(
+        ChoreScheduler,
+        "async_schedule_expiry",
+        autospec=True,
+        side_effect=ChoreScheduler.async_schedule_expiry,
+    ) as schedule_expiry:
+        await async_setup_chores(hass, *entries)
+    assert 0 < schedule_expiry.call_count < CHORES
+    scheduler = hass.data[const.DOMAIN][const.SCHEDULER]
+    assert scheduler._expiry == _local(  # pylint: disable=protected-access
+        date(2024, 3, 6)
+    )
+
+
+async def test_cached_schedule_is_not_reused_next_day(
+    hass: HomeAssistant, freezer: Any
+) -> None:
+    """A schedule cached the day a chore was completed is recalculated next day.
+
+    The day after the completion day is looked for from then, so the due
+    date cached that day is not the next day's.
+    """
+    freezer.move_to(_local(date(2024, 1, 4), datetime.min.time()))
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "plants", frequency="every-n-days", period=3, start_date="2024-01-01"
+        ),
+    )
+    freezer.move_to(_local(date(2024, 1, 4), time(19)))
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.plants"}, blocking=True
+    )
+    state = hass.states.get("sensor.plants")
+    assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 1, 7)
+
+    midnight = _local(date(2024, 1, 5), datetime.min.time())
+    freezer.move_to(midnight)
+    async_fire_time_changed(hass, midnight)
+    await hass.async_block_till_done()
+
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.plants"]
+    due_dates, _, _ = _compute_due_dates([chore], {})[0]
+    state = hass.states.get("sensor.plants")
+    assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 1, 4)
+    assert state.attributes[const.ATTR_OVERDUE]
+    assert chore._due_dates == due_dates  # pylint: disable=protected-access
+
+
+async def test_pass_reads_the_clock_once(hass: HomeAssistant, freezer: Any) -> None:
+    """A refresh, a completion and the expiry wake-up each read the clock once."""
+    freezer.move_to(_local(date(2024, 3, 5), datetime.min.time()))
+    await async_setup_chores(
+        hass,
+        *(
+            chore_entry(f"chore {index}", frequency="every-n-days", period=index + 1)
+            for index in range(3)
+        ),
+    )
+    scheduler = hass.data[const.DOMAIN][const.SCHEDULER]
+    with (
+        patch.object(helpers, "now", side_effect=helpers.now) as now,
+        patch.object(
+            Recurrence, "snapshot", autospec=True, side_effect=Recurrence.snapshot
+        ) as snapshot,
+    ):
+        await scheduler.async_refresh(force=True)
+        assert (now.call_count, snapshot.call_count) == (1, 0)
+
+        now.reset_mock()
+        async with scheduler.batch() as batch:
+            batch.add(hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.chore_0"])
+        assert (now.call_count, snapshot.call_count) == (1, 0)
+
+        now.reset_mock()
+        expiry = _local(date(2024, 3, 5))
+        freezer.move_to(expiry)
+        async_fire_time_changed(hass, expiry)
+        await hass.async_block_till_done()
+        assert (now.call_count, snapshot.call_count) == (1, 0)
+
+
+async def test_expiry_leaves_manual_chores(hass: HomeAssistant, freezer: Any) -> None:
+    """A manually updated chore due today is not recalculated when it expires."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "manual",
+            frequency="every-n-days",
+            period=1,
+            start_date="2024-03-05",
+            **{const.CONF_MANUAL: True},
+        ),
+    )
+    await hass.services.async_call(
+        const.DOMAIN, "update_state", {"entity_id": "sensor.manual"}, blocking=True
+    )
+    scheduler = hass.data[const.DOMAIN][const.SCHEDULER]
+    assert scheduler._expiry is None  # pylint: disable=protected-access
+    # Completed today, it would be recalculated if it was not manual
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.manual"]
+    chore.last_completed = _local(date(2024, 3, 5), time(8))
+
+    expired = _local(date(2024, 3, 5), time(23, 59, 59, 500000))
+    freezer.move_to(expired)
+    await scheduler._async_expired(expired)  # pylint: disable=protected-access
+    state = hass.states.get("sensor.manual")
+    assert state.state == "0"
+    assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 5)
+
+
+async def test_expiry_waits_for_batch(hass: HomeAssistant, freezer: Any) -> None:
+    """The expiry wake-up does not change chores while a batch is open."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "dishes", frequency="every-n-days", period=1, start_date="2024-03-05"
+        ),
+    )
+    scheduler = hass.data[const.DOMAIN][const.SCHEDULER]
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dishes"]
+    chore.last_completed = _local(date(2024, 3, 5), time(8))
+    expired = _local(date(2024, 3, 5), time(23, 59, 59, 500000))
+    freezer.move_to(expired)
+    async with scheduler.batch():
+        async_fire_time_changed(hass, expired)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        state = hass.states.get("sensor.dishes")
+        assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 5)
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.dishes")
+    assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 6)
+
+
+async def test_expiry_leaves_chores_not_done(
+    hass: HomeAssistant, freezer: Any
+) -> None:
+    """A chore due today and not completed stays due until it becomes overdue."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "dishes", frequency="every-n-days", period=7, start_date="2024-03-05"
+        ),
+    )
+    expired = _local(date(2024, 3, 5), time(23, 59, 59, 500000))
+    freezer.move_to(expired)
+    async_fire_time_changed(hass, expired)
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.dishes")
+    assert state.state == "0"
+    assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 5)
+
+    midnight = _local(date(2024, 3, 6))
+    freezer.move_to(midnight)
+    async_fire_time_changed(hass, midnight)
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.dishes")
+    assert state.state == "-1"
+    assert state.attributes[const.ATTR_OVERDUE]
+
+
+async def test_batch_leaves_earlier_wake_up(hass: HomeAssistant, freezer: Any) -> None:
+    """Completing the chore the wake-up is for re-arms only when it fires."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "dishes", frequency="every-n-days", period=7, start_date="2024-03-05"
+        ),
+        chore_entry(
+            "trash", frequency="every-n-days", period=7, start_date="2024-03-06"
+        ),
+    )
+    scheduler = hass.data[const.DOMAIN][const.SCHEDULER]
+    # pylint: disable=protected-access
+    assert scheduler._expiry == _local(date(2024, 3, 5))
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.dishes"}, blocking=True
+    )
+    assert scheduler._expiry == _local(date(2024, 3, 5))
+
+    expired = _local(date(2024, 3, 5), time(23, 59, 59, 500000))
+    freezer.move_to(expired)
+    async_fire_time_changed(hass, expired)
+    await hass.async_block_till_done()
+    assert scheduler._expiry == _local(date(2024, 3, 6))
+
+
+async def _async_setup_batch_chores(hass: HomeAssistant, freezer: Any) -> None:
+    """Set up two chores due in a few days, for the batch tests."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    await async_setup_chores(
+        hass,
+        *(
+            chore_entry(
+                name, frequency="every-n-days", period=7, start_date="2024-03-08"
+            )
+            for name in ("dishes", "trash")
+        ),
+    )
+
+
+def _patch_writes() -> Any:
+    """Patch state writes of chores, to count them by entity ID."""
+    return patch.object(
+        Chore,
+        "async_write_ha_state",
+        autospec=True,
+        side_effect=Chore.async_write_ha_state,
+    )
+
+
+def _written(write_state: Any) -> list[str]:
+    """Return the entity IDs of the counted state writes, in order."""
+    return [call.args[0].entity_id for call in write_state.call_args_list]
+
+
+async def test_batch_recalculates_chores_once(
+    hass: HomeAssistant, freezer: Any
+) -> None:
+    """Several changes to a chore in a batch recalculate and write it once."""
+    await _async_setup_batch_chores(hass, freezer)
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    dishes, trash = chores["sensor.dishes"], chores["sensor.trash"]
+    scheduler = hass.data[const.DOMAIN][const.SCHEDULER]
+    with (
+        patch.object(
+            scheduler_module,
+            "_compute_due_dates",
+            side_effect=scheduler_module._compute_due_dates,
+        ) as compute,
+        _patch_writes() as write_state,
+    ):
+        async with scheduler.batch() as batch:
+            await dishes.add_date(date(2024, 3, 10))
+            batch.add(dishes)
+            await dishes.remove_date(date(2024, 3, 8))
+            batch.add(dishes)
+            await trash.offset_date(1, date(2024, 3, 8))
+            batch.add(trash)
+            batch.add(dishes)
+        await hass.async_block_till_done()
+    assert compute.call_count == 1
+    assert compute.call_args.args[0] == [dishes, trash]
+    assert sorted(_written(write_state)) == ["sensor.dishes", "sensor.trash"]
+    state = hass.states.get("sensor.dishes")
+    assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 10)
+    state = hass.states.get("sensor.trash")
+    assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 9)
+
+    # A service call listing a chore twice completes it as one change
+    with _patch_writes() as write_state:
+        await hass.services.async_call(
+            const.DOMAIN,
+            "complete",
+            {"entity_id": ["sensor.dishes", "sensor.trash", "sensor.dishes"]},
+            blocking=True,
+        )
+    assert sorted(_written(write_state)) == ["sensor.dishes", "sensor.trash"]
+
+
+async def test_refresh_waits_for_batch(hass: HomeAssistant, freezer: Any) -> None:
+    """A refresh started while a batch is open runs after the batch."""
+    await _async_setup_batch_chores(hass, freezer)
+    dishes = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dishes"]
+    scheduler = hass.data[const.DOMAIN][const.SCHEDULER]
+    with _patch_writes() as write_state:
+        async with scheduler.batch() as batch:
+            refresh = hass.async_create_task(scheduler.async_refresh(force=True))
+            for _ in range(3):
+                await asyncio.sleep(0)
+            assert not refresh.done()
+            await dishes.add_date(date(2024, 3, 10))
+            batch.add(dishes)
+        await refresh
+    # The batch flush comes first, then the refresh writes every chore
+    assert _written(write_state) == ["sensor.dishes", "sensor.dishes", "sensor.trash"]
+
+
+async def test_failed_batch_writes_nothing(hass: HomeAssistant, freezer: Any) -> None:
+    """A batch raising an exception writes no state and releases the lock."""
+    await _async_setup_batch_chores(hass, freezer)
+    dishes = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dishes"]
+    scheduler = hass.data[const.DOMAIN][const.SCHEDULER]
+    with _patch_writes() as write_state, pytest.raises(RuntimeError):
+        async with scheduler.batch() as batch:
+            await dishes.add_date(date(2024, 3, 10))
+            batch.add(dishes)
+            raise RuntimeError
+    assert not write_state.called
+    assert not scheduler._lock.locked()  # pylint: disable=protected-access
+    state = hass.states.get("sensor.dishes")
+    assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 8)
+
+    # The next change goes through
+    await hass.services.async_call(
+        const.DOMAIN, "update_state", {"entity_id": "sensor.dishes"}, blocking=True
+    )
+    state = hass.states.get("sensor.dishes")
+    assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 8)
+
+
+async def _async_setup_shared_chores(hass: HomeAssistant, freezer: Any) -> list[Chore]:
+    """Set up chores of one recurrence, one with a removed date."""
+    freezer.move_to(_local(date(2024, 3, 5), time(12)))
+    await async_setup_chores(
+        hass,
+        *(
+            chore_entry(
+                name, frequency="every-n-days", period=2, start_date="2024-03-05"
+            )
+            for name in ("dishes", "trash")
+        ),
+        chore_entry("plants", frequency="every-n-days", period=3),
+    )
+    await hass.services.async_call(
+        const.DOMAIN,
+        "remove_date",
+        {"entity_id": "sensor.trash", "date": "2024-03-07"},
+        blocking=True,
+    )
+    chores = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]
+    return [chores[f"sensor.{name}"] for name in ("dishes", "trash", "plants")]
+
+
+async def test_schedule_modes_agree(hass: HomeAssistant, freezer: Any) -> None:
+    """Due dates calculated in the executor equal those calculated inline."""
+    chores = await _async_setup_shared_chores(hass, freezer)
+    scheduler = hass.data[const.DOMAIN][const.SCHEDULER]
+    context = UpdateContext(helpers.now())
+    results = {}
+    # pylint: disable=protected-access
+    with patch.dict(hass.data[const.DOMAIN]), patch.object(
+        hass, "async_add_executor_job", side_effect=hass.async_add_executor_job
+    ) as executor_job:
+        del hass.data[const.DOMAIN][const.SCHEDULE_CACHE]
+        for mode in (const.SCHEDULE_MODE_EXECUTOR, const.SCHEDULE_MODE_INLINE):
+            scheduler._mode = mode
+            scheduler._schedules = {}
+            computed = await scheduler._async_compute_due_dates(chores, context)
+            results[mode] = [(due_dates, horizon) for due_dates, horizon, _ in computed]
+    assert executor_job.call_count == 1
+    assert results[const.SCHEDULE_MODE_EXECUTOR] == results[const.SCHEDULE_MODE_INLINE]
+
+
+async def test_equal_recurrences_share_forecast(
+    hass: HomeAssistant, freezer: Any
+) -> None:
+    """Chores of one recurrence share its forecast, each with its overrides."""
+    dishes, trash, plants = await _async_setup_shared_chores(hass, freezer)
+    schedules: dict = {}
+    computed = _compute_due_dates([dishes, trash, plants], schedules, True)
+    forecasts = [forecast for _, _, forecast in computed]
+    assert forecasts[0] is forecasts[1]
+    assert forecasts[2] is not forecasts[0]
+    assert len(schedules) == 2
+    removed = date(2024, 3, 7).toordinal()
+    assert removed in computed[0][0]
+    assert removed not in computed[1][0]
+    assert list(computed[0][0]) == [*computed[1][0][:1], removed, *computed[1][0][1:]]
+
+
+async def test_completion_leaves_other_chores(
+    hass: HomeAssistant, freezer: Any
+) -> None:
+    """Completing a chore sharing a forecast leaves the others' due dates."""
+    dishes, trash, _ = await _async_setup_shared_chores(hass, freezer)
+    # pylint: disable=protected-access
+    trash_due_dates = list(trash._due_dates)
+    await hass.services.async_call(
+        const.DOMAIN, "complete", {"entity_id": "sensor.dishes"}, blocking=True
+    )
+    assert dishes.next_due_date == date(2024, 3, 7)
+    assert trash.next_due_date == date(2024, 3, 5)
+    assert list(trash._due_dates) == trash_due_dates
+    state = hass.states.get("sensor.trash")
+    assert state.attributes[const.ATTR_NEXT_DATE] == date(2024, 3, 5)
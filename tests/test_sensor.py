@@ -0,0 +1,179 @@
+"""Tests for the chore sensors."""
+from __future__ import annotations
+
+import sys
+from datetime import date, datetime, timedelta
+from importlib import import_module
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import ATTR_HIDDEN
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import mock_restore_cache
+
+from custom_components.chore_helper import const, helpers
+from custom_components.chore_helper.chore import Chore
+from custom_components.chore_helper.engine.recurrence import RECURRENCES
+from custom_components.chore_helper.sensor import FREQUENCY_CLASSES
+
+from .common import async_setup_chores, chore_entry
+
+
+@pytest.mark.parametrize("frequency", RECURRENCES)
+def test_frequency_classes(frequency: str) -> None:
+    """Each frequency has a chore class calculating its recurrence."""
+    module, name = FREQUENCY_CLASSES[frequency]
+    chore_module = import_module(f"custom_components.chore_helper.{module}")
+    assert getattr(chore_module, name).RECURRENCE is RECURRENCES[frequency]
+
+
+async def test_chores_wait_for_their_class(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Chores set up while their class is still being imported wait for it."""
+    module, _ = FREQUENCY_CLASSES["every-n-days"]
+    # Re-import the chore base class too, for the import to take a while
+    for name in (module, "chore"):
+        monkeypatch.delitem(sys.modules, f"custom_components.chore_helper.{name}")
+    await async_setup_chores(
+        hass,
+        *(
+            chore_entry(name, frequency="every-n-days", period=1)
+            for name in ("dishes", "trash", "plants")
+        ),
+    )
+    assert sorted(hass.data[const.DOMAIN][const.SENSOR_PLATFORM]) == [
+        "sensor.dishes",
+        "sensor.plants",
+        "sensor.trash",
+    ]
+
+
+async def test_assigned_to_name_follows_person(hass: HomeAssistant) -> None:
+    """The assigned person's name is current, though the attributes are cached."""
+    hass.states.async_set("person.alex", "home", {"friendly_name": "Alex"})
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "dishes",
+            frequency="every-n-days",
+            period=1,
+            start_date="2024-01-01",
+            allocation_mode="single",
+            people=["person.alex"],
+        ),
+    )
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dishes"]
+    state = hass.states.get("sensor.dishes")
+    assert state.attributes[const.ATTR_ASSIGNED_TO_NAME] == "Alex"
+
+    hass.states.async_set("person.alex", "home", {"friendly_name": "Alexandra"})
+    chore.async_write_ha_state()
+    state = hass.states.get("sensor.dishes")
+    assert state.attributes[const.ATTR_ASSIGNED_TO_NAME] == "Alexandra"
+
+
+def _due_dates(chore: Chore, until: str) -> list[str]:
+    """Return the ISO due dates of the chore, up to the until date."""
+    chore.extend_due_dates()
+    return [due.isoformat() for due in chore.due_dates if due.isoformat() <= until]
+
+
+# The clock is not frozen here: restored states must hold real dates, which
+# are stored as JSON when an entity is removed
+async def test_overrides_survive_restore(hass: HomeAssistant) -> None:
+    """Added, removed and offset dates are restored from their text form."""
+    today = dt_util.now().date()
+
+    def day(days: int) -> str:
+        return (today + timedelta(days=days)).isoformat()
+
+    entry = chore_entry(
+        "dishes", frequency="every-n-days", period=7, start_date=day(1)
+    )
+    await async_setup_chores(hass, entry)
+    for service, data in (
+        ("add_date", {"date": day(3)}),
+        ("remove_date", {"date": day(8)}),
+        ("offset_date", {"date": day(15), "offset": 1}),
+    ):
+        await hass.services.async_call(
+            const.DOMAIN,
+            service,
+            {"entity_id": "sensor.dishes", **data},
+            blocking=True,
+        )
+    overrides = {
+        const.ATTR_ADD_DATES: day(3),
+        const.ATTR_REMOVE_DATES: day(8),
+        const.ATTR_OFFSET_DATES: f"{day(15)}:1",
+    }
+    state = hass.states.get("sensor.dishes")
+    assert {key: state.attributes[key] for key in overrides} == overrides
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dishes"]
+    expected = [day(1), day(3), day(16), day(22)]
+    assert _due_dates(chore, until=day(22)) == expected
+
+    # Hiding the chore re-creates it, from the state stored on removal
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, ATTR_HIDDEN: True}
+    )
+    await hass.async_block_till_done()
+    restored = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dishes"]
+    assert restored is not chore
+    state = hass.states.get("sensor.dishes")
+    assert {key: state.attributes[key] for key in overrides} == overrides
+    assert _due_dates(restored, until=day(22)) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "iso", "parsed"),
+    [
+        ("2024-03-04", True, datetime(2024, 3, 4)),
+        ("2024-03-04T19:30:00", True, datetime(2024, 3, 4, 19, 30)),
+        ("Mar 4 2024 7:30 PM", False, datetime(2024, 3, 4, 19, 30)),
+        ("04 March 2024 19:30", False, datetime(2024, 3, 4, 19, 30)),
+    ],
+)
+def test_parse_datetime(text: str, iso: bool, parsed: datetime) -> None:
+    """ISO texts skip dateutil, which still parses older formats."""
+    with patch.object(helpers, "parse", side_effect=helpers.parse) as parse:
+        assert helpers.parse_datetime(text) == parsed
+    assert parse.called is not iso
+
+
+@pytest.mark.parametrize(
+    "last_completed", ["2024-03-04T19:30:00+01:00", "Mar 4 2024 7:30 PM +01:00"]
+)
+async def test_restore_dates(
+    hass: HomeAssistant, freezer: Any, last_completed: str
+) -> None:
+    """Dates are restored from ISO states, and from older formats."""
+    freezer.move_to(datetime(2024, 3, 5, 12, tzinfo=dt_util.DEFAULT_TIME_ZONE))
+    mock_restore_cache(
+        hass,
+        [
+            State(
+                "sensor.dishes",
+                "2",
+                {
+                    const.ATTR_NEXT_DATE: "2024-03-07",
+                    const.ATTR_LAST_COMPLETED: last_completed,
+                },
+            )
+        ],
+    )
+    await async_setup_chores(
+        hass,
+        chore_entry(
+            "dishes", frequency="after-n-days", period=3, start_date="2024-01-01"
+        ),
+    )
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dishes"]
+    assert chore.last_completed == dt_util.as_local(
+        datetime(2024, 3, 4, 18, 30, tzinfo=dt_util.UTC)
+    )
+    # The next due date is calculated from the restored completion
+    assert chore.next_due_date == date(2024, 3, 7)
@@ -0,0 +1,80 @@
+"""Tests for the schedule derivation trace."""
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.chore_helper.tracing import ChoreTrace
+
+from .common import async_setup_chores, chore_entry
+
+
+async def _async_trace(hass: HomeAssistant, enabled: bool = True) -> None:
+    """Enable or disable tracing of sensor.dishes through the service."""
+    await hass.services.async_call(
+        const.DOMAIN,
+        "trace",
+        {"entity_id": "sensor.dishes", const.CONF_ENABLED: enabled},
+        blocking=True,
+    )
+
+
+async def test_trace_service(hass: HomeAssistant, freezer: Any) -> None:
+    """The trace records each step deriving the schedule, and the next date."""
+    now = datetime.combine(date(2024, 3, 5), time(12), dt_util.DEFAULT_TIME_ZONE)
+    freezer.move_to(now)
+    entry = chore_entry(
+        "dishes",
+        frequency="every-n-days",
+        period=7,
+        start_date="2024-03-05",
+        forecast_dates=3,
+    )
+    await async_setup_chores(hass, entry)
+    await hass.services.async_call(
+        const.DOMAIN,
+        "remove_date",
+        {"entity_id": "sensor.dishes", "date": "2024-03-12"},
+        blocking=True,
+    )
+    chore = hass.data[const.DOMAIN][const.SENSOR_PLATFORM]["sensor.dishes"]
+    assert chore.trace is None
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["trace"] is None
+
+    await _async_trace(hass)
+    records = chore.trace.as_list()
+    assert {record["time"] for record in records} == {now.isoformat()}
+    steps = [
+        {key: value for key, value in record.items() if key != "time"}
+        for record in records
+    ]
+    assert steps[0] == {
+        "event": "start",
+        "start_date": "2024-03-05",
+        "forecast_dates": 3,
+    }
+    assert {"event": "candidate", "date": "2024-03-12"} in steps
+    assert {"event": "removed", "date": "2024-03-12"} in steps
+    assert steps[-1]["event"] == "next_due_date"
+    assert steps[-1]["date"] == "2024-03-05"
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["trace"] == records
+
+    await _async_trace(hass, enabled=False)
+    assert chore.trace is None
+
+
+async def test_trace_keeps_latest_records() -> None:
+    """Once full, the trace drops its oldest records."""
+    trace = ChoreTrace(size=3)
+    for index in range(5):
+        trace.record("candidate", index=index)
+    assert [record["index"] for record in trace.as_list()] == [2, 3, 4]